@@ -121,8 +121,10 @@ def get_mcp_server_definitions(settings: Settings) -> dict[str, MCPServerDefinit
             tools=[
                 "upload_charitable_receipt_to_drive",
                 "append_charitable_donation_to_ledger",
+                "append_charitable_donations_batch",
                 "check_charitable_duplicates",
                 "get_charitable_summary",
+                "get_charitable_summary_batch",
                 "read_charitable_ledger_entries",
             ],
             source="builtin",
@@ -0,0 +1,450 @@
+"""Tests for charitable donation ledger tools."""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime
+
+import pytest
+
+from vivian_mcp.tools import charitable_tools
+from vivian_mcp.tools.charitable_tools import CharitableToolManager
+
+
+LEDGER_HEADERS = list(CharitableToolManager.EXPECTED_HEADERS)
+LEDGER_ROWS = [
+    ["a1", "Food Bank", "2025-01-10", "50", "Yes", "", "f1", "2025", "0.9", ""],
+    ["a2", "Food Bank", "2024-12-20", "25", "Yes", "", "f2", "2024", "0.9", ""],
+    ["a3", "Animal Shelter", "2025-03-02", "40", "No", "", "f3", "2025", "0.9", ""],
+]
+
+
+def _stub_ledger(monkeypatch, tools: CharitableToolManager, rows: list[list[str]]) -> None:
+    """Serve the given ledger rows from both the row and column readers."""
+
+    async def fake_get_all_rows(spreadsheet_id, worksheet_name):
+        return {"success": True, "headers": LEDGER_HEADERS, "rows": [list(row) for row in rows]}
+
+    async def fake_get_all_columns(spreadsheet_id, worksheet_name):
+        columns = [[row[idx] for row in rows] for idx in range(len(LEDGER_HEADERS))]
+        return {"success": True, "headers": LEDGER_HEADERS, "columns": columns}
+
+    monkeypatch.setattr(tools, "get_all_rows", fake_get_all_rows)
+    monkeypatch.setattr(tools, "get_all_columns", fake_get_all_columns)
+
+
+@pytest.fixture
+def manager(monkeypatch) -> CharitableToolManager:
+    tools = CharitableToolManager()
+    _stub_ledger(monkeypatch, tools, LEDGER_ROWS)
+    return tools
+
+
+@pytest.mark.asyncio
+async def test_get_donation_summary_filters_by_tax_year(manager):
+    result = await manager.get_donation_summary(tax_year=2025)
+
+    assert result["success"] is True
+    assert result["tax_year"] == "2025"
+    assert result["total"] == 90.0
+    assert result["tax_deductible_total"] == 50.0
+    assert result["by_organization"] == {
+        "Food Bank": {"total": 50.0, "count": 1},
+        "Animal Shelter": {"total": 40.0, "count": 1},
+    }
+    assert result["by_year"] == {"2025": {"total": 90.0, "count": 2}}
+
+
+@pytest.mark.asyncio
+async def test_read_donation_entries_summarizes_matching_entries(manager):
+    result = await manager.read_donation_entries(organization="food")
+
+    assert result["success"] is True
+    assert [entry["id"] for entry in result["entries"]] == ["a1", "a2"]
+    assert set(result) == {"success", "tax_year", "entries", "summary"}
+    summary = result["summary"]
+    assert summary["total_entries"] == 2
+    assert summary["total_amount"] == 75.0
+    assert summary["tax_deductible_total"] == 75.0
+    assert summary["non_deductible_total"] == 0.0
+    assert summary["count_tax_deductible"] == 2
+    assert summary["count_non_deductible"] == 0
+    assert summary["by_year"] == {
+        "2025": {"total": 50.0, "count": 1},
+        "2024": {"total": 25.0, "count": 1},
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_donation_summary_parses_formatted_amounts(monkeypatch):
+    tools = CharitableToolManager()
+    _stub_ledger(
+        monkeypatch,
+        tools,
+        [
+            ["b1", "Library", "2025-02-01", "$1,200.50", "Yes", "", "", "2025", "0.9", ""],
+            ["b2", "Library", "2025-02-02", "n/a", "Yes", "", "", "2025", "0.9", ""],
+        ],
+    )
+
+    result = await tools.get_donation_summary()
+
+    assert result["total"] == 1200.5
+    assert result["by_organization"] == {"Library": {"total": 1200.5, "count": 1}}
+
+
+@pytest.mark.asyncio
+async def test_get_donation_summary_batch_reads_ledger_once(monkeypatch):
+    tools = CharitableToolManager()
+    _stub_ledger(monkeypatch, tools, LEDGER_ROWS)
+    reads = 0
+    fake_get_all_columns = tools.get_all_columns
+
+    async def counting_get_all_columns(spreadsheet_id, worksheet_name):
+        nonlocal reads
+        reads += 1
+        return await fake_get_all_columns(spreadsheet_id, worksheet_name)
+
+    monkeypatch.setattr(tools, "get_all_columns", counting_get_all_columns)
+
+    result = await tools.get_donation_summary_batch(["2024", 2025])
+
+    assert reads == 1
+    assert result["success"] is True
+    assert [summary["tax_year"] for summary in result["summaries"]] == ["2024", "2025"]
+    assert [summary["total"] for summary in result["summaries"]] == [25.0, 90.0]
+
+
+@pytest.mark.parametrize(
+    ("donation_date", "expected"),
+    [
+        ("2024-12-31", "2024"),
+        (" 03/15/2023 ", "2023"),
+        ("Jan 5, 2022", "2022"),
+        ("2021-11-30T18:45:00", "2021"),
+        ("5 January 2020", "2020"),
+        ("Mar 4, 2025", "2025"),
+        ("Invoice 2019 paid 03/04/2025", "2025"),
+    ],
+)
+def test_get_tax_year_parses_supported_formats(donation_date, expected):
+    assert CharitableToolManager()._get_tax_year(donation_date) == expected
+
+
+@pytest.mark.parametrize(
+    ("cell", "expected"),
+    [
+        ("50", 50.0),
+        ("-12.5", -12.5),
+        (" $1,200.50 ", 1200.5),
+        (25, 25.0),
+        ("1e3", 1000.0),
+        ("", None),
+        ("n/a", None),
+        (None, None),
+    ],
+)
+def test_to_float_parses_ledger_amount_cells(cell, expected):
+    assert charitable_tools._to_float(cell) == expected
+
+
+def test_get_tax_year_falls_back_to_current_year():
+    assert CharitableToolManager()._get_tax_year("not a date") == str(datetime.now().year)
+
+
+@pytest.mark.asyncio
+async def test_check_for_duplicates_matches_org_amount_and_nearby_date(manager):
+    result = await manager.check_for_duplicates(
+        {"organization_name": " food bank ", "donation_date": "2025-01-12", "amount": 50}
+    )
+
+    assert result["is_duplicate"] is True
+    assert result["recommendation"] == "review"
+    assert result["potential_duplicates"] == [
+        {
+            "organization": "Food Bank",
+            "date": "2025-01-10",
+            "amount": 50.0,
+            "match_type": "fuzzy_date",
+            "days_difference": 2,
+        }
+    ]
+
+
+@pytest.mark.asyncio
+async def test_append_donation_reuses_ledger_read_for_duplicate_check(monkeypatch, manager):
+    monkeypatch.setattr(manager, "_resolve_spreadsheet", lambda: ("sheet-id", "Charitable Donations"))
+    reads = 0
+    appended: list[list] = []
+    fake_get_all_rows = manager.get_all_rows
+
+    async def counting_get_all_rows(spreadsheet_id, worksheet_name):
+        nonlocal reads
+        reads += 1
+        return await fake_get_all_rows(spreadsheet_id, worksheet_name)
+
+    async def fail_ensure(**kwargs):
+        raise AssertionError("existing worksheet should not be re-checked")
+
+    async def fake_append_row(spreadsheet_id, worksheet_name, row_data):
+        appended.append(row_data)
+        return {"success": True, "row_index": "A5"}
+
+    monkeypatch.setattr(manager, "get_all_rows", counting_get_all_rows)
+    monkeypatch.setattr(manager, "ensure_worksheet_exists", fail_ensure)
+    monkeypatch.setattr(manager, "append_row", fake_append_row)
+
+    result = await manager.append_donation_to_ledger(
+        {"organization_name": "Library", "donation_date": "2025-04-01", "amount": 10},
+        drive_file_id="f9",
+    )
+
+    assert result["success"] is True
+    assert result["tax_year"] == "2025"
+    assert reads == 1
+    assert appended[0][1:5] == ["Library", "2025-04-01", 10, "Yes"]
+
+
+@pytest.mark.asyncio
+async def test_append_donations_batch_reads_and_appends_once(monkeypatch, manager):
+    monkeypatch.setattr(manager, "_resolve_spreadsheet", lambda: ("sheet-id", "Charitable Donations"))
+    appends: list[list[list]] = []
+
+    async def fake_append_rows(spreadsheet_id, worksheet_name, rows_data):
+        appends.append(rows_data)
+        return {"success": True, "row_index": "A5:J6"}
+
+    monkeypatch.setattr(manager, "append_rows", fake_append_rows)
+
+    result = await manager.append_donations_batch(
+        [
+            {"donation_json": {"organization_name": "Library", "donation_date": "2025-04-01", "amount": 10}, "drive_file_id": "f9"},
+            {"donation_json": {"organization_name": "Food Bank", "donation_date": "2025-01-10", "amount": 50}, "drive_file_id": "f10"},
+            {"donation_json": {"organization_name": "Museum", "donation_date": "2025-05-01", "amount": 15}, "drive_file_id": "f11"},
+            {"donation_json": {"organization_name": "Library", "donation_date": "2025-04-02", "amount": 10}, "drive_file_id": "f12"},
+        ]
+    )
+
+    assert result["imported_count"] == 2
+    assert result["failed_count"] == 2
+    assert result["total_amount"] == 25.0
+    statuses = {r["drive_file_id"]: r["status"] for r in result["results"]}
+    assert statuses == {"f9": "imported", "f10": "duplicate", "f11": "imported", "f12": "duplicate"}
+    assert len(appends) == 1
+    assert [row[6] for row in appends[0]] == ["f9", "f11"]
+    assert appends[0][0][-1] == appends[0][1][-1]
+
+
+@pytest.mark.asyncio
+async def test_check_for_duplicates_reuses_index_while_sheet_version_unchanged(monkeypatch, manager):
+    monkeypatch.setattr(manager, "_resolve_spreadsheet", lambda: ("sheet-id", "Charitable Donations"))
+    manager._rows_cache[("sheet-id", "Charitable Donations")] = ("7", LEDGER_HEADERS, LEDGER_ROWS, 0.0)
+    builds = 0
+    original_from_rows = charitable_tools._DuplicateIndex.from_rows
+
+    def counting_from_rows(headers, rows):
+        nonlocal builds
+        builds += 1
+        return original_from_rows(headers, rows)
+
+    monkeypatch.setattr(charitable_tools._DuplicateIndex, "from_rows", counting_from_rows)
+    donation = {"organization_name": "Animal Shelter", "donation_date": "2025-03-02", "amount": 40}
+
+    first = await manager.check_for_duplicates(donation)
+    second = await manager.check_for_duplicates(donation)
+
+    assert first["is_duplicate"] is second["is_duplicate"] is True
+    assert builds == 1
+
+
+@pytest.mark.asyncio
+async def test_read_donation_entries_derives_missing_tax_year_from_date(monkeypatch):
+    tools = CharitableToolManager()
+    _stub_ledger(
+        monkeypatch,
+        tools,
+        [
+            ["c1", "Library", "2023-06-01", "20", "Yes", "", "", "", "0.9", ""],
+            ["c2", "Library", "2024-06-01", "30", "Yes", "", "", "2024", "0.9", ""],
+        ],
+    )
+
+    result = await tools.read_donation_entries(tax_year="2023")
+
+    assert [entry["id"] for entry in result["entries"]] == ["c1"]
+    assert result["entries"][0]["tax_year"] == "2023"
+
+
+@pytest.mark.asyncio
+async def test_append_donations_batch_splits_appends_by_max_batch(monkeypatch, manager):
+    monkeypatch.setattr(manager, "_resolve_spreadsheet", lambda: ("sheet-id", "Charitable Donations"))
+    appends: list[list[list]] = []
+
+    async def fake_append_rows(spreadsheet_id, worksheet_name, rows_data):
+        appends.append(rows_data)
+        return {"success": True, "row_index": ""}
+
+    monkeypatch.setattr(manager, "append_rows", fake_append_rows)
+    donations = [
+        {"donation_json": {"organization_name": f"Org {i}", "donation_date": "2025-06-01", "amount": i + 1}, "drive_file_id": f"d{i}"}
+        for i in range(5)
+    ]
+
+    result = await manager.append_donations_batch(donations, max_batch=2)
+
+    assert result["imported_count"] == 5
+    assert [len(rows) for rows in appends] == [2, 2, 1]
+
+
+def test_duplicate_index_skips_walk_when_no_amount_within_a_cent(monkeypatch):
+    index = charitable_tools._DuplicateIndex.from_rows(LEDGER_HEADERS, LEDGER_ROWS)
+
+    def fail_days_between(*args):
+        raise AssertionError("entries should not be compared")
+
+    monkeypatch.setattr(charitable_tools, "days_between", fail_days_between)
+
+    assert index.find({"organization_name": "Food Bank", "donation_date": "2025-01-11", "amount": 49.98}, 3) == []
+    monkeypatch.undo()
+    matches = index.find({"organization_name": "Food Bank", "donation_date": "2025-01-11", "amount": 50.005}, 3)
+    assert [match["date"] for match in matches] == ["2025-01-10"]
+
+
+@pytest.mark.asyncio
+async def test_get_donation_summary_ands_tax_year_with_column_filters(monkeypatch):
+    tools = CharitableToolManager()
+    _stub_ledger(monkeypatch, tools, LEDGER_ROWS)
+
+    result = await tools.get_donation_summary(
+        tax_year="2025",
+        column_filters=[{"column": "tax_year", "operator": "in", "value": ["2024", "2025"]}],
+    )
+    empty = await tools.get_donation_summary(
+        tax_year="2025",
+        column_filters=[{"column": "organization_name", "value": "Museum"}],
+    )
+
+    assert result["total"] == 90.0
+    assert set(empty) == set(result)
+    assert empty["tax_year"] == "2025"
+    assert empty["total"] == 0
+
+
+@pytest.mark.asyncio
+async def test_get_donation_summary_reports_ledger_format_without_tax_year_column(monkeypatch):
+    tools = CharitableToolManager()
+
+    async def fake_get_all_columns(spreadsheet_id, worksheet_name):
+        return {"success": True, "headers": ["organization_name", "amount"], "columns": [["Library"], ["10"]]}
+
+    monkeypatch.setattr(tools, "get_all_columns", fake_get_all_columns)
+
+    result = await tools.get_donation_summary(tax_year="2025")
+
+    assert result == {"success": False, "error": "Ledger headers don't match expected format"}
+
+
+@pytest.mark.asyncio
+async def test_append_donations_batch_rereads_ledger_when_first_read_fails(monkeypatch, manager):
+    monkeypatch.setattr(manager, "_resolve_spreadsheet", lambda: ("sheet-id", "Charitable Donations"))
+    reads = 0
+
+    async def flaky_get_all_rows(spreadsheet_id, worksheet_name):
+        nonlocal reads
+        reads += 1
+        if reads == 1:
+            return {"success": False, "error": "timeout"}
+        return {"success": True, "headers": LEDGER_HEADERS, "rows": [list(row) for row in LEDGER_ROWS]}
+
+    async def fake_ensure(**kwargs):
+        return {"success": True, "worksheet_exists": True}
+
+    async def fake_append_rows(spreadsheet_id, worksheet_name, rows_data):
+        return {"success": True, "row_index": ""}
+
+    monkeypatch.setattr(manager, "get_all_rows", flaky_get_all_rows)
+    monkeypatch.setattr(manager, "ensure_worksheet_exists", fake_ensure)
+    monkeypatch.setattr(manager, "append_rows", fake_append_rows)
+
+    result = await manager.append_donations_batch(
+        [{"donation_json": {"organization_name": "Food Bank", "donation_date": "2025-01-10", "amount": 50}, "drive_file_id": "f1"}]
+    )
+
+    assert reads == 2
+    assert result["results"][0]["status"] == "duplicate"
+
+
+@pytest.mark.asyncio
+async def test_append_donations_batch_fails_only_items_with_unparseable_amounts(monkeypatch, manager):
+    monkeypatch.setattr(manager, "_resolve_spreadsheet", lambda: ("sheet-id", "Charitable Donations"))
+    appends: list[list[list]] = []
+
+    async def fake_append_rows(spreadsheet_id, worksheet_name, rows_data):
+        appends.append(rows_data)
+        return {"success": True, "row_index": ""}
+
+    monkeypatch.setattr(manager, "append_rows", fake_append_rows)
+
+    result = await manager.append_donations_batch(
+        [
+            {"donation_json": {"organization_name": "Museum", "donation_date": "2025-05-01", "amount": "$25"}, "drive_file_id": "f1"},
+            {"donation_json": {"organization_name": "Museum", "donation_date": "2025-05-02", "amount": "lots"}, "drive_file_id": "f2"},
+        ]
+    )
+
+    statuses = {r["drive_file_id"]: r["status"] for r in result["results"]}
+    assert statuses == {"f1": "imported", "f2": "failed"}
+    assert result["total_amount"] == 25.0
+    assert [row[6] for row in appends[0]] == ["f1"]
+
+
+@pytest.mark.asyncio
+async def test_append_donation_extends_cached_duplicate_index(monkeypatch):
+    tools = CharitableToolManager()
+    cache_key = ("sheet-id", "Charitable Donations")
+    monkeypatch.setattr(tools, "_resolve_spreadsheet", lambda: cache_key)
+    tools._rows_cache[cache_key] = ("7", LEDGER_HEADERS, [list(row) for row in LEDGER_ROWS], time.monotonic())
+    builds = 0
+    original_from_rows = charitable_tools._DuplicateIndex.from_rows
+
+    def counting_from_rows(headers, rows):
+        nonlocal builds
+        builds += 1
+        return original_from_rows(headers, rows)
+
+    async def fake_append_row(spreadsheet_id, worksheet_name, row_data):
+        tools._extend_rows_cache(spreadsheet_id, worksheet_name, [[str(value) for value in row_data]], 1)
+        return {"success": True, "row_index": ""}
+
+    monkeypatch.setattr(charitable_tools._DuplicateIndex, "from_rows", counting_from_rows)
+    monkeypatch.setattr(tools, "append_row", fake_append_row)
+    donation = {"organization_name": "Library", "donation_date": "2025-04-01", "amount": 10}
+
+    first = await tools.append_donation_to_ledger(donation, drive_file_id="f1")
+    second = await tools.append_donation_to_ledger(donation, drive_file_id="f2")
+
+    assert first["success"] is True
+    assert second["error"] == "Duplicate donation detected"
+    assert builds == 1
+
+
+@pytest.mark.asyncio
+async def test_get_donation_summary_batch_reports_invalid_filters_once(manager):
+    result = await manager.get_donation_summary_batch(
+        ["2024", "2025"],
+        column_filters=[{"column": "nope", "value": "x"}],
+    )
+
+    assert result["success"] is False
+    assert result["error"] == "Unknown column 'nope'"
+    assert "summaries" not in result
+
+
+@pytest.mark.asyncio
+async def test_get_donation_summary_batch_applies_filters_to_every_year(manager):
+    result = await manager.get_donation_summary_batch(
+        ["2024", "2025"],
+        column_filters=[{"column": "organization_name", "value": "Food Bank"}],
+    )
+
+    assert [summary["total"] for summary in result["summaries"]] == [25.0, 50.0]
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from vivian_mcp.tools.google_common import apply_column_filters
+import pytest
+
+from vivian_mcp.tools import google_common
+from vivian_mcp.tools.google_common import apply_column_filters, apply_column_filters_to_columns
 
 
 def test_apply_column_filters_combines_multiple_filters():
@@ -36,3 +39,114 @@ def test_apply_column_filters_validates_unknown_columns():
     assert result["success"] is False
     assert "Unknown column" in result["error"]
     assert result["available_columns"] == ["amount", "provider"]
+
+
+def test_apply_column_filters_to_columns_keeps_columns_aligned():
+    headers = ["provider", "amount", "status"]
+    columns = [
+        ["Clinic A", "Clinic B", "Clinic C"],
+        ["40", "80", "120"],
+        ["unreimbursed", "reimbursed", "unreimbursed"],
+    ]
+
+    result = apply_column_filters_to_columns(
+        headers=headers,
+        columns=columns,
+        column_filters=[
+            {"column": "status", "operator": "equals", "value": "unreimbursed"},
+            {"column": "amount", "operator": "gte", "value": 100},
+        ],
+    )
+
+    assert result["success"] is True
+    assert result["columns"] == [["Clinic C"], ["120"], ["unreimbursed"]]
+
+
+@pytest.mark.parametrize(
+    ("column_filter", "expected_providers"),
+    [
+        ({"column": "provider", "operator": "in", "value": ["clinic a", "LAB"]}, ["Clinic A", "Lab"]),
+        ({"column": "provider", "operator": "in", "value": "Lab"}, []),
+        ({"column": "provider", "operator": "contains", "value": "LIN"}, ["Clinic A", "Clinic B"]),
+        ({"column": "provider", "operator": "contains", "value": "LIN", "case_sensitive": True}, []),
+        ({"column": "provider", "operator": "not_equals", "value": "lab"}, ["Clinic A", "Clinic B"]),
+        ({"column": "provider", "operator": "ends_with", "value": "b"}, ["Clinic B", "Lab"]),
+        ({"column": "amount", "operator": "<", "value": "80"}, ["Clinic A"]),
+        ({"column": "amount", "operator": "gt", "value": "n/a"}, []),
+    ],
+)
+def test_apply_column_filters_operators(column_filter, expected_providers):
+    rows = [["Clinic A", "40"], ["Clinic B", "80"], ["Lab", "pending"]]
+
+    result = apply_column_filters(headers=["provider", "amount"], rows=rows, column_filters=[column_filter])
+
+    assert [row[0] for row in result["rows"]] == expected_providers
+
+
+def test_apply_column_filters_to_columns_evaluates_repeated_values_once(monkeypatch):
+    calls: list[str] = []
+    compile_predicate = google_common._compile_predicate
+
+    def counting_compile(operator, expected_value, case_sensitive):
+        predicate = compile_predicate(operator, expected_value, case_sensitive)
+        return lambda cell: calls.append(cell) or predicate(cell)
+
+    monkeypatch.setattr(google_common, "_compile_predicate", counting_compile)
+    statuses = ["Yes", "No", "yes"] * 4
+
+    result = apply_column_filters_to_columns(
+        headers=["id", "tax_deductible"],
+        columns=[[str(i) for i in range(12)], statuses],
+        column_filters=[{"column": "tax_deductible", "value": "YES"}],
+    )
+
+    assert sorted(calls) == ["No", "Yes", "yes"]
+    assert result["columns"][0] == ["0", "2", "3", "5", "6", "8", "9", "11"]
+
+
+def test_apply_column_filters_runs_cheap_filters_first(monkeypatch):
+    calls: list[str] = []
+    compile_predicate = google_common._compile_predicate
+
+    def recording_compile(operator, expected_value, case_sensitive):
+        predicate = compile_predicate(operator, expected_value, case_sensitive)
+        return lambda cell: calls.append(operator) or predicate(cell)
+
+    monkeypatch.setattr(google_common, "_compile_predicate", recording_compile)
+
+    result = apply_column_filters(
+        headers=["provider", "status"],
+        rows=[["City Clinic", "reimbursed"], ["City Pharmacy", "unreimbursed"]],
+        column_filters=[
+            {"column": "provider", "operator": "contains", "value": "city"},
+            {"column": "status", "operator": "equals", "value": "unreimbursed"},
+        ],
+    )
+
+    assert [row[0] for row in result["rows"]] == ["City Pharmacy"]
+    assert calls == ["equals", "equals", "contains"]
+
+
+def test_apply_column_filters_reuses_header_index_across_calls():
+    google_common._build_header_index.cache_clear()
+    headers = ["Provider", " Status "]
+    column_filters = [{"column": "status", "value": "open"}]
+
+    for rows in ([["a", "open"]], [["b", "closed"]], [["c", "open"]]):
+        apply_column_filters(headers=headers, rows=rows, column_filters=column_filters)
+
+    info = google_common._build_header_index.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+
+
+def test_matching_indices_only_considers_surviving_rows():
+    calls: list[str] = []
+
+    def predicate(cell):
+        calls.append(cell)
+        return cell == "a"
+
+    column = ["a", "b", "c", "d", "a", "b", "a", "e"]
+
+    assert google_common._matching_indices(predicate, column, [0, 4, 6, 7]) == [0, 4, 6]
+    assert sorted(calls) == ["a", "e"]
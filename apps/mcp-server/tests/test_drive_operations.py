@@ -0,0 +1,333 @@
+"""Tests for shared Drive operations."""
+
+from __future__ import annotations
+
+import asyncio
+import re
+
+import httplib2
+import googleapiclient.http
+import pytest
+from googleapiclient.errors import HttpError
+
+from vivian_mcp.tools import google_common
+from vivian_mcp.tools.google_common import DriveOperationsMixin, GoogleServiceMixin
+
+
+class _Manager(GoogleServiceMixin, DriveOperationsMixin):
+    def __init__(self):
+        super().__init__(settings=None)
+
+
+@pytest.mark.asyncio
+async def test_bulk_upload_files_bounds_concurrency_and_retries_rate_limits(monkeypatch):
+    manager = _Manager()
+    active = 0
+    peak = 0
+    attempts: dict[str, int] = {}
+    sleeps: list[int] = []
+    real_sleep = asyncio.sleep
+
+    async def fake_upload_file(local_file_path, folder_id):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await real_sleep(0)
+        active -= 1
+        attempts[local_file_path] = attempts.get(local_file_path, 0) + 1
+        if local_file_path == "busy.pdf" and attempts[local_file_path] < 3:
+            return {
+                "success": False,
+                "error": "HttpError 403: Rate limit exceeded. (userRateLimitExceeded)",
+                "status": 403,
+                "reasons": ["userRateLimitExceeded"],
+            }
+        if local_file_path == "bad.pdf":
+            return {"success": False, "error": "File not found: bad.pdf"}
+        return {"success": True, "file_id": local_file_path}
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(manager, "upload_file", fake_upload_file)
+    monkeypatch.setattr(google_common.asyncio, "sleep", fake_sleep)
+    paths = ["a.pdf", "busy.pdf", "bad.pdf", "b.pdf", "c.pdf"]
+
+    results = await manager.bulk_upload_files(
+        [{"local_file_path": path, "folder_id": "f"} for path in paths],
+        max_concurrency=2,
+    )
+
+    assert [result["success"] for result in results] == [True, True, False, True, True]
+    assert attempts == {"a.pdf": 1, "busy.pdf": 3, "bad.pdf": 1, "b.pdf": 1, "c.pdf": 1}
+    assert sleeps == [1, 2]
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_upload_file_picks_upload_mode_by_size(monkeypatch, tmp_path):
+    uploads: list[dict] = []
+    streams = []
+
+    def fake_media_io(stream, **kwargs):
+        streams.append(stream)
+        uploads.append(kwargs)
+
+    monkeypatch.setattr(googleapiclient.http, "MediaFileUpload", lambda path, **kwargs: uploads.append(kwargs))
+    monkeypatch.setattr(googleapiclient.http, "MediaIoBaseUpload", fake_media_io)
+    monkeypatch.setattr(google_common, "SIMPLE_UPLOAD_MAX_BYTES", 8)
+
+    sent: list[str] = []
+
+    class _Request:
+        def __init__(self, body):
+            self.body = body
+            self.chunks_left = 2
+
+        def execute(self):
+            sent.append("execute")
+            return {"id": "x", "name": self.body["name"]}
+
+        def next_chunk(self, http=None, num_retries=0):
+            sent.append(f"chunk retries={num_retries}")
+            self.chunks_left -= 1
+            return (None, None) if self.chunks_left else (None, {"id": "x", "name": self.body["name"]})
+
+    class _Files:
+        def create(self, body, media_body, fields):
+            return _Request(body)
+
+    service = type("_Drive", (), {"files": lambda self: _Files()})()
+    small = tmp_path / "receipt.jpg"
+    small.write_bytes(b"jpg")
+    large = tmp_path / "statement.pdf"
+    large.write_bytes(b"%PDF-1.7 statement")
+
+    for path in (small, large):
+        result = await _Manager().upload_file(str(path), "folder", service=service)
+        assert result["success"] is True
+
+    assert uploads == [
+        {"mimetype": "image/jpeg", "resumable": False},
+        {"mimetype": "application/pdf", "chunksize": google_common.UPLOAD_CHUNK_BYTES, "resumable": True},
+    ]
+    assert [stream.closed for stream in streams] == [True]
+    assert sent == ["execute", "chunk retries=3", "chunk retries=3"]
+
+
+def test_credentials_are_shared_across_instances(monkeypatch):
+    monkeypatch.setattr(google_common, "_creds_cache", {})
+    settings = type(
+        "_Settings",
+        (),
+        {"google_client_id": "client", "google_client_secret": "secret", "google_refresh_token": "token"},
+    )()
+
+    first = GoogleServiceMixin(settings)._get_credentials()
+    second = GoogleServiceMixin(settings)._get_credentials()
+    settings.google_refresh_token = "rotated"
+    third = GoogleServiceMixin(settings)._get_credentials()
+
+    assert first is second
+    assert third is not first
+    assert third.refresh_token == "rotated"
+
+
+def test_services_are_shared_across_instances(monkeypatch):
+    builds: list[str] = []
+
+    def fake_build_service(api, version, credentials):
+        builds.append(api)
+        return object()
+
+    monkeypatch.setattr(google_common, "_creds_cache", {})
+    monkeypatch.setattr(google_common, "build_service", fake_build_service)
+    google_common.shared_service.cache_clear()
+    settings = type(
+        "_Settings",
+        (),
+        {"google_client_id": "client", "google_client_secret": "secret", "google_refresh_token": "token"},
+    )()
+
+    first = GoogleServiceMixin(settings)
+    second = GoogleServiceMixin(settings)
+
+    assert first._get_drive_service() is second._get_drive_service()
+    assert first._get_sheets_service() is second._get_sheets_service()
+    assert builds == ["drive", "sheets"]
+    google_common.shared_service.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_execute_reuses_one_http_client_per_thread():
+    from google.oauth2.credentials import Credentials
+
+    credentials = Credentials(token="token")
+    seen: list[object] = []
+
+    class _Request:
+        http = type("_Http", (), {"credentials": credentials})()
+
+        def execute(self, http=None):
+            seen.append(http)
+            return {}
+
+    GoogleServiceMixin._execute(_Request())
+    GoogleServiceMixin._execute(_Request())
+    await asyncio.to_thread(GoogleServiceMixin._execute, _Request())
+
+    assert seen[0] is seen[1]
+    assert seen[2] is not seen[0]
+    assert seen[0].credentials is credentials
+
+
+def test_built_services_request_gzip_responses():
+    from google.oauth2.credentials import Credentials
+
+    credentials = Credentials(token="token")
+    sheets = google_common.build_service("sheets", "v4", credentials)
+    drive = google_common.build_service("drive", "v3", credentials)
+
+    for request in (
+        sheets.spreadsheets().values().get(spreadsheetId="sheet-id", range="'Ledger'"),
+        drive.files().list(q="trashed=false", fields="files(id)"),
+    ):
+        assert request.headers["accept-encoding"] == "gzip, deflate"
+        # Google only compresses responses for user agents that mention gzip
+        assert "(gzip)" in request.headers["user-agent"]
+
+
+def test_timestamped_filename_keeps_extension_and_adds_unique_suffix():
+    name = google_common.timestamped_filename("scans/receipt.final.pdf")
+
+    assert re.fullmatch(r"receipt\.final_\d{8}_\d{6}_[0-9a-f]{4}\.pdf", name)
+
+
+class _FlakyRequest:
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.calls = 0
+
+    def execute(self):
+        self.calls += 1
+        if self.statuses:
+            raise HttpError(httplib2.Response({"status": self.statuses.pop(0)}), b"")
+        return {"id": "ok"}
+
+
+@pytest.mark.asyncio
+async def test_aexecute_retries_transient_errors(monkeypatch):
+    monkeypatch.setattr(google_common.random, "random", lambda: 0.0)
+    manager = _Manager()
+
+    read = _FlakyRequest([503, 429])
+    assert await manager._aexecute(read) == {"id": "ok"}
+    assert read.calls == 3
+
+    write = _FlakyRequest([429, 500])
+    with pytest.raises(HttpError):
+        await manager._aexecute(write, idempotent=False)
+    assert write.calls == 2
+
+    missing = _FlakyRequest([404])
+    with pytest.raises(HttpError):
+        await manager._aexecute(missing)
+    assert missing.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_folder_lists_parent_once_and_remembers_ids():
+    queries: list[dict] = []
+    created: list[dict] = []
+    pages = {
+        None: {"files": [{"id": "f-2024", "name": "2024"}], "nextPageToken": "p2"},
+        "p2": {"files": [{"id": "f-obrien", "name": "O'Brien"}]},
+    }
+
+    class _Files:
+        def list(self, **kwargs):
+            queries.append(kwargs)
+            return type("_Request", (), {"execute": lambda self: pages[kwargs["pageToken"]]})()
+
+        def create(self, body, fields):
+            created.append(body)
+            return type("_Request", (), {"execute": lambda self: {"id": "f-new", "name": body["name"]}})()
+
+    manager = _Manager()
+    manager._drive_service = type("_Drive", (), {"files": lambda self: _Files()})()
+    parent = "parent's"
+
+    first = await manager.get_or_create_folder("O'Brien", parent)
+    second = await manager.get_or_create_folder("2024", parent)
+    assert first == {"success": True, "folder_id": "f-obrien", "name": "O'Brien", "created": False}
+    assert second["folder_id"] == "f-2024"
+    assert len(queries) == 2
+    assert "'parent\\'s' in parents" in queries[0]["q"]
+
+    third = await manager.get_or_create_folder("2025", parent)
+    again = await manager.get_or_create_folder("2025", parent)
+    assert third == {"success": True, "folder_id": "f-new", "name": "2025", "created": True}
+    assert again["folder_id"] == "f-new" and again["created"] is False
+    assert len(queries) == 4
+    assert created == [{"name": "2025", "mimeType": "application/vnd.google-apps.folder", "parents": [parent]}]
+
+
+@pytest.mark.asyncio
+async def test_move_file_skips_parent_lookup_when_source_folder_known():
+    calls: list[tuple[str, dict]] = []
+
+    class _Files:
+        def get(self, **kwargs):
+            calls.append(("get", kwargs))
+            return type("_Request", (), {"execute": lambda self: {"parents": ["old-a", "old-b"]}})()
+
+        def update(self, **kwargs):
+            calls.append(("update", kwargs))
+            return type("_Request", (), {"execute": lambda self: {"id": kwargs["fileId"]}})()
+
+    manager = _Manager()
+    manager._drive_service = type("_Drive", (), {"files": lambda self: _Files()})()
+
+    assert (await manager.move_file("f1", "new", old_folder_id="old"))["success"] is True
+    assert (await manager.move_file("f2", "new"))["success"] is True
+
+    assert [name for name, _ in calls] == ["update", "get", "update"]
+    assert calls[0][1]["removeParents"] == "old"
+    assert calls[2][1]["removeParents"] == "old-a,old-b"
+
+
+def test_error_result_summarizes_google_api_errors():
+    content = b'{"error": {"code": 403, "message": "Rate limit exceeded.", "errors": [{"reason": "userRateLimitExceeded"}]}}'
+    error = HttpError(httplib2.Response({"status": 403}), content, uri="https://www.googleapis.com/drive/v3/files")
+
+    result = google_common.error_result(error)
+
+    assert result == {"success": False, "error": "HttpError 403: Rate limit exceeded. (userRateLimitExceeded)"}
+    assert google_common.error_result(ValueError("bad input")) == {"success": False, "error": "bad input"}
+
+
+def test_upload_local_file_reports_http_status_and_reasons(monkeypatch, tmp_path):
+    content = b'{"error": {"code": 403, "message": "Rate limit exceeded.", "errors": [{"reason": "userRateLimitExceeded"}]}}'
+    path = tmp_path / "receipt.pdf"
+    path.write_bytes(b"pdf")
+
+    class FakeFiles:
+        def create(self, **kwargs):
+            return object()
+
+    class FakeService:
+        def files(self):
+            return FakeFiles()
+
+    def fail(request):
+        raise HttpError(httplib2.Response({"status": 403}), content)
+
+    monkeypatch.setattr(google_common, "execute_request", fail)
+
+    result = google_common.upload_local_file(FakeService(), str(path), "f")
+
+    assert result["status"] == 403
+    assert result["reasons"] == ["userRateLimitExceeded"]
+    assert google_common._is_rate_limited(result)
+    assert google_common._is_rate_limited({"success": False, "status": 429, "reasons": []})
+    assert not google_common._is_rate_limited({"success": False, "error": "rateLimitExceeded"})
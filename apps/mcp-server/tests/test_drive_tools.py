@@ -0,0 +1,233 @@
+"""Tests for Google Drive receipt tools."""
+
+from __future__ import annotations
+
+import threading
+import time
+from types import SimpleNamespace
+
+import googleapiclient.http
+import pytest
+
+from vivian_mcp.tools import drive_tools, google_common
+from vivian_mcp.tools.drive_tools import DriveToolManager
+
+
+class _FakeDrive:
+    """Drive client whose create() calls record how many run at once."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def files(self):
+        return SimpleNamespace(create=self._create)
+
+    def _create(self, body, media_body, fields):
+        return SimpleNamespace(execute=lambda: self._execute(body))
+
+    def _execute(self, body):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.02)
+        with self._lock:
+            self.active -= 1
+        return {"id": f"id-{body['name']}", "name": body["name"], "webViewLink": ""}
+
+
+@pytest.mark.asyncio
+async def test_upload_receipts_bounds_concurrency_and_isolates_failures(monkeypatch, tmp_path):
+    monkeypatch.setattr(google_common, "open_upload_media", lambda *args: (object(), None))
+    tools = DriveToolManager()
+    drive = _FakeDrive()
+    tools._drive_service = drive
+    paths = []
+    for idx in range(6):
+        path = tmp_path / f"receipt{idx}.pdf"
+        path.write_bytes(b"%PDF")
+        paths.append(str(path))
+    paths.insert(2, str(tmp_path / "missing.pdf"))
+
+    results = await tools.upload_receipts(paths, "unreimbursed", max_concurrency=2)
+
+    assert len(results) == 7
+    assert results[2] == {"success": False, "error": f"File not found: {paths[2]}"}
+    assert all(result["success"] for idx, result in enumerate(results) if idx != 2)
+    assert results[0]["filename"].startswith("receipt0_")
+    assert drive.peak == 2
+
+
+def test_drive_service_is_shared_across_managers(monkeypatch):
+    builds: list[str] = []
+
+    def fake_build_service(name, version, credentials):
+        builds.append(name)
+        return object()
+
+    monkeypatch.setattr(google_common, "build_service", fake_build_service)
+    google_common.shared_service.cache_clear()
+
+    first = DriveToolManager()._get_drive_service()
+    second = DriveToolManager()._get_drive_service()
+    google_common.shared_service.cache_clear()
+
+    assert first is second
+    assert builds == ["drive"]
+
+
+class _FakeBatchDrive:
+    """Drive client that serves files().get/update through batch requests."""
+
+    def __init__(self, parents):
+        self.parents = parents
+        self.batches: list[list[str]] = []
+
+    def files(self):
+        return SimpleNamespace(get=self._get, update=self._update)
+
+    def _get(self, fileId, fields):
+        if fileId not in self.parents:
+            return ("error", fileId)
+        return ("ok", {"parents": self.parents[fileId]})
+
+    def _update(self, fileId, addParents, removeParents, fields):
+        self.parents[fileId] = [addParents]
+        return ("ok", {"id": fileId, "removed": removeParents})
+
+    def new_batch_http_request(self, callback):
+        staged: list[tuple[str, tuple]] = []
+
+        def execute():
+            self.batches.append([request_id for request_id, _ in staged])
+            for request_id, (kind, payload) in staged:
+                if kind == "ok":
+                    callback(request_id, payload, None)
+                else:
+                    callback(request_id, None, RuntimeError(f"missing {payload}"))
+
+        return SimpleNamespace(
+            add=lambda request, request_id: staged.append((request_id, request)),
+            execute=execute,
+        )
+
+
+@pytest.mark.asyncio
+async def test_move_files_batches_lookups_and_updates(monkeypatch):
+    tools = DriveToolManager()
+    monkeypatch.setattr(tools.settings, "reimbursed_folder_id", "folder-r")
+    monkeypatch.setattr(tools.settings, "unreimbursed_folder_id", "folder-u")
+    drive = _FakeBatchDrive({"a": ["folder-u"], "b": ["folder-u"]})
+    tools._drive_service = drive
+
+    results = await tools.move_files([("a", "reimbursed"), ("ghost", "reimbursed"), ("b", "reimbursed")])
+
+    assert results[0] == {"success": True, "file_id": "a", "new_status": "reimbursed", "new_folder_id": "folder-r"}
+    assert results[1] == {"success": False, "error": "missing ghost"}
+    assert results[2]["success"] is True
+    assert drive.batches == [["0", "1", "2"], ["0", "2"]]
+    assert drive.parents == {"a": ["folder-r"], "b": ["folder-r"]}
+
+
+@pytest.mark.asyncio
+async def test_move_file_with_old_status_skips_parent_lookup(monkeypatch):
+    tools = DriveToolManager()
+    monkeypatch.setattr(tools.settings, "reimbursed_folder_id", "folder-r")
+    monkeypatch.setattr(tools.settings, "unreimbursed_folder_id", "folder-u")
+    calls: list[tuple[str, dict]] = []
+
+    def request(name, response):
+        def build(**kwargs):
+            calls.append((name, kwargs))
+            return SimpleNamespace(execute=lambda: response)
+
+        return build
+
+    files = SimpleNamespace(get=request("get", {"parents": ["folder-x"]}), update=request("update", {"id": "f1"}))
+    tools._drive_service = SimpleNamespace(files=lambda: files)
+
+    result = await tools.move_file("f1", "reimbursed", old_status="unreimbursed")
+    await tools.move_file("f1", "unreimbursed")
+
+    assert result == {"success": True, "file_id": "f1", "new_status": "reimbursed", "new_folder_id": "folder-r"}
+    assert [name for name, _ in calls] == ["update", "get", "update"]
+    assert calls[0][1]["removeParents"] == "folder-u"
+    assert calls[2][1]["removeParents"] == "folder-x"
+
+
+@pytest.mark.asyncio
+async def test_move_file_with_unknown_old_status_looks_parents_up(monkeypatch):
+    tools = DriveToolManager()
+    monkeypatch.setattr(tools.settings, "reimbursed_folder_id", "folder-r")
+    monkeypatch.setattr(tools.settings, "unreimbursed_folder_id", "folder-u")
+    updates: list[dict] = []
+
+    def update(**kwargs):
+        updates.append(kwargs)
+        return SimpleNamespace(execute=lambda: {"id": "f1"})
+
+    files = SimpleNamespace(get=lambda **kwargs: SimpleNamespace(execute=lambda: {"parents": ["folder-x"]}), update=update)
+    tools._drive_service = SimpleNamespace(files=lambda: files)
+
+    result = await tools.move_file("f1", "reimbursed", old_status="unreimbursd")
+
+    assert result["success"] is True
+    assert updates[0]["removeParents"] == "folder-x"
+
+
+@pytest.mark.asyncio
+async def test_upload_receipt_uses_simple_upload_for_small_files(monkeypatch, tmp_path):
+    uploads: list[dict] = []
+    streams = []
+
+    def fake_media_io(stream, **kwargs):
+        streams.append(stream)
+        uploads.append(kwargs)
+
+    monkeypatch.setattr(googleapiclient.http, "MediaFileUpload", lambda path, **kwargs: uploads.append(kwargs))
+    monkeypatch.setattr(googleapiclient.http, "MediaIoBaseUpload", fake_media_io)
+    monkeypatch.setattr(google_common, "SIMPLE_UPLOAD_MAX_BYTES", 8)
+    tools = DriveToolManager()
+    tools._drive_service = _FakeDrive()
+    small = tmp_path / "receipt.png"
+    small.write_bytes(b"png")
+    large = tmp_path / "receipt.pdf"
+    large.write_bytes(b"%PDF-1.7 long")
+
+    await tools.upload_receipt(str(small), "unreimbursed")
+    await tools.upload_receipt(str(large), "unreimbursed")
+
+    assert uploads == [
+        {"mimetype": "image/png", "resumable": False},
+        {"mimetype": "application/pdf", "chunksize": 16 * 1024 * 1024, "resumable": True},
+    ]
+    assert [stream.closed for stream in streams] == [True]
+
+
+@pytest.mark.asyncio
+async def test_upload_receipts_send_over_each_worker_threads_http(monkeypatch, tmp_path):
+    monkeypatch.setattr(google_common, "open_upload_media", lambda *args: (object(), None))
+    monkeypatch.setattr(google_common, "_thread_http", lambda credentials: threading.current_thread())
+    sent_over: list = []
+
+    def create(body, media_body, fields):
+        def execute(http=None):
+            sent_over.append(http)
+            time.sleep(0.01)
+            return {"id": "id", "name": body["name"]}
+
+        return SimpleNamespace(http=SimpleNamespace(credentials="creds"), execute=execute)
+
+    tools = DriveToolManager()
+    tools._drive_service = SimpleNamespace(files=lambda: SimpleNamespace(create=create))
+    paths = []
+    for idx in range(3):
+        path = tmp_path / f"receipt{idx}.pdf"
+        path.write_bytes(b"%PDF")
+        paths.append(str(path))
+
+    results = await tools.upload_receipts(paths, "unreimbursed", max_concurrency=3)
+
+    assert all(result["success"] for result in results)
+    assert all(isinstance(http, threading.Thread) and http is not threading.main_thread() for http in sent_over)
@@ -0,0 +1,89 @@
+"""Tests for HSA ledger tools."""
+
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from vivian_mcp.tools import google_common, hsa_tools
+from vivian_mcp.tools.hsa_tools import HSAToolManager
+
+
+def _sheets_with_values(values):
+    request = SimpleNamespace(execute=lambda: {"values": values})
+    values_api = SimpleNamespace(get=lambda **kwargs: request)
+    return SimpleNamespace(spreadsheets=lambda: SimpleNamespace(values=lambda: values_api))
+
+
+@pytest.mark.asyncio
+async def test_read_ledger_entries_fills_missing_trailing_cells(monkeypatch):
+    tools = HSAToolManager()
+    rows = [
+        list(HSAToolManager.EXPECTED_HEADERS),
+        ["e1", "Clinic", "2025-02-01", "", "40", "Yes", "unreimbursed"],
+        ["e2", "Pharmacy", "2024-05-01", "", "n/a", "Yes", "reimbursed", "2024-06-01", "d2", "0.8", "2024-05-02"],
+        ["short", "Row"],
+    ]
+    monkeypatch.setattr(tools, "_get_sheets_service", lambda: _sheets_with_values(rows))
+
+    result = await tools.read_ledger_entries()
+
+    assert result["success"] is True
+    assert [entry["id"] for entry in result["entries"]] == ["e1", "e2"]
+    assert result["entries"][0]["confidence"] == "0.9"
+    assert result["entries"][0]["reimbursement_date"] == ""
+    assert result["entries"][1]["amount"] == 0.0
+    assert result["summary"]["total_unreimbursed"] == 40.0
+
+    filtered = await tools.read_ledger_entries(year=2024, status_filter="reimbursed")
+
+    assert [entry["id"] for entry in filtered["entries"]] == ["e2"]
+
+
+def test_sheets_and_drive_services_use_shared_credentials(monkeypatch):
+    monkeypatch.setattr(google_common, "_creds_cache", {})
+    built: list[tuple[str, object]] = []
+    monkeypatch.setattr(hsa_tools, "shared_service", lambda api, version, creds: built.append((api, creds)) or api)
+    tools = HSAToolManager()
+
+    tools._get_sheets_service()
+
+    shared = google_common.get_credentials(tools.settings)
+    assert built == [("sheets", shared), ("drive", shared)]
+
+
+@pytest.mark.asyncio
+async def test_get_unreimbursed_balance_executes_off_the_event_loop(monkeypatch):
+    tools = HSAToolManager()
+    threads: list[threading.Thread] = []
+
+    def execute():
+        threads.append(threading.current_thread())
+        return {"values": [list(HSAToolManager.EXPECTED_HEADERS)]}
+
+    values_api = SimpleNamespace(get=lambda **kwargs: SimpleNamespace(execute=execute))
+    sheets = SimpleNamespace(spreadsheets=lambda: SimpleNamespace(values=lambda: values_api))
+    monkeypatch.setattr(tools, "_get_sheets_service", lambda: sheets)
+
+    await tools.get_unreimbursed_balance()
+
+    assert threads and threads[0] is not threading.main_thread()
+
+
+@pytest.mark.asyncio
+async def test_run_executes_over_the_worker_threads_http_client(monkeypatch):
+    monkeypatch.setattr(google_common, "_thread_http", lambda credentials: ("thread-http", threading.current_thread()))
+    executed_with: list = []
+
+    def execute(http=None):
+        executed_with.append(http)
+        return {"ok": True}
+
+    request = SimpleNamespace(http=SimpleNamespace(credentials="creds"), execute=execute)
+
+    assert await HSAToolManager._run(request) == {"ok": True}
+    http, thread = executed_with[0]
+    assert http == "thread-http"
+    assert thread is not threading.main_thread()
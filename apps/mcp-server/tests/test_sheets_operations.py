@@ -0,0 +1,301 @@
+"""Tests for shared Sheets operations."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from vivian_mcp.tools.google_common import GoogleServiceMixin, SheetsOperationsMixin
+
+
+class _Request:
+    def __init__(self, response):
+        self._response = response
+
+    def execute(self):
+        return self._response
+
+
+class _FakeSheets:
+    """Minimal stand-in for the Drive and Sheets discovery clients."""
+
+    def __init__(self, values):
+        self.values_payload = values
+        self.version = "1"
+        self.value_reads = 0
+        self.ranges: list[str] = []
+
+    # Drive: files().get(fileId=..., fields="version")
+    def files(self):
+        return SimpleNamespace(get=lambda **kwargs: _Request({"version": self.version}))
+
+    # Sheets: spreadsheets().values().get/append(...)
+    def spreadsheets(self):
+        return SimpleNamespace(
+            values=lambda: SimpleNamespace(get=self._get, append=self._append, batchGet=self._batch_get)
+        )
+
+    def _get(self, **kwargs):
+        self.value_reads += 1
+        self.ranges.append(kwargs["range"])
+        if "!" in kwargs["range"]:
+            first, last = kwargs["range"].split("!")[1].split(":")
+            return _Request({"values": self.values_payload[int(first) - 1:int(last)]})
+        return _Request({"values": self.values_payload})
+
+    def _batch_get(self, spreadsheetId, ranges):
+        self.value_reads += 1
+        return _Request({"valueRanges": [{"range": r, "values": [[r]]} if "A1" in r else {"range": r} for r in ranges]})
+
+    def _append(self, **kwargs):
+        # Echo the appended rows back formatted, as includeValuesInResponse does
+        formatted = [[f"{value:,.2f}" if isinstance(value, float) else str(value) for value in row] for row in kwargs["body"]["values"]]
+        return _Request({"updates": {"updatedRange": "Sheet!A3", "updatedData": {"values": formatted}}})
+
+
+class _Manager(GoogleServiceMixin, SheetsOperationsMixin):
+    def __init__(self, fake):
+        super().__init__(settings=None)
+        self._drive_service = fake
+        self._sheets_service = fake
+
+
+@pytest.mark.asyncio
+async def test_get_all_rows_reuses_values_until_spreadsheet_changes():
+    fake = _FakeSheets([["id", "amount"], ["a1", "10"]])
+    manager = _Manager(fake)
+    manager.ROWS_CACHE_TTL_SECONDS = 0
+
+    first = await manager.get_all_rows("sheet-id", "Ledger")
+    second = await manager.get_all_rows("sheet-id", "Ledger")
+    assert first == second == {"success": True, "headers": ["id", "amount"], "rows": [["a1", "10"]]}
+    assert fake.value_reads == 1
+
+    fake.version = "2"
+    await manager.get_all_rows("sheet-id", "Ledger")
+    assert fake.value_reads == 2
+
+    await manager.append_row("sheet-id", "Ledger", ["a2", "5"])
+    await manager.get_all_rows("sheet-id", "Ledger")
+    assert fake.value_reads == 3
+
+
+@pytest.mark.asyncio
+async def test_get_all_rows_serves_fresh_cache_with_local_appends():
+    fake = _FakeSheets([["id", "amount"], ["a1", "10"]])
+    manager = _Manager(fake)
+
+    await manager.get_all_rows("sheet-id", "Ledger")
+    await manager.append_rows("sheet-id", "Ledger", [["a2", 1000.5]])
+    result = await manager.get_all_rows("sheet-id", "Ledger")
+
+    assert result["rows"] == [["a1", "10"], ["a2", "1,000.50"]]
+    assert fake.value_reads == 1
+
+    manager.ROWS_CACHE_TTL_SECONDS = 0
+    await manager.get_all_rows("sheet-id", "Ledger")
+    assert fake.value_reads == 2
+
+
+@pytest.mark.asyncio
+async def test_get_all_columns_reads_through_the_rows_cache():
+    fake = _FakeSheets([["id", "amount", "note"], ["a1", "10"], ["a2", "5", "gift", "extra"]])
+    manager = _Manager(fake)
+
+    await manager.get_all_rows("sheet-id", "Ledger")
+    result = await manager.get_all_columns("sheet-id", "Ledger")
+
+    assert result == {
+        "success": True,
+        "headers": ["id", "amount", "note", ""],
+        "columns": [["a1", "a2"], ["10", "5"], ["", "gift"], ["", "extra"]],
+    }
+    assert fake.value_reads == 1
+    assert (await manager.get_all_rows("sheet-id", "Ledger"))["rows"][0] == ["a1", "10"]
+
+@pytest.mark.asyncio
+async def test_concurrent_get_all_rows_share_one_fetch():
+    fake = _FakeSheets([["id", "amount"], ["a1", "10"]])
+    manager = _Manager(fake)
+
+    results = await asyncio.gather(*(manager.get_all_rows("sheet-id", "Ledger") for _ in range(5)))
+
+    assert fake.value_reads == 1
+    assert all(result["rows"] == [["a1", "10"]] for result in results)
+    results[0]["rows"].append(["mutated"])
+    results[1]["rows"][0].append("padded")
+    assert results[2]["rows"] == [["a1", "10"]]
+    assert (await manager.get_all_rows("sheet-id", "Ledger"))["rows"] == [["a1", "10"]]
+    assert manager._rows_inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_get_many_ranges_reads_all_ranges_in_one_call():
+    fake = _FakeSheets([])
+    manager = _Manager(fake)
+
+    result = await manager.get_many_ranges("sheet-id", ["'Ledger'!A1:K1", "'Empty'!A:B"])
+
+    assert result == {"success": True, "values": [[["'Ledger'!A1:K1"]], []]}
+    assert fake.value_reads == 1
+
+
+@pytest.mark.asyncio
+async def test_ensure_worksheet_exists_adds_sheet_and_headers_in_one_update():
+    batch_bodies: list[dict] = []
+    metadata = {"sheets": [{"properties": {"sheetId": 0, "title": "Sheet1"}}, {"properties": {"sheetId": 7, "title": "Old"}}]}
+
+    def batch_update(spreadsheetId, body):
+        batch_bodies.append(body)
+        return _Request({})
+
+    spreadsheets = SimpleNamespace(get=lambda **kwargs: _Request(metadata), batchUpdate=batch_update)
+    manager = _Manager(SimpleNamespace(spreadsheets=lambda: spreadsheets))
+
+    result = await manager.ensure_worksheet_exists("sheet-id", "Ledger", ["id", "amount"])
+
+    assert result == {"success": True, "worksheet_exists": False}
+    assert len(batch_bodies) == 1
+    add_sheet, update_cells = batch_bodies[0]["requests"]
+    assert add_sheet["addSheet"]["properties"] == {"sheetId": 8, "title": "Ledger"}
+    assert update_cells["updateCells"]["start"] == {"sheetId": 8, "rowIndex": 0, "columnIndex": 0}
+    assert [cell["userEnteredValue"]["stringValue"] for cell in update_cells["updateCells"]["rows"][0]["values"]] == [
+        "id",
+        "amount",
+    ]
+
+
+
+@pytest.mark.asyncio
+async def test_ensure_worksheets_exist_creates_missing_sheets_in_one_update():
+    batch_bodies: list[dict] = []
+    metadata = {"sheets": [{"properties": {"sheetId": 3, "title": "Ledger"}}]}
+
+    def batch_update(spreadsheetId, body):
+        batch_bodies.append(body)
+        return _Request({})
+
+    spreadsheets = SimpleNamespace(get=lambda **kwargs: _Request(metadata), batchUpdate=batch_update)
+    manager = _Manager(SimpleNamespace(spreadsheets=lambda: spreadsheets))
+
+    result = await manager.ensure_worksheets_exist(
+        "sheet-id", {"Ledger": ["id"], "2024": ["id", "amount"], "2025": None}
+    )
+
+    assert result == {"success": True, "worksheet_exists": {"Ledger": True, "2024": False, "2025": False}}
+    assert len(batch_bodies) == 1
+    requests = batch_bodies[0]["requests"]
+    assert [next(iter(request)) for request in requests] == ["addSheet", "updateCells", "addSheet"]
+    assert [request["addSheet"]["properties"] for request in requests if "addSheet" in request] == [
+        {"sheetId": 4, "title": "2024"},
+        {"sheetId": 5, "title": "2025"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_append_rows_batch_appends_each_worksheet():
+    appended: list[tuple[str, list]] = []
+
+    def append(**kwargs):
+        appended.append((kwargs["range"], kwargs["body"]["values"]))
+        return _Request({"updates": {"updatedRange": kwargs["range"]}})
+
+    values_api = SimpleNamespace(append=append)
+    manager = _Manager(SimpleNamespace(spreadsheets=lambda: SimpleNamespace(values=lambda: values_api)))
+
+    result = await manager.append_rows_batch("sheet-id", {"2024": [["a1"]], "2025": [["b1"], ["b2"]]})
+
+    assert result["success"] is True
+    assert result["results"] == {
+        "2024": {"success": True, "row_index": "'2024'!A1"},
+        "2025": {"success": True, "row_index": "'2025'!A1"},
+    }
+    assert sorted(appended) == [("'2024'!A1", [["a1"]]), ("'2025'!A1", [["b1"], ["b2"]])]
+
+
+@pytest.mark.asyncio
+async def test_append_rows_drops_cache_when_response_has_no_values():
+    fake = _FakeSheets([["id", "amount"], ["a1", "10"]])
+    manager = _Manager(fake)
+    await manager.get_all_rows("sheet-id", "Ledger")
+    fake._append = lambda **kwargs: _Request({"updates": {"updatedRange": "Sheet!A3"}})
+
+    await manager.append_rows("sheet-id", "Ledger", [["a2", 5]])
+    await manager.get_all_rows("sheet-id", "Ledger")
+
+    assert fake.value_reads == 2
+
+@pytest.mark.asyncio
+async def test_ensure_worksheet_exists_remembers_known_worksheets():
+    metadata_reads: list[dict] = []
+    metadata = {"sheets": [{"properties": {"sheetId": 0, "title": "Ledger"}}, {"properties": {"sheetId": 1, "title": "Other"}}]}
+
+    def get(**kwargs):
+        metadata_reads.append(kwargs)
+        return _Request(metadata)
+
+    manager = _Manager(SimpleNamespace(spreadsheets=lambda: SimpleNamespace(get=get)))
+
+    for worksheet_name in ("Ledger", "Ledger", "Other"):
+        result = await manager.ensure_worksheet_exists("sheet-id", worksheet_name)
+        assert result == {"success": True, "worksheet_exists": True}
+
+    assert metadata_reads == [{"spreadsheetId": "sheet-id", "fields": "sheets.properties(sheetId,title)"}]
+
+    manager.KNOWN_WORKSHEET_TTL_SECONDS = 0
+    await manager.ensure_worksheet_exists("sheet-id", "Ledger")
+    assert len(metadata_reads) == 2
+
+
+@pytest.mark.asyncio
+async def test_iter_rows_pages_until_a_short_batch():
+    values = [["id", "amount"]] + [[f"a{idx}", str(idx)] for idx in range(4)]
+    fake = _FakeSheets(values)
+    manager = _Manager(fake)
+
+    rows = [row async for row in manager.iter_rows("sheet-id", "Bob's Ledger", batch_size=2)]
+
+    assert rows == values
+    assert fake.ranges == ["'Bob''s Ledger'!1:2", "'Bob''s Ledger'!3:4", "'Bob''s Ledger'!5:6"]
+
+
+@pytest.mark.asyncio
+async def test_fetch_overlapping_an_append_is_not_cached():
+    fake = _FakeSheets([["id", "amount"], ["a1", "10"]])
+    manager = _Manager(fake)
+    slow_get = fake._get
+
+    def get_after_append(**kwargs):
+        time.sleep(0.05)
+        return slow_get(**kwargs)
+
+    fake._get = get_after_append
+
+    await asyncio.gather(
+        manager.get_all_rows("sheet-id", "Ledger"),
+        manager.append_rows("sheet-id", "Ledger", [["a2", 5]]),
+    )
+    await manager.get_all_rows("sheet-id", "Ledger")
+
+    assert fake.value_reads == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_append_drops_cached_rows():
+    fake = _FakeSheets([["id", "amount"], ["a1", "10"]])
+    manager = _Manager(fake)
+    await manager.get_all_rows("sheet-id", "Ledger")
+
+    def timeout(**kwargs):
+        raise TimeoutError("read timed out")
+
+    fake._append = timeout
+
+    result = await manager.append_rows("sheet-id", "Ledger", [["a2", 5]])
+    await manager.get_all_rows("sheet-id", "Ledger")
+
+    assert result == {"success": False, "error": "read timed out"}
+    assert fake.value_reads == 2
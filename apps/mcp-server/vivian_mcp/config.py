@@ -2,6 +2,7 @@
 
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -74,3 +75,9 @@ class Settings(BaseSettings):
                 except Exception:
                     # Keep env-driven behavior if token file is malformed/unreadable.
                     pass
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, read from the environment once."""
+    return Settings()
@@ -248,6 +248,28 @@ class AppendCharitableDonationOutput(ToolOutputModel):
     error: str | None = None
 
 
+class AppendCharitableDonationsBatchItem(ToolInputModel):
+    donation_json: dict[str, Any]
+    drive_file_id: str
+
+
+class AppendCharitableDonationsBatchInput(ToolInputModel):
+    donations: list[AppendCharitableDonationsBatchItem]
+    check_duplicates: bool = True
+    force_append: bool = False
+    fuzzy_days: int = 3
+    max_batch: int = 500
+
+
+class AppendCharitableDonationsBatchOutput(ToolOutputModel):
+    success: bool
+    imported_count: int = 0
+    failed_count: int = 0
+    total_amount: float = 0.0
+    results: list[dict[str, Any]] = Field(default_factory=list)
+    error: str | None = None
+
+
 class CharitableDuplicateMatch(ToolOutputModel):
     organization: str = ""
     date: str = ""
@@ -288,6 +310,17 @@ class CharitableSummaryOutput(ToolOutputModel):
     error: str | None = None
 
 
+class GetCharitableSummaryBatchInput(ToolInputModel):
+    tax_years: list[str | int]
+    column_filters: list[ColumnFilter] | None = None
+
+
+class CharitableSummaryBatchOutput(ToolOutputModel):
+    success: bool
+    summaries: list[CharitableSummaryOutput] = Field(default_factory=list)
+    error: str | None = None
+
+
 class ReadCharitableLedgerEntriesInput(ToolInputModel):
     tax_year: str | int | None = None
     organization: str | None = None
@@ -327,10 +360,6 @@ class ReadCharitableLedgerEntriesOutput(ToolOutputModel):
     summary: ReadCharitableLedgerEntriesSummary = Field(
         default_factory=ReadCharitableLedgerEntriesSummary
     )
-    total: float = 0.0
-    tax_deductible_total: float = 0.0
-    by_organization: dict[str, CharitableSummaryTotals] = Field(default_factory=dict)
-    by_year: dict[str, CharitableSummaryTotals] = Field(default_factory=dict)
     error: str | None = None
 
 
@@ -423,6 +452,12 @@ TOOL_CONTRACTS: tuple[MCPToolContract, ...] = (
         input_model=AppendCharitableDonationInput,
         output_model=AppendCharitableDonationOutput,
     ),
+    MCPToolContract(
+        name="append_charitable_donations_batch",
+        description="Add several charitable donations to the ledger with one read and one append",
+        input_model=AppendCharitableDonationsBatchInput,
+        output_model=AppendCharitableDonationsBatchOutput,
+    ),
     MCPToolContract(
         name="check_charitable_duplicates",
         description="Check if a charitable donation is a duplicate of existing entries",
@@ -437,6 +472,12 @@ TOOL_CONTRACTS: tuple[MCPToolContract, ...] = (
         server_id="charitable_ledger",
         model_visible=True,
     ),
+    MCPToolContract(
+        name="get_charitable_summary_batch",
+        description="Get charitable donation summaries for several tax years from a single ledger read",
+        input_model=GetCharitableSummaryBatchInput,
+        output_model=CharitableSummaryBatchOutput,
+    ),
     MCPToolContract(
         name="read_charitable_ledger_entries",
         description=(
@@ -8,13 +8,16 @@ from typing import Any, AsyncIterator, TypeVar
 
 from mcp.server.fastmcp import FastMCP
 
-from vivian_mcp.config import Settings
+from vivian_mcp.config import Settings, get_settings
 from vivian_mcp.contracts import (
     AppendCharitableDonationOutput,
+    AppendCharitableDonationsBatchItem,
+    AppendCharitableDonationsBatchOutput,
     AppendExpenseOutput,
     BulkImportFromDirectoryOutput,
     BulkImportReceiptItem,
     BulkImportReceiptsOutput,
+    CharitableSummaryBatchOutput,
     CharitableSummaryOutput,
     CheckCharitableDuplicatesOutput,
     CheckDuplicatesOutput,
@@ -40,7 +43,7 @@ from vivian_mcp.tools.hsa_tools import HSAToolManager
 @asynccontextmanager
 async def app_lifespan(server: FastMCP) -> AsyncIterator[Settings]:
     """Manage application lifecycle."""
-    settings = Settings()
+    settings = get_settings()
     yield settings
 
 
@@ -147,6 +150,14 @@ async def _execute_tool(name: str, arguments: dict[str, Any]) -> dict[str, Any]:
             arguments.get("check_duplicates", True),
             arguments.get("force_append", False),
         )
+    elif name == "append_charitable_donations_batch":
+        raw_result = await charitable_tools.append_donations_batch(
+            arguments["donations"],
+            arguments.get("check_duplicates", True),
+            arguments.get("force_append", False),
+            arguments.get("fuzzy_days", 3),
+            arguments.get("max_batch", 500),
+        )
     elif name == "check_charitable_duplicates":
         raw_result = await charitable_tools.check_for_duplicates(
             arguments["donation_json"],
@@ -157,6 +168,11 @@ async def _execute_tool(name: str, arguments: dict[str, Any]) -> dict[str, Any]:
             arguments.get("tax_year"),
             arguments.get("column_filters"),
         )
+    elif name == "get_charitable_summary_batch":
+        raw_result = await charitable_tools.get_donation_summary_batch(
+            arguments["tax_years"],
+            arguments.get("column_filters"),
+        )
     elif name == "read_charitable_ledger_entries":
         raw_result = await charitable_tools.read_donation_entries(
             tax_year=arguments.get("tax_year"),
@@ -348,6 +364,28 @@ async def append_charitable_donation_to_ledger(
     )
 
 
+@app.tool(
+    name="append_charitable_donations_batch",
+    description=_contract_description("append_charitable_donations_batch"),
+)
+async def append_charitable_donations_batch(
+    donations: list[AppendCharitableDonationsBatchItem],
+    check_duplicates: bool = True,
+    force_append: bool = False,
+    fuzzy_days: int = 3,
+    max_batch: int = 500,
+) -> AppendCharitableDonationsBatchOutput:
+    return await _run_tool(
+        "append_charitable_donations_batch",
+        AppendCharitableDonationsBatchOutput,
+        donations=donations,
+        check_duplicates=check_duplicates,
+        force_append=force_append,
+        fuzzy_days=fuzzy_days,
+        max_batch=max_batch,
+    )
+
+
 @app.tool(
     name="check_charitable_duplicates",
     description=_contract_description("check_charitable_duplicates"),
@@ -377,6 +415,22 @@ async def get_charitable_summary(
     )
 
 
+@app.tool(
+    name="get_charitable_summary_batch",
+    description=_contract_description("get_charitable_summary_batch"),
+)
+async def get_charitable_summary_batch(
+    tax_years: list[str | int],
+    column_filters: list[ColumnFilter] | None = None,
+) -> CharitableSummaryBatchOutput:
+    return await _run_tool(
+        "get_charitable_summary_batch",
+        CharitableSummaryBatchOutput,
+        tax_years=tax_years,
+        column_filters=column_filters,
+    )
+
+
 @app.tool(
     name="read_charitable_ledger_entries",
     description=_contract_description("read_charitable_ledger_entries"),
@@ -1,17 +1,334 @@
 """Charitable donation tools for MCP server."""
 
-import json
-import uuid
+import math
+import re
+import sys
+from collections import Counter
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
+from itertools import compress
+from secrets import token_hex
 from typing import Any
 
-from vivian_mcp.config import Settings
+from vivian_mcp.config import get_settings
 from vivian_mcp.tools.google_common import (
     GoogleServiceMixin,
     DriveOperationsMixin,
     SheetsOperationsMixin,
     apply_column_filters,
+    apply_column_filters_to_columns,
+    error_result,
 )
+from vivian_mcp.tools.hsa_tools import days_between
+
+
+# Truthy tax_deductible spellings; common cased variants are checked before lowercasing.
+_TRUTHY = frozenset({"yes", "true", "1", "y"})
+_TRUTHY_FAST = _TRUTHY | frozenset({"Yes", "YES", "True", "TRUE", "Y"})
+
+# Column index for headers missing from the ledger; larger than any row.
+_ABSENT_COLUMN = sys.maxsize
+
+# Currency symbols, thousands separators, and whitespace in formatted amount cells.
+_AMOUNT_CLEAN = re.compile(r"[$,\s]")
+
+# Plain decimal amounts, the shape nearly every ledger cell takes.
+_AMOUNT_RE = re.compile(r"-?[0-9]+(?:\.[0-9]+)?")
+
+
+def _is_truthy(value: Any) -> bool:
+    """Interpret a ledger yes/no cell."""
+    if value in _TRUTHY_FAST:
+        return True
+    return str(value or "").strip().lower() in _TRUTHY
+
+
+def _to_float(value: Any) -> float | None:
+    """Parse an amount cell, tolerating currency formatting; None when unparseable."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = value if isinstance(value, str) else str(value)
+    # Match the common shapes up front instead of raising per bad cell.
+    if _AMOUNT_RE.fullmatch(text):
+        return float(text)
+    cleaned = _AMOUNT_CLEAN.sub("", text)
+    if not cleaned:
+        return None
+    if _AMOUNT_RE.fullmatch(cleaned):
+        return float(cleaned)
+    # Rare spellings float() still accepts, e.g. "1e3" or ".5".
+    try:
+        return float(cleaned)
+    except ValueError:
+        return None
+
+
+# Donation date layouts accepted when deriving a tax year, tried in order.
+_DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%Y/%m/%d",
+    "%m/%d/%Y",
+    "%m-%d-%Y",
+    "%d/%m/%Y",
+    "%d-%m-%Y",
+    "%b %d, %Y",
+    "%B %d, %Y",
+)
+
+# A numeric date embedded in free text, e.g. "paid 03/04/2025" or "on 2025-03-04".
+_DATE_TOKEN_RE = re.compile(
+    r"(?<![0-9])(?:([0-9]{4})([-/])[0-9]{1,2}\2[0-9]{1,2}|[0-9]{1,2}([-/])[0-9]{1,2}\3([0-9]{4}))(?![0-9])"
+)
+
+# A standalone 4-digit run, i.e. not part of a longer number.
+_YEAR_RE = re.compile(r"(?<![0-9])([0-9]{4})(?![0-9])")
+
+
+@lru_cache(maxsize=4096)
+def _parse_tax_year(donation_date: str) -> str | None:
+    """Return the year of a donation date string, or None when no format matches.
+
+    Ledger rows repeat the same dates heavily, so results are memoized.
+    """
+    try:
+        value = donation_date.strip()
+    except AttributeError:
+        return None
+    # Fast paths for the numeric layouts the ledger actually stores.
+    if len(value) == 10 and value[:4].isdigit() and value[5:7].isdigit() and value[8:].isdigit():
+        if value[4] == value[7] and value[4] in "-/":
+            return value[:4]
+    if len(value) == 10 and value[:2].isdigit() and value[3:5].isdigit() and value[6:].isdigit():
+        if value[2] == value[5] and value[2] in "-/":
+            return value[6:]
+    # ISO timestamps (e.g. created_at-style values) parse natively in C.
+    try:
+        return str(datetime.fromisoformat(value).year)
+    except ValueError:
+        pass
+    for fmt in _DATE_FORMATS:
+        try:
+            return str(datetime.strptime(value, fmt).year)
+        except ValueError:
+            continue
+    # Last resort: free text, preferring an embedded numeric date over any
+    # other plausible standalone 4-digit year.
+    match = _DATE_TOKEN_RE.search(value)
+    if match:
+        return match.group(1) or match.group(4)
+    match = _YEAR_RE.search(value)
+    if match and 1900 <= int(match.group(1)) <= 2100:
+        return match.group(1)
+    return None
+
+
+def _index_headers(headers: list[Any] | tuple[Any, ...]) -> dict[str, int]:
+    """Map stripped, lowercased header names to their column positions."""
+    return {str(header).strip().lower(): idx for idx, header in enumerate(headers)}
+
+
+@lru_cache(maxsize=16)
+def _summary_column_indices(headers: tuple[Any, ...]) -> tuple[int, int, int, int] | None:
+    """Resolve (org, amount, tax_deductible, tax_year) positions once per header layout."""
+    header_map = _index_headers(headers)
+    indices = (
+        header_map.get("organization_name"),
+        header_map.get("amount"),
+        header_map.get("tax_deductible"),
+        header_map.get("tax_year"),
+    )
+    if None in indices:
+        return None
+    return indices
+
+
+@dataclass
+class _DuplicateIndex:
+    """Ledger columns pre-normalized for the duplicate scan."""
+
+    orgs: list[str] = field(default_factory=list)
+    dates: list[str] = field(default_factory=list)
+    amounts: list[float] = field(default_factory=list)
+    # Normalized organization name -> positions in the columns above
+    positions_by_org: dict[str, list[int]] = field(default_factory=dict)
+    # (normalized organization name, amount in cents) for every indexed entry
+    amount_keys: set[tuple[str, int]] = field(default_factory=set)
+
+    @classmethod
+    def from_rows(cls, headers: list[Any], rows: list[list[Any]]) -> "_DuplicateIndex | None":
+        """Index ledger rows; None when the headers lack the compared columns."""
+        header_map = _index_headers(headers)
+        org_idx = header_map.get("organization_name")
+        date_idx = header_map.get("donation_date")
+        amount_idx = header_map.get("amount")
+        if org_idx is None or date_idx is None or amount_idx is None:
+            return None
+
+        index = cls()
+        min_len = max(org_idx, date_idx, amount_idx) + 1
+        for row in rows:
+            if len(row) < min_len:
+                continue
+            amount = _to_float(row[amount_idx])
+            if amount is None:
+                continue
+            index.orgs.append(row[org_idx])
+            index.dates.append(row[date_idx])
+            index.amounts.append(amount)
+
+        # Lowercase every name in one str.lower() call over a NUL-joined
+        # buffer rather than one method call per row.
+        if index.orgs:
+            lowered = "\x00".join(index.orgs).lower().split("\x00")
+            if len(lowered) != len(index.orgs):
+                # A name contained NUL; fall back to per-row lowering.
+                lowered = [org.lower() for org in index.orgs]
+            positions_by_org = index.positions_by_org
+            amount_keys = index.amount_keys
+            amounts = index.amounts
+            for position, org_lower in enumerate(lowered):
+                key = sys.intern(org_lower.strip())
+                positions_by_org.setdefault(key, []).append(position)
+                if math.isfinite(amounts[position]):
+                    amount_keys.add((key, round(amounts[position] * 100)))
+        return index
+
+    def add(self, organization: str, donation_date: str, amount: float) -> None:
+        """Add one ledger entry to the index."""
+        key = sys.intern(organization.lower().strip())
+        self.positions_by_org.setdefault(key, []).append(len(self.orgs))
+        if math.isfinite(amount):
+            self.amount_keys.add((key, round(amount * 100)))
+        self.orgs.append(organization)
+        self.dates.append(donation_date)
+        self.amounts.append(amount)
+
+    def find(self, donation_json: dict, fuzzy_days: int) -> list[dict[str, Any]]:
+        """Return entries matching the donation's organization, amount, and date."""
+        # Keys are interned, so probing with an interned name matches by identity.
+        new_org = sys.intern(donation_json.get("organization_name", "").lower().strip())
+        new_date = donation_json.get("donation_date", "")
+        new_amount = _to_float(donation_json.get("amount", 0) or 0)
+        if new_amount is None:
+            # Nothing to compare an unparseable amount against.
+            return []
+
+        # Amounts within the 0.01 tolerance are at most one cent apart, so a
+        # miss on all three neighbouring keys rules out every entry at once.
+        if math.isfinite(new_amount):
+            cents = round(new_amount * 100)
+            amount_keys = self.amount_keys
+            if (
+                (new_org, cents) not in amount_keys
+                and (new_org, cents - 1) not in amount_keys
+                and (new_org, cents + 1) not in amount_keys
+            ):
+                return []
+
+        potential_duplicates = []
+        # Only entries for the same organization are visited at all.
+        for position in self.positions_by_org.get(new_org, ()):
+            existing_amount = self.amounts[position]
+            # Check for exact match on amount
+            if abs(existing_amount - new_amount) >= 0.01:
+                continue
+            existing_org = self.orgs[position]
+            existing_date = self.dates[position]
+
+            # Check date with fuzzy matching
+            date_match = False
+            days_diff = 0
+
+            if existing_date == new_date:
+                date_match = True
+            else:
+                # Try to parse dates and check difference
+                try:
+                    days_diff = days_between(existing_date, new_date)
+                    if days_diff is not None and days_diff <= fuzzy_days:
+                        date_match = True
+                except Exception:
+                    pass
+
+            if date_match:
+                potential_duplicates.append({
+                    "organization": existing_org,
+                    "date": existing_date,
+                    "amount": existing_amount,
+                    "match_type": "exact" if existing_date == new_date else "fuzzy_date",
+                    "days_difference": days_diff,
+                })
+        return potential_duplicates
+
+
+def _duplicate_result(potential_duplicates: list[dict[str, Any]]) -> dict[str, Any]:
+    """Build the check_for_duplicates payload from matched entries."""
+    is_duplicate = len(potential_duplicates) > 0
+    return {
+        "is_duplicate": is_duplicate,
+        "potential_duplicates": potential_duplicates,
+        "recommendation": "review" if is_duplicate else "import",
+    }
+
+
+def _group_totals(
+    keys: list[str],
+    amounts: list[float],
+) -> dict[str, dict[str, float | int]]:
+    """Sum amounts and counts per key into {key: {"total", "count"}} buckets, first-seen order."""
+    # dict.fromkeys and Counter do the key discovery and counting in C, leaving
+    # a single bytecode loop for the sums.
+    sums = dict.fromkeys(keys, 0.0)
+    for key, amount in zip(keys, amounts):
+        sums[key] += amount
+    counts = Counter(keys)
+    return {key: {"total": total, "count": counts[key]} for key, total in sums.items()}
+
+
+def _reduce_donations(
+    amounts: list[float],
+    orgs: list[str],
+    years: list[str],
+    deductible: list[bool],
+) -> tuple[float, float, int, int, dict[str, dict[str, float | int]], dict[str, dict[str, float | int]]]:
+    """Reduce parallel donation columns into totals, counts, and per-org/per-year buckets."""
+    # Builtin reductions keep the per-row loop in C rather than bytecode.
+    total = sum(amounts, 0.0)
+    deductible_total = sum(compress(amounts, deductible), 0.0)
+    count_deductible = sum(deductible)
+    count_non_deductible = len(amounts) - count_deductible
+
+    by_organization = _group_totals(orgs, amounts)
+    by_year = _group_totals(years, amounts)
+
+    return total, deductible_total, count_deductible, count_non_deductible, by_organization, by_year
+
+
+def _summarize(
+    amounts: list[float],
+    orgs: list[str],
+    years: list[str],
+    deductible: list[bool],
+) -> dict[str, Any]:
+    """Build the rounded donation summary shared by the ledger read tools."""
+    (
+        total,
+        deductible_total,
+        count_deductible,
+        count_non_deductible,
+        by_organization,
+        by_year,
+    ) = _reduce_donations(amounts, orgs, years, deductible)
+    return {
+        "total_amount": round(total, 2),
+        "tax_deductible_total": round(deductible_total, 2),
+        "non_deductible_total": round(total - deductible_total, 2),
+        "count_tax_deductible": count_deductible,
+        "count_non_deductible": count_non_deductible,
+        "by_organization": by_organization,
+        "by_year": by_year,
+    }
 
 
 class CharitableToolManager(GoogleServiceMixin, DriveOperationsMixin, SheetsOperationsMixin):
@@ -32,7 +349,9 @@ class CharitableToolManager(GoogleServiceMixin, DriveOperationsMixin, SheetsOper
     ]
 
     def __init__(self):
-        super().__init__(Settings())
+        super().__init__(get_settings())
+        # (spreadsheet_id, worksheet_name) -> (sheet version, duplicate index)
+        self._duplicate_index_cache: dict[tuple[str, str], tuple[str, _DuplicateIndex]] = {}
 
     def _resolve_spreadsheet(self) -> tuple[str, str]:
         """Return (spreadsheet_id, worksheet_name) from settings."""
@@ -43,36 +362,81 @@ class CharitableToolManager(GoogleServiceMixin, DriveOperationsMixin, SheetsOper
     def _get_tax_year(self, donation_date: str) -> str:
         """Extract tax year from donation date."""
         try:
-            # Try to parse the date and extract year
-            date_formats = [
-                "%Y-%m-%d",
-                "%Y/%m/%d",
-                "%m/%d/%Y",
-                "%m-%d-%Y",
-                "%d/%m/%Y",
-                "%d-%m-%Y",
-                "%b %d, %Y",
-                "%B %d, %Y",
-            ]
-            
-            for fmt in date_formats:
-                try:
-                    parsed_date = datetime.strptime(donation_date.strip(), fmt)
-                    return str(parsed_date.year)
-                except ValueError:
-                    continue
-        except Exception:
-            pass
-        
+            tax_year = _parse_tax_year(donation_date)
+        except TypeError:
+            tax_year = None
         # Fallback to current year
-        return str(datetime.now().year)
+        return tax_year or str(datetime.now().year)
+
+    def _build_donation_row(
+        self,
+        donation_json: dict,
+        drive_file_id: str,
+        created_at: str,
+    ) -> tuple[str, str, list[Any]]:
+        """Build a ledger row for a donation; return (entry_id, tax_year, row)."""
+        donation_date = donation_json.get("donation_date", "")
+        tax_year = self._get_tax_year(donation_date)
+        entry_id = token_hex(4)
+        row = [
+            entry_id,
+            donation_json.get("organization_name", "Unknown"),
+            donation_date,
+            donation_json.get("amount", 0),
+            "Yes" if donation_json.get("tax_deductible", True) else "No",
+            donation_json.get("description", ""),
+            drive_file_id,
+            tax_year,
+            donation_json.get("confidence", 0.9),
+            created_at,
+        ]
+        return entry_id, tax_year, row
+
+    async def _read_ledger_for_append(
+        self,
+        spreadsheet_id: str,
+        worksheet_name: str,
+    ) -> tuple[dict | None, str | None]:
+        """Read the ledger ahead of an append, creating the worksheet if needed.
+        
+        A successful read proves the worksheet exists and doubles as the
+        duplicate-check data, so the common path costs one roundtrip.
+        
+        Returns:
+            (rows_result, error). rows_result is None when the worksheet exists
+            but could not be read, so duplicate checks should read it themselves.
+        """
+        rows_result = await self.get_all_rows(
+            spreadsheet_id=spreadsheet_id,
+            worksheet_name=worksheet_name
+        )
+        if rows_result["success"]:
+            return rows_result, None
+        
+        ensure_result = await self.ensure_worksheet_exists(
+            spreadsheet_id=spreadsheet_id,
+            worksheet_name=worksheet_name,
+            headers=self.EXPECTED_HEADERS
+        )
+        if not ensure_result.get("success"):
+            return None, ensure_result.get("error")
+        
+        if ensure_result.get("worksheet_exists"):
+            return None, None
+        
+        # A freshly created worksheet has no donations to compare against.
+        return {
+            "success": True,
+            "headers": list(self.EXPECTED_HEADERS),
+            "rows": [],
+        }, None
 
     async def upload_receipt_to_drive(
         self,
         local_file_path: str,
         tax_year: str = None,
         filename: str = None
-    ) -> str:
+    ) -> dict[str, Any]:
         """Upload receipt to Google Drive.
         
         Args:
@@ -81,23 +445,23 @@ class CharitableToolManager(GoogleServiceMixin, DriveOperationsMixin, SheetsOper
             filename: Optional custom filename
             
         Returns:
-            JSON string with success, file_id, error
+            Dict with success, file_id, error
         """
         try:
             # Use charitable folder, fall back to root
             drive_folder_id = self.settings.charitable_drive_folder_id or self.settings.drive_root_folder_id
             if not drive_folder_id:
-                return json.dumps({
+                return {
                     "success": False,
                     "error": "No drive folder configured. Set charitable_drive_folder_id or drive_root_folder_id in settings."
-                })
+                }
             folder_result = {"success": True, "folder_id": drive_folder_id}
             
             if not folder_result.get("success"):
-                return json.dumps({
+                return {
                     "success": False,
                     "error": f"Failed to get/create folder: {folder_result.get('error')}"
-                })
+                }
             
             folder_id = folder_result["folder_id"]
             
@@ -113,13 +477,10 @@ class CharitableToolManager(GoogleServiceMixin, DriveOperationsMixin, SheetsOper
                 upload_result["folder_id"] = folder_id
                 upload_result["tax_year"] = tax_year
             
-            return json.dumps(upload_result)
+            return upload_result
             
         except Exception as e:
-            return json.dumps({
-                "success": False,
-                "error": str(e)
-            })
+            return error_result(e)
 
     async def append_donation_to_ledger(
         self,
@@ -127,7 +488,8 @@ class CharitableToolManager(GoogleServiceMixin, DriveOperationsMixin, SheetsOper
         drive_file_id: str,
         check_duplicates: bool = True,
         force_append: bool = False,
-    ) -> str:
+        created_at: str | None = None,
+    ) -> dict[str, Any]:
         """Append donation to charitable ledger.
         
         Args:
@@ -135,72 +497,54 @@ class CharitableToolManager(GoogleServiceMixin, DriveOperationsMixin, SheetsOper
             drive_file_id: Google Drive file ID of uploaded receipt
             check_duplicates: Whether to check for duplicates
             force_append: Whether to force append even if duplicate found
+            created_at: Optional ISO timestamp for the row; defaults to now
             
         Returns:
-            JSON string with success, entry_id, error
+            Dict with success, entry_id, error
         """
         try:
-            # Extract data
-            organization_name = donation_json.get("organization_name", "Unknown")
-            donation_date = donation_json.get("donation_date", "")
-            amount = donation_json.get("amount", 0)
-            tax_deductible = donation_json.get("tax_deductible", True)
-            description = donation_json.get("description", "")
-            confidence = donation_json.get("confidence", 0.9)
-            
-            # Calculate tax year
-            tax_year = self._get_tax_year(donation_date)
-            
             # Resolve spreadsheet and worksheet from settings
             spreadsheet_id, worksheet_name = self._resolve_spreadsheet()
             
             if not spreadsheet_id:
-                return json.dumps({
+                return {
                     "success": False,
                     "error": "No spreadsheet ID configured. Set charitable_spreadsheet_id in MCP server settings."
-                })
-            
-            ensure_result = await self.ensure_worksheet_exists(
-                spreadsheet_id=spreadsheet_id,
-                worksheet_name=worksheet_name,
-                headers=self.EXPECTED_HEADERS
-            )
+                }
             
-            if not ensure_result.get("success"):
-                return json.dumps({
+            rows_result, ensure_error = await self._read_ledger_for_append(spreadsheet_id, worksheet_name)
+            if ensure_error:
+                return {
                     "success": False,
-                    "error": f"Failed to ensure worksheet: {ensure_result.get('error')}"
-                })
+                    "error": f"Failed to ensure worksheet: {ensure_error}"
+                }
+            
+            cache_key = (spreadsheet_id, worksheet_name)
             
             # Check for duplicates if requested
             if check_duplicates and not force_append:
-                duplicate_check = await self.check_for_duplicates(donation_json)
+                duplicate_check = await self.check_for_duplicates(
+                    donation_json,
+                    prefetched_rows=rows_result,
+                    prefetched_key=cache_key,
+                )
                 
                 if duplicate_check.get("is_duplicate"):
-                    return json.dumps({
+                    return {
                         "success": False,
                         "error": "Duplicate donation detected",
                         "duplicate_check": duplicate_check,
-                    })
+                    }
             
-            # Generate entry ID
-            entry_id = str(uuid.uuid4())[:8]
-            
-            # Prepare row data
-            row_data = [
-                entry_id,
-                organization_name,
-                donation_date,
-                amount,
-                "Yes" if tax_deductible else "No",
-                description,
+            entry_id, tax_year, row_data = self._build_donation_row(
+                donation_json,
                 drive_file_id,
-                tax_year,
-                confidence,
-                datetime.now().isoformat(),
-            ]
+                created_at or datetime.now().isoformat(timespec="seconds"),
+            )
             
             # Append to sheet
+            cached_rows = self._rows_cache.get(cache_key)
+            version_before = cached_rows[0] if cached_rows else None
             append_result = await self.append_row(
                 spreadsheet_id=spreadsheet_id,
                 worksheet_name=worksheet_name,
@@ -208,132 +552,270 @@ class CharitableToolManager(GoogleServiceMixin, DriveOperationsMixin, SheetsOper
             )
             
             if not append_result.get("success"):
-                return json.dumps({
+                return {
                     "success": False,
                     "error": f"Failed to append to sheet: {append_result.get('error')}"
-                })
+                }
+            self._extend_duplicate_index(cache_key, version_before, row_data)
             
-            return json.dumps({
+            return {
                 "success": True,
                 "entry_id": entry_id,
                 "tax_year": tax_year,
-            })
+            }
             
         except Exception as e:
-            return json.dumps({
-                "success": False,
-                "error": str(e)
-            })
+            return error_result(e)
 
-    async def check_for_duplicates(
+    async def append_donations_batch(
         self,
-        donation_json: dict,
-        fuzzy_days: int = 3
-    ) -> dict:
-        """Check for duplicate donations in the ledger.
+        donations: list[dict],
+        check_duplicates: bool = True,
+        force_append: bool = False,
+        fuzzy_days: int = 3,
+        max_batch: int = 500,
+    ) -> dict[str, Any]:
+        """Append several donations with one ledger read and batched Sheets appends.
+        
+        Duplicates are checked in memory against the ledger plus the rows
+        already accepted from this batch. Every row shares one created_at.
         
         Args:
-            donation_json: Donation data to check
+            donations: Items with donation_json and drive_file_id
+            check_duplicates: Whether to check each donation for duplicates
+            force_append: Whether to append even if a duplicate is found
             fuzzy_days: Number of days to allow for fuzzy date matching
+            max_batch: Maximum rows sent per Sheets append request
             
         Returns:
-            Dict with is_duplicate, potential_duplicates, recommendation
+            Dict with success, imported_count, failed_count, total_amount, results
         """
         try:
-            # Get all existing entries
             spreadsheet_id, worksheet_name = self._resolve_spreadsheet()
-            rows_result = await self.get_all_rows(
-                spreadsheet_id=spreadsheet_id,
-                worksheet_name=worksheet_name
-            )
-            
-            if not rows_result.get("success"):
-                # If we can't read the sheet, assume not duplicate
-                return {
-                    "is_duplicate": False,
-                    "potential_duplicates": [],
-                    "recommendation": "import",
-                }
-            
-            headers = rows_result.get("headers", [])
-            rows = rows_result.get("rows", [])
-            
-            if not headers or not rows:
+            if not spreadsheet_id:
                 return {
-                    "is_duplicate": False,
-                    "potential_duplicates": [],
-                    "recommendation": "import",
+                    "success": False,
+                    "error": "No spreadsheet ID configured. Set charitable_spreadsheet_id in MCP server settings.",
+                    "imported_count": 0,
+                    "failed_count": len(donations),
+                    "total_amount": 0.0,
+                    "results": [],
                 }
             
-            # Find column indices
-            try:
-                org_idx = headers.index("organization_name")
-                date_idx = headers.index("donation_date")
-                amount_idx = headers.index("amount")
-            except ValueError:
-                # Headers don't match expected format
+            rows_result, ensure_error = await self._read_ledger_for_append(spreadsheet_id, worksheet_name)
+            if ensure_error:
                 return {
-                    "is_duplicate": False,
-                    "potential_duplicates": [],
-                    "recommendation": "import",
+                    "success": False,
+                    "error": f"Failed to ensure worksheet: {ensure_error}",
+                    "imported_count": 0,
+                    "failed_count": len(donations),
+                    "total_amount": 0.0,
+                    "results": [],
                 }
+            if rows_result is None and check_duplicates and not force_append:
+                # The worksheet exists but the first read failed; never check against nothing.
+                rows_result = await self.get_all_rows(
+                    spreadsheet_id=spreadsheet_id,
+                    worksheet_name=worksheet_name
+                )
+                if not rows_result["success"]:
+                    return {
+                        "success": False,
+                        "error": f"Failed to read ledger for duplicate checks: {rows_result.get('error')}",
+                        "imported_count": 0,
+                        "failed_count": len(donations),
+                        "total_amount": 0.0,
+                        "results": [],
+                    }
+            # Index the ledger once; accepted rows join it for intra-batch checks.
+            duplicate_index = _DuplicateIndex()
+            if rows_result is not None and rows_result["headers"]:
+                duplicate_index = _DuplicateIndex.from_rows(rows_result["headers"], rows_result["rows"])
             
-            # Extract data to check
-            new_org = donation_json.get("organization_name", "").lower().strip()
-            new_date = donation_json.get("donation_date", "")
-            new_amount = float(donation_json.get("amount", 0))
-            
-            potential_duplicates = []
+            created_at = datetime.now().isoformat(timespec="seconds")
+            results: list[dict[str, Any]] = []
+            pending_rows: list[list[Any]] = []
+            pending_meta: list[dict[str, Any]] = []
             
-            for row in rows:
-                if len(row) < max(org_idx, date_idx, amount_idx) + 1:
+            for item in donations:
+                donation_json = item.get("donation_json") or {}
+                drive_file_id = item.get("drive_file_id", "")
+                raw_amount = donation_json.get("amount", 0)
+                amount = _to_float(raw_amount or 0)
+                if amount is None:
+                    results.append({
+                        "status": "failed",
+                        "success": False,
+                        "error": f"Invalid donation amount: {raw_amount!r}",
+                        "drive_file_id": drive_file_id,
+                    })
                     continue
                 
-                existing_org = row[org_idx].lower().strip()
-                existing_date = row[date_idx]
-                try:
-                    existing_amount = float(row[amount_idx])
-                except (ValueError, TypeError):
-                    continue
+                if check_duplicates and not force_append and duplicate_index is not None:
+                    duplicate_check = _duplicate_result(duplicate_index.find(donation_json, fuzzy_days))
+                    if duplicate_check["is_duplicate"]:
+                        results.append({
+                            "status": "duplicate",
+                            "success": False,
+                            "error": "Duplicate donation detected",
+                            "drive_file_id": drive_file_id,
+                            "duplicate_check": duplicate_check,
+                        })
+                        continue
                 
-                # Check for exact match on organization and amount
-                if existing_org == new_org and abs(existing_amount - new_amount) < 0.01:
-                    # Check date with fuzzy matching
-                    date_match = False
-                    
-                    if existing_date == new_date:
-                        date_match = True
+                entry_id, tax_year, row = self._build_donation_row(donation_json, drive_file_id, created_at)
+                pending_rows.append(row)
+                pending_meta.append({
+                    "entry_id": entry_id,
+                    "tax_year": tax_year,
+                    "drive_file_id": drive_file_id,
+                    "amount": amount,
+                })
+                if duplicate_index is not None:
+                    duplicate_index.add(str(row[1]), str(row[2]), amount)
+            
+            total_amount = 0.0
+            # One values.append per max_batch rows keeps each request within Sheets limits.
+            batch_size = max_batch if isinstance(max_batch, int) and max_batch > 0 else 500
+            for start in range(0, len(pending_rows), batch_size):
+                append_result = await self.append_rows(
+                    spreadsheet_id=spreadsheet_id,
+                    worksheet_name=worksheet_name,
+                    rows_data=pending_rows[start:start + batch_size],
+                )
+                for meta in pending_meta[start:start + batch_size]:
+                    if append_result.get("success"):
+                        total_amount += meta["amount"]
+                        results.append({
+                            "status": "imported",
+                            "success": True,
+                            "entry_id": meta["entry_id"],
+                            "tax_year": meta["tax_year"],
+                            "drive_file_id": meta["drive_file_id"],
+                        })
                     else:
-                        # Try to parse dates and check difference
-                        try:
-                            from vivian_mcp.tools.hsa_tools import parse_date, days_between
-                            days_diff = days_between(existing_date, new_date)
-                            if days_diff is not None and days_diff <= fuzzy_days:
-                                date_match = True
-                        except Exception:
-                            pass
-                    
-                    if date_match:
-                        potential_duplicates.append({
-                            "organization": row[org_idx],
-                            "date": existing_date,
-                            "amount": existing_amount,
-                            "match_type": "exact" if existing_date == new_date else "fuzzy_date",
-                            "days_difference": 0 if existing_date == new_date else days_between(existing_date, new_date),
+                        results.append({
+                            "status": "failed",
+                            "success": False,
+                            "error": f"Failed to append to sheet: {append_result.get('error')}",
+                            "drive_file_id": meta["drive_file_id"],
                         })
             
-            is_duplicate = len(potential_duplicates) > 0
-            
-            if is_duplicate:
-                recommendation = "review"
-            else:
-                recommendation = "import"
+            imported_count = sum(1 for r in results if r["status"] == "imported")
+            return {
+                "success": imported_count > 0,
+                "imported_count": imported_count,
+                "failed_count": len(results) - imported_count,
+                "total_amount": round(total_amount, 2),
+                "results": results,
+            }
             
+        except Exception as e:
             return {
-                "is_duplicate": is_duplicate,
-                "potential_duplicates": potential_duplicates,
-                "recommendation": recommendation,
+                **error_result(e),
+                "imported_count": 0,
+                "failed_count": len(donations),
+                "total_amount": 0.0,
+                "results": [],
             }
+
+    def _get_duplicate_index(
+        self,
+        cache_key: tuple[str, str] | None,
+        headers: list[Any],
+        rows: list[list[Any]],
+    ) -> _DuplicateIndex | None:
+        """Return the duplicate index for rows, reusing it while the sheet version is unchanged."""
+        version = None
+        if cache_key is not None:
+            cached_rows = self._rows_cache.get(cache_key)
+            version = cached_rows[0] if cached_rows else None
+        if version is not None:
+            cached = self._duplicate_index_cache.get(cache_key)
+            if cached is not None and cached[0] == version:
+                return cached[1]
+        
+        index = _DuplicateIndex.from_rows(headers, rows)
+        if version is not None and index is not None:
+            self._duplicate_index_cache[cache_key] = (version, index)
+        return index
+
+    def _extend_duplicate_index(
+        self,
+        cache_key: tuple[str, str],
+        version_before: str | None,
+        row_data: list[Any],
+    ) -> None:
+        """Add a just-appended row to the cached duplicate index instead of rebuilding it.
+        
+        Only an index that matched the rows cache before the append is carried
+        over, and it is re-stamped with the rows cache's post-append version.
+        """
+        cached = self._duplicate_index_cache.get(cache_key)
+        cached_rows = self._rows_cache.get(cache_key)
+        if (
+            cached is None
+            or version_before is None
+            or cached[0] != version_before
+            or cached_rows is None
+            or cached_rows[0] == version_before
+        ):
+            self._duplicate_index_cache.pop(cache_key, None)
+            return
+        index = cached[1]
+        amount = _to_float(row_data[3] or 0)
+        if amount is not None:
+            index.add(str(row_data[1]), str(row_data[2]), amount)
+        self._duplicate_index_cache[cache_key] = (cached_rows[0], index)
+
+    async def check_for_duplicates(
+        self,
+        donation_json: dict,
+        fuzzy_days: int = 3,
+        prefetched_rows: dict | None = None,
+        prefetched_key: tuple[str, str] | None = None,
+    ) -> dict:
+        """Check for duplicate donations in the ledger.
+        
+        Args:
+            donation_json: Donation data to check
+            fuzzy_days: Number of days to allow for fuzzy date matching
+            prefetched_rows: Optional get_all_rows result to check against
+                instead of reading the ledger again
+            prefetched_key: (spreadsheet_id, worksheet_name) prefetched_rows
+                were read from, so their duplicate index can be cached
+            
+        Returns:
+            Dict with is_duplicate, potential_duplicates, recommendation
+        """
+        try:
+            # Get all existing entries
+            rows_result = prefetched_rows
+            cache_key = prefetched_key if prefetched_rows is not None else None
+            if rows_result is None:
+                spreadsheet_id, worksheet_name = self._resolve_spreadsheet()
+                rows_result = await self.get_all_rows(
+                    spreadsheet_id=spreadsheet_id,
+                    worksheet_name=worksheet_name
+                )
+                cache_key = (spreadsheet_id, worksheet_name)
+            
+            if not rows_result["success"]:
+                # If we can't read the sheet, assume not duplicate
+                return _duplicate_result([])
+            
+            headers = rows_result["headers"]
+            rows = rows_result["rows"]
+            
+            if not headers or not rows:
+                return _duplicate_result([])
+            
+            index = self._get_duplicate_index(cache_key, headers, rows)
+            if index is None:
+                # Headers don't match expected format
+                return _duplicate_result([])
+            
+            return _duplicate_result(index.find(donation_json, fuzzy_days))
             
         except Exception as e:
             # If duplicate check fails, return empty result (allow import)
@@ -341,7 +823,7 @@ class CharitableToolManager(GoogleServiceMixin, DriveOperationsMixin, SheetsOper
                 "is_duplicate": False,
                 "potential_duplicates": [],
                 "recommendation": "import",
-                "check_error": str(e),
+                "check_error": error_result(e)["error"],
             }
 
     async def read_donation_entries(
@@ -351,7 +833,7 @@ class CharitableToolManager(GoogleServiceMixin, DriveOperationsMixin, SheetsOper
         tax_deductible: bool | None = None,
         limit: int = 1000,
         column_filters: list[dict[str, Any]] | None = None,
-    ) -> str:
+    ) -> dict[str, Any]:
         """Read charitable donation ledger entries with optional filters.
 
         Args:
@@ -362,7 +844,7 @@ class CharitableToolManager(GoogleServiceMixin, DriveOperationsMixin, SheetsOper
             column_filters: Optional list of ANDed column-level filters
 
         Returns:
-            JSON string with entries and summary totals.
+            Dict with entries and summary totals.
         """
         try:
             spreadsheet_id, worksheet_name = self._resolve_spreadsheet()
@@ -370,30 +852,24 @@ class CharitableToolManager(GoogleServiceMixin, DriveOperationsMixin, SheetsOper
                 spreadsheet_id=spreadsheet_id,
                 worksheet_name=worksheet_name,
             )
-            if not rows_result.get("success"):
-                return json.dumps(
-                    {
-                        "success": False,
-                        "error": rows_result.get("error", "Failed to read ledger"),
-                    }
-                )
+            if not rows_result["success"]:
+                return {
+                    "success": False,
+                    "error": rows_result.get("error", "Failed to read ledger"),
+                }
 
-            headers = rows_result.get("headers", [])
-            rows = rows_result.get("rows", [])
-            filter_result = apply_column_filters(
-                headers=headers,
-                rows=rows,
-                column_filters=column_filters,
-            )
-            if not filter_result.get("success"):
-                return json.dumps(
-                    {
-                        "success": False,
-                        "error": filter_result.get("error", "Invalid column filters"),
-                        "available_columns": filter_result.get("available_columns", []),
-                    }
+            headers = rows_result["headers"]
+            rows = rows_result["rows"]
+            if column_filters:
+                filter_result = apply_column_filters(
+                    headers=headers,
+                    rows=rows,
+                    column_filters=column_filters,
                 )
-            rows = filter_result.get("rows", [])
+                if not filter_result["success"]:
+                    # Filter errors already carry success/error/available_columns.
+                    return filter_result
+                rows = filter_result["rows"]
 
             if not headers:
                 empty_summary = {
@@ -406,46 +882,22 @@ class CharitableToolManager(GoogleServiceMixin, DriveOperationsMixin, SheetsOper
                     "by_organization": {},
                     "by_year": {},
                 }
-                return json.dumps(
-                    {
-                        "success": True,
-                        "tax_year": str(tax_year).strip() if tax_year is not None else None,
-                        "entries": [],
-                        "summary": empty_summary,
-                        "total": 0.0,
-                        "tax_deductible_total": 0.0,
-                        "by_organization": {},
-                        "by_year": {},
-                    }
-                )
+                return {
+                    "success": True,
+                    "tax_year": str(tax_year).strip() if tax_year is not None else None,
+                    "entries": [],
+                    "summary": empty_summary,
+                }
 
-            header_map = {str(header).strip().lower(): idx for idx, header in enumerate(headers)}
+            header_map = _index_headers(headers)
             required_columns = ("organization_name", "amount")
             missing_columns = [col for col in required_columns if col not in header_map]
             if missing_columns:
-                return json.dumps(
-                    {
-                        "success": False,
-                        "error": f"Ledger missing required columns: {', '.join(missing_columns)}",
-                        "available_columns": sorted(header_map.keys()),
-                    }
-                )
-
-            def value_at(row: list[Any], column_name: str, default: Any = "") -> Any:
-                idx = header_map.get(column_name)
-                if idx is None or idx >= len(row):
-                    return default
-                return row[idx]
-
-            def parse_amount(value: Any) -> float:
-                try:
-                    return float(value)
-                except (TypeError, ValueError):
-                    return 0.0
-
-            def parse_bool(value: Any) -> bool:
-                normalized = str(value or "").strip().lower()
-                return normalized in {"yes", "true", "1", "y"}
+                return {
+                    "success": False,
+                    "error": f"Ledger missing required columns: {', '.join(missing_columns)}",
+                    "available_columns": sorted(header_map.keys()),
+                }
 
             normalized_tax_year = None
             if tax_year is not None and str(tax_year).strip():
@@ -456,100 +908,177 @@ class CharitableToolManager(GoogleServiceMixin, DriveOperationsMixin, SheetsOper
                 limit = 1000
 
             entries: list[dict[str, Any]] = []
-            total_amount = 0.0
-            deductible_total = 0.0
-            non_deductible_total = 0.0
-            count_deductible = 0
-            count_non_deductible = 0
-            by_organization: dict[str, dict[str, float | int]] = {}
-            by_year: dict[str, dict[str, float | int]] = {}
+            amounts: list[float] = []
+            orgs: list[str] = []
+            years: list[str] = []
+            deductible: list[bool] = []
+
+            filter_deductible = isinstance(tax_deductible, bool)
+
+            # Bind column positions to locals; absent columns get an index no
+            # row reaches, so they read as blank.
+            id_idx = header_map.get("id", _ABSENT_COLUMN)
+            org_idx = header_map["organization_name"]
+            date_idx = header_map.get("donation_date", _ABSENT_COLUMN)
+            amount_idx = header_map["amount"]
+            deductible_idx = header_map.get("tax_deductible", _ABSENT_COLUMN)
+            description_idx = header_map.get("description", _ABSENT_COLUMN)
+            drive_file_idx = header_map.get("drive_file_id", _ABSENT_COLUMN)
+            tax_year_idx = header_map.get("tax_year", _ABSENT_COLUMN)
+            confidence_idx = header_map.get("confidence", _ABSENT_COLUMN)
+            created_at_idx = header_map.get("created_at", _ABSENT_COLUMN)
 
             for row in rows:
-                org_name = str(value_at(row, "organization_name", "") or "").strip()
-                row_tax_year = str(value_at(row, "tax_year", "") or "").strip()
-                row_donation_date = str(value_at(row, "donation_date", "") or "").strip()
-                if not row_tax_year and row_donation_date:
-                    row_tax_year = self._get_tax_year(row_donation_date)
-                amount = parse_amount(value_at(row, "amount", 0))
-                is_deductible = parse_bool(value_at(row, "tax_deductible", ""))
-
-                if normalized_tax_year and row_tax_year != normalized_tax_year:
+                width = len(row)
+
+                # Cheapest predicates first; rejected rows skip the amount parse
+                # and the remaining column copies.
+                row_tax_year = str(row[tax_year_idx] or "").strip() if tax_year_idx < width else ""
+                if normalized_tax_year and row_tax_year and row_tax_year != normalized_tax_year:
                     continue
+                row_donation_date = str(row[date_idx] or "").strip() if date_idx < width else ""
+                if not row_tax_year:
+                    # Only legacy rows lack a stored tax year; derive it from the date.
+                    if row_donation_date:
+                        row_tax_year = self._get_tax_year(row_donation_date)
+                    if normalized_tax_year and row_tax_year != normalized_tax_year:
+                        continue
+
+                org_name = str(row[org_idx] or "").strip() if org_idx < width else ""
                 if normalized_org and normalized_org not in org_name.lower():
                     continue
-                if isinstance(tax_deductible, bool) and is_deductible != tax_deductible:
+
+                is_deductible = _is_truthy(row[deductible_idx]) if deductible_idx < width else False
+                if filter_deductible and is_deductible != tax_deductible:
                     continue
 
+                amount = _to_float(row[amount_idx]) if amount_idx < width else None
+                if amount is None:
+                    amount = 0.0
                 entry = {
-                    "id": str(value_at(row, "id", "") or ""),
+                    "id": str(row[id_idx] or "") if id_idx < width else "",
                     "organization_name": org_name,
                     "donation_date": row_donation_date,
                     "amount": amount,
                     "tax_deductible": is_deductible,
-                    "description": str(value_at(row, "description", "") or ""),
-                    "drive_file_id": str(value_at(row, "drive_file_id", "") or ""),
+                    "description": str(row[description_idx] or "") if description_idx < width else "",
+                    "drive_file_id": str(row[drive_file_idx] or "") if drive_file_idx < width else "",
                     "tax_year": row_tax_year,
-                    "confidence": str(value_at(row, "confidence", "") or ""),
-                    "created_at": str(value_at(row, "created_at", "") or ""),
+                    "confidence": str(row[confidence_idx] or "") if confidence_idx < width else "",
+                    "created_at": str(row[created_at_idx] or "") if created_at_idx < width else "",
                 }
                 entries.append(entry)
-
-                total_amount += amount
-                if is_deductible:
-                    deductible_total += amount
-                    count_deductible += 1
-                else:
-                    non_deductible_total += amount
-                    count_non_deductible += 1
-
-                if org_name not in by_organization:
-                    by_organization[org_name] = {"total": 0.0, "count": 0}
-                by_organization[org_name]["total"] += amount
-                by_organization[org_name]["count"] += 1
-
-                if row_tax_year not in by_year:
-                    by_year[row_tax_year] = {"total": 0.0, "count": 0}
-                by_year[row_tax_year]["total"] += amount
-                by_year[row_tax_year]["count"] += 1
+                amounts.append(amount)
+                orgs.append(org_name)
+                years.append(row_tax_year)
+                deductible.append(is_deductible)
 
                 if len(entries) >= limit:
                     break
 
-            summary = {
-                "total_entries": len(entries),
-                "total_amount": round(total_amount, 2),
-                "tax_deductible_total": round(deductible_total, 2),
-                "non_deductible_total": round(non_deductible_total, 2),
-                "count_tax_deductible": count_deductible,
-                "count_non_deductible": count_non_deductible,
-                "by_organization": by_organization,
-                "by_year": by_year,
+            summary = {"total_entries": len(entries), **_summarize(amounts, orgs, years, deductible)}
+            return {
+                "success": True,
+                "tax_year": normalized_tax_year,
+                "entries": entries,
+                "summary": summary,
             }
-            return json.dumps(
-                {
-                    "success": True,
-                    "tax_year": normalized_tax_year,
-                    "entries": entries,
-                    "summary": summary,
-                    "total": summary["total_amount"],
-                    "tax_deductible_total": summary["tax_deductible_total"],
-                    "by_organization": summary["by_organization"],
-                    "by_year": summary["by_year"],
-                }
-            )
         except Exception as e:
-            return json.dumps(
+            return error_result(e)
+
+    def _summarize_ledger_columns(
+        self,
+        headers: list[Any],
+        columns: list[list[Any]],
+        tax_year: str | int | None = None,
+        column_filters: list[dict[str, Any]] | None = None,
+    ) -> dict[str, Any]:
+        """Summarize column-major ledger data for one tax year / filter combination."""
+        normalized_tax_year = None
+        if tax_year is not None and str(tax_year).strip():
+            normalized_tax_year = str(tax_year).strip()
+
+        summary_indices = _summary_column_indices(tuple(headers)) if headers else None
+
+        # Fold the tax year into the column filters so rows are walked once. It
+        # is only added when the ledger has a tax_year column; otherwise the
+        # ledger-format error below is reported rather than an unknown column.
+        effective_filters = list(column_filters or [])
+        if normalized_tax_year and summary_indices is not None:
+            effective_filters.append(
                 {
-                    "success": False,
-                    "error": str(e),
+                    "column": "tax_year",
+                    "operator": "equals",
+                    "value": normalized_tax_year,
+                    "case_sensitive": True,
                 }
             )
 
+        if effective_filters:
+            filter_result = apply_column_filters_to_columns(
+                headers=headers,
+                columns=columns,
+                column_filters=effective_filters,
+            )
+            if not filter_result["success"]:
+                # Filter errors already carry success/error/available_columns.
+                return filter_result
+            columns = filter_result["columns"]
+        
+        if not headers or not columns or not columns[0]:
+            return {
+                "success": True,
+                "tax_year": normalized_tax_year,
+                "total": 0,
+                "tax_deductible_total": 0,
+                "by_organization": {},
+                "by_year": {},
+            }
+        
+        if summary_indices is None:
+            return {
+                "success": False,
+                "error": "Ledger headers don't match expected format"
+            }
+        org_idx, amount_idx, tax_deductible_idx, tax_year_idx = summary_indices
+        
+        # Keep rows with a parseable amount, then reduce the columns in one pass
+        amounts: list[float] = []
+        orgs: list[str] = []
+        years: list[str] = []
+        deductible: list[bool] = []
+        
+        for org, amount_value, deductible_value, year in zip(
+            columns[org_idx],
+            columns[amount_idx],
+            columns[tax_deductible_idx],
+            columns[tax_year_idx],
+        ):
+            amount = _to_float(amount_value)
+            if amount is None:
+                continue
+            
+            amounts.append(amount)
+            orgs.append(org)
+            years.append(year)
+            deductible.append(_is_truthy(deductible_value))
+        
+        summary = _summarize(amounts, orgs, years, deductible)
+        
+        return {
+            "success": True,
+            "tax_year": normalized_tax_year,
+            "total": summary["total_amount"],
+            "tax_deductible_total": summary["tax_deductible_total"],
+            "by_organization": summary["by_organization"],
+            "by_year": summary["by_year"],
+        }
+
     async def get_donation_summary(
         self,
         tax_year: str = None,
         column_filters: list[dict[str, Any]] | None = None,
-    ) -> str:
+    ) -> dict[str, Any]:
         """Get summary of charitable donations.
         
         Args:
@@ -557,109 +1086,80 @@ class CharitableToolManager(GoogleServiceMixin, DriveOperationsMixin, SheetsOper
             column_filters: Optional list of column-level filters (ANDed)
             
         Returns:
-            JSON string with total, tax_deductible_total, by_organization, error
+            Dict with total, tax_deductible_total, by_organization, error
         """
         try:
-            # Get all entries
+            # Read the ledger column-major so the reduction consumes whole columns
             spreadsheet_id, worksheet_name = self._resolve_spreadsheet()
-            rows_result = await self.get_all_rows(
+            columns_result = await self.get_all_columns(
                 spreadsheet_id=spreadsheet_id,
                 worksheet_name=worksheet_name
             )
             
-            if not rows_result.get("success"):
-                return json.dumps({
+            if not columns_result["success"]:
+                return {
                     "success": False,
-                    "error": rows_result.get("error", "Failed to read ledger")
-                })
+                    "error": columns_result.get("error", "Failed to read ledger")
+                }
             
-            headers = rows_result.get("headers", [])
-            rows = rows_result.get("rows", [])
-            filter_result = apply_column_filters(
-                headers=headers,
-                rows=rows,
-                column_filters=column_filters,
+            return self._summarize_ledger_columns(
+                columns_result["headers"],
+                columns_result["columns"],
+                tax_year,
+                column_filters,
             )
-            if not filter_result.get("success"):
-                return json.dumps({
-                    "success": False,
-                    "error": filter_result.get("error", "Invalid column filters"),
-                    "available_columns": filter_result.get("available_columns", []),
-                })
-            rows = filter_result.get("rows", [])
             
-            if not headers or not rows:
-                return json.dumps({
-                    "success": True,
-                    "total": 0,
-                    "tax_deductible_total": 0,
-                    "by_organization": {},
-                    "by_year": {},
-                })
+        except Exception as e:
+            return error_result(e)
+
+    async def get_donation_summary_batch(
+        self,
+        tax_years: list[str | int],
+        column_filters: list[dict[str, Any]] | None = None,
+    ) -> dict[str, Any]:
+        """Get charitable donation summaries for several tax years from one ledger read.
+        
+        Args:
+            tax_years: Tax years to summarize (e.g., ["2024", "2025"])
+            column_filters: Optional list of column-level filters (ANDed) applied to every year
             
-            # Find column indices
-            try:
-                org_idx = headers.index("organization_name")
-                amount_idx = headers.index("amount")
-                tax_deductible_idx = headers.index("tax_deductible")
-                tax_year_idx = headers.index("tax_year")
-            except ValueError:
-                return json.dumps({
-                    "success": False,
-                    "error": "Ledger headers don't match expected format"
-                })
+        Returns:
+            Dict with success, summaries (one get_donation_summary payload per year), error
+        """
+        try:
+            spreadsheet_id, worksheet_name = self._resolve_spreadsheet()
+            columns_result = await self.get_all_columns(
+                spreadsheet_id=spreadsheet_id,
+                worksheet_name=worksheet_name
+            )
             
-            # Calculate totals
-            total = 0.0
-            tax_deductible_total = 0.0
-            by_organization = {}
-            by_year = {}
+            if not columns_result["success"]:
+                return {
+                    "success": False,
+                    "error": columns_result.get("error", "Failed to read ledger")
+                }
             
-            for row in rows:
-                if len(row) < max(org_idx, amount_idx, tax_deductible_idx, tax_year_idx) + 1:
-                    continue
-                
-                try:
-                    amount = float(row[amount_idx])
-                except (ValueError, TypeError):
-                    continue
-                
-                org = row[org_idx]
-                is_deductible = row[tax_deductible_idx].lower() in ("yes", "true", "1")
-                year = row[tax_year_idx]
-                
-                # Filter by tax year if specified
-                if tax_year and year != tax_year:
-                    continue
-                
-                total += amount
-                
-                if is_deductible:
-                    tax_deductible_total += amount
-                
-                # Track by organization
-                if org not in by_organization:
-                    by_organization[org] = {"total": 0.0, "count": 0}
-                by_organization[org]["total"] += amount
-                by_organization[org]["count"] += 1
-                
-                # Track by year
-                if year not in by_year:
-                    by_year[year] = {"total": 0.0, "count": 0}
-                by_year[year]["total"] += amount
-                by_year[year]["count"] += 1
+            headers = columns_result["headers"]
+            columns = columns_result["columns"]
+            # The caller's filters are shared by every year; validate and apply them once.
+            if column_filters:
+                filter_result = apply_column_filters_to_columns(
+                    headers=headers,
+                    columns=columns,
+                    column_filters=column_filters,
+                )
+                if not filter_result["success"]:
+                    # Filter errors already carry success/error/available_columns.
+                    return filter_result
+                columns = filter_result["columns"]
             
-            return json.dumps({
+            return {
                 "success": True,
-                "tax_year": tax_year,
-                "total": round(total, 2),
-                "tax_deductible_total": round(tax_deductible_total, 2),
-                "by_organization": by_organization,
-                "by_year": by_year,
-            })
+                "summaries": [
+                    self._summarize_ledger_columns(headers, columns, tax_year)
+                    for tax_year in tax_years
+                ],
+            }
             
         except Exception as e:
-            return json.dumps({
-                "success": False,
-                "error": str(e)
-            })
+            return error_result(e)
@@ -1,150 +1,239 @@
 """Google Drive tools for MCP server."""
 
-import json
-from datetime import datetime
-from pathlib import Path
+import asyncio
+from typing import Any, Optional
 
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
-from google.oauth2.credentials import Credentials
+from vivian_mcp.config import get_settings
+from vivian_mcp.tools.google_common import (
+    error_result,
+    execute_request,
+    get_credentials,
+    request_http,
+    shared_service,
+    upload_local_file,
+)
 
-from vivian_mcp.config import Settings
+
+# Most calls the Drive API accepts in a single batch request.
+_DRIVE_BATCH_LIMIT = 100
 
 
 class DriveToolManager:
     """Manages Google Drive operations."""
     
     def __init__(self):
-        self.settings = Settings()
+        self.settings = get_settings()
         self._drive_service = None
     
     def _get_drive_service(self):
         """Get Google Drive service."""
         if not self._drive_service:
-            creds = Credentials(
-                token=None,
-                refresh_token=self.settings.google_refresh_token,
-                token_uri="https://oauth2.googleapis.com/token",
-                client_id=self.settings.google_client_id,
-                client_secret=self.settings.google_client_secret,
-                scopes=[
-                    "https://www.googleapis.com/auth/drive",
-                    "https://www.googleapis.com/auth/spreadsheets"
-                ]
-            )
-            self._drive_service = build("drive", "v3", credentials=creds)
+            self._drive_service = shared_service("drive", "v3", get_credentials(self.settings))
         return self._drive_service
     
-    def _get_folder_id_for_status(self, status: str) -> str:
-        """Get the appropriate folder ID based on reimbursement status."""
-        folder_map = {
+    def _status_folder_ids(self) -> dict[str, str]:
+        """Map each known reimbursement status to its configured folder ID."""
+        return {
             "reimbursed": self.settings.reimbursed_folder_id,
             "unreimbursed": self.settings.unreimbursed_folder_id,
             "not_hsa_eligible": self.settings.not_eligible_folder_id
         }
-        return folder_map.get(status, self.settings.unreimbursed_folder_id)
     
-    async def upload_receipt(
+    def _get_folder_id_for_status(self, status: str) -> str:
+        """Get the appropriate folder ID based on reimbursement status."""
+        return self._status_folder_ids().get(status, self.settings.unreimbursed_folder_id)
+    
+    def _upload_one_sync(
         self,
         local_file_path: str,
         status: str,
         filename: str = None
-    ) -> str:
-        """Upload receipt to Google Drive."""
+    ) -> dict[str, Any]:
+        """Upload one receipt to Google Drive, blocking until the upload finishes."""
         try:
             service = self._get_drive_service()
-            file_path = Path(local_file_path)
-            
-            if not file_path.exists():
-                return json.dumps({
-                    "success": False,
-                    "error": f"File not found: {local_file_path}"
-                })
-            
-            # Use custom filename or original
-            upload_filename = filename or file_path.name
-            
-            # Add timestamp to filename to avoid collisions
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            name_without_ext = Path(upload_filename).stem
-            ext = Path(upload_filename).suffix
-            final_filename = f"{name_without_ext}_{timestamp}{ext}"
-            
-            # Get folder ID based on status
-            folder_id = self._get_folder_id_for_status(status)
-            
-            # File metadata
-            file_metadata = {
-                "name": final_filename,
-                "parents": [folder_id] if folder_id else []
-            }
-            
-            # Upload file
-            media = MediaFileUpload(
-                str(file_path),
-                mimetype="application/pdf",
-                resumable=True
-            )
-            
-            file = service.files().create(
-                body=file_metadata,
-                media_body=media,
-                fields="id, name, webViewLink"
-            ).execute()
-            
-            return json.dumps({
-                "success": True,
-                "file_id": file.get("id"),
-                "filename": file.get("name"),
-                "web_view_link": file.get("webViewLink"),
-                "folder": status
-            })
-            
         except Exception as e:
-            return json.dumps({
-                "success": False,
-                "error": str(e)
-            })
+            return error_result(e)
+        result = upload_local_file(service, local_file_path, self._get_folder_id_for_status(status), filename)
+        if result["success"]:
+            result["folder"] = status
+        return result
+    
+    async def upload_receipt(
+        self,
+        local_file_path: str,
+        status: str,
+        filename: str = None
+    ) -> dict[str, Any]:
+        """Upload receipt to Google Drive."""
+        # Run the blocking upload off the event loop so other tool calls keep moving.
+        return await asyncio.to_thread(self._upload_one_sync, local_file_path, status, filename)
     
-    async def move_file(self, file_id: str, new_status: str) -> str:
-        """Move file to different folder based on status change."""
+    async def upload_receipts(
+        self,
+        paths: list[str],
+        status: str,
+        max_concurrency: int = 4
+    ) -> list[dict[str, Any]]:
+        """Upload several receipts concurrently, at most max_concurrency at a time.
+        
+        Results are returned in the same order as paths; a failed upload
+        yields an error payload without affecting the others.
+        """
+        # Build the shared service up front so worker threads don't race to create it.
+        self._get_drive_service()
+        sem = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def upload(path: str) -> dict[str, Any]:
+            async with sem:
+                return await asyncio.to_thread(self._upload_one_sync, path, status)
+        
+        outcomes = await asyncio.gather(*(upload(path) for path in paths), return_exceptions=True)
+        return [
+            error_result(outcome) if isinstance(outcome, BaseException) else outcome
+            for outcome in outcomes
+        ]
+    
+    async def move_file(
+        self,
+        file_id: str,
+        new_status: str,
+        old_status: Optional[str] = None
+    ) -> dict[str, Any]:
+        """Move file to different folder based on status change.
+        
+        When old_status is a known status, its folder is removed as the
+        parent directly instead of looking the file's parents up first.
+        """
         try:
             service = self._get_drive_service()
             
-            # Get current parents
-            file = service.files().get(
-                fileId=file_id,
-                fields="parents"
-            ).execute()
-            
-            current_parents = file.get("parents", [])
-            
             # Get new folder ID
             new_folder_id = self._get_folder_id_for_status(new_status)
             
             if not new_folder_id:
-                return json.dumps({
+                return {
                     "success": False,
                     "error": f"No folder configured for status: {new_status}"
-                })
+                }
+            
+            # Unknown statuses don't fall back to a default folder here; removing
+            # the wrong parent would leave the file in two folders.
+            old_folder_id = self._status_folder_ids().get(old_status) if old_status else None
+            if old_folder_id:
+                current_parents = [old_folder_id]
+            else:
+                # Get current parents
+                file = await asyncio.to_thread(
+                    execute_request,
+                    service.files().get(
+                        fileId=file_id,
+                        fields="parents"
+                    )
+                )
+                current_parents = file.get("parents", [])
             
             # Move file: add new parent, remove old parents
-            service.files().update(
-                fileId=file_id,
-                addParents=new_folder_id,
-                removeParents=",".join(current_parents),
-                fields="id, parents"
-            ).execute()
+            await asyncio.to_thread(
+                execute_request,
+                service.files().update(
+                    fileId=file_id,
+                    addParents=new_folder_id,
+                    removeParents=",".join(current_parents),
+                    fields="id"
+                )
+            )
             
-            return json.dumps({
+            return {
                 "success": True,
                 "file_id": file_id,
                 "new_status": new_status,
                 "new_folder_id": new_folder_id
-            })
+            }
+            
+        except Exception as e:
+            return error_result(e)
+    
+    @staticmethod
+    def _execute_batch(service, requests: dict[int, Any]) -> dict[int, tuple[Any, Exception | None]]:
+        """Run requests through Drive batch calls; map each key to (response, exception)."""
+        outcomes: dict[int, tuple[Any, Exception | None]] = {}
+        
+        def record(request_id: str, response: Any, exception: Exception | None) -> None:
+            outcomes[int(request_id)] = (response, exception)
+        
+        keys = list(requests)
+        for start in range(0, len(keys), _DRIVE_BATCH_LIMIT):
+            batch = service.new_batch_http_request(callback=record)
+            for key in keys[start:start + _DRIVE_BATCH_LIMIT]:
+                batch.add(requests[key], request_id=str(key))
+            # Send over the calling thread's HTTP client rather than the shared service's
+            http = request_http(requests[keys[start]])
+            if http is None:
+                batch.execute()
+            else:
+                batch.execute(http=http)
+        return outcomes
+    
+    async def move_files(self, moves: list[tuple[str, str]]) -> list[dict[str, Any]]:
+        """Move several files to their status folders.
+        
+        Parent lookups and updates each go out as Drive batch requests, so N
+        moves cost two round-trips per 100 files instead of 2N. Results are
+        returned in the same order as moves, one move_file payload each.
+        """
+        results: list[dict[str, Any] | None] = [None] * len(moves)
+        try:
+            service = self._get_drive_service()
+            
+            targets: dict[int, str] = {}
+            for idx, (file_id, new_status) in enumerate(moves):
+                new_folder_id = self._get_folder_id_for_status(new_status)
+                if new_folder_id:
+                    targets[idx] = new_folder_id
+                else:
+                    results[idx] = {
+                        "success": False,
+                        "error": f"No folder configured for status: {new_status}"
+                    }
+            
+            # Get current parents for every file in one batch
+            lookups = await asyncio.to_thread(
+                self._execute_batch,
+                service,
+                {idx: service.files().get(fileId=moves[idx][0], fields="parents") for idx in targets},
+            )
+            
+            updates: dict[int, Any] = {}
+            for idx, (file, error) in lookups.items():
+                if error is not None:
+                    results[idx] = error_result(error)
+                    continue
+                updates[idx] = service.files().update(
+                    fileId=moves[idx][0],
+                    addParents=targets[idx],
+                    removeParents=",".join(file.get("parents", [])),
+                    fields="id"
+                )
+            
+            # Move files: add new parent, remove old parents
+            applied = await asyncio.to_thread(self._execute_batch, service, updates)
+            for idx, (_, error) in applied.items():
+                file_id, new_status = moves[idx]
+                results[idx] = error_result(error) if error is not None else {
+                    "success": True,
+                    "file_id": file_id,
+                    "new_status": new_status,
+                    "new_folder_id": targets[idx]
+                }
             
         except Exception as e:
-            return json.dumps({
-                "success": False,
-                "error": str(e)
-            })
+            return [
+                result or error_result(e)
+                for result in results
+            ]
+        
+        return [
+            result or {"success": False, "error": "No response from Drive"}
+            for result in results
+        ]
@@ -1,13 +1,137 @@
-"""Shared Google Drive and Sheets utilities for MCP servers."""
+"""Shared Google Drive and Sheets utilities for MCP servers.
 
+The Google client libraries take a noticeable share of process start-up to
+import, so they are imported where first used rather than at module level.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import io
 import json
-from datetime import datetime
-from pathlib import Path
-from typing import Optional, Any
+import mimetypes
+import os
+import random
+import threading
+import time
+from functools import lru_cache
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Optional, Any
+
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
+    from google_auth_httplib2 import AuthorizedHttp
+
+
+@lru_cache(maxsize=None)
+def _discovery_document(api: str, version: str) -> Optional[str]:
+    """Return the discovery document bundled with googleapiclient, read once per API."""
+    from googleapiclient import discovery_cache
+
+    return discovery_cache.get_static_doc(api, version)
+
+
+def build_service(api: str, version: str, credentials: Credentials):
+    """Build a Google API client from the bundled discovery document.
+    
+    Skips both the discovery fetch and the discovery cache autodetection
+    that build() runs on every call.
+    """
+    from googleapiclient.discovery import build, build_from_document
+
+    document = _discovery_document(api, version)
+    if document is None:
+        return build(api, version, credentials=credentials, static_discovery=True, cache_discovery=False)
+    return build_from_document(document, credentials=credentials)
+
+
+# (client_id, refresh token hash) -> Credentials shared by every tool manager,
+# so a live access token is reused instead of re-exchanging the refresh token.
+# google-auth refreshes the token itself shortly before it expires.
+_creds_cache: dict[tuple[str, str], Credentials] = {}
+_creds_lock = threading.Lock()
+
+
+def get_credentials(settings: Any) -> Credentials:
+    """Return the process-wide OAuth credentials for settings' Google account."""
+    from google.oauth2.credentials import Credentials
+
+    refresh_token = settings.google_refresh_token or ""
+    key = (
+        settings.google_client_id or "",
+        hashlib.sha256(refresh_token.encode()).hexdigest(),
+    )
+    with _creds_lock:
+        creds = _creds_cache.get(key)
+        if creds is None:
+            creds = Credentials(
+                token=None,
+                refresh_token=settings.google_refresh_token,
+                token_uri="https://oauth2.googleapis.com/token",
+                client_id=settings.google_client_id,
+                client_secret=settings.google_client_secret,
+                scopes=[
+                    "https://www.googleapis.com/auth/drive",
+                    "https://www.googleapis.com/auth/spreadsheets"
+                ]
+            )
+            _creds_cache[key] = creds
+    return creds
+
+
+# HTTP statuses Google documents as transient and safe to retry.
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+# Per-thread authorized HTTP clients, keyed by credentials.
+_thread_state = threading.local()
+
+
+def _thread_http(credentials: Credentials) -> AuthorizedHttp:
+    """Return the calling thread's authorized HTTP client for credentials.
+    
+    httplib2 connections are not thread-safe, so each worker thread keeps
+    one client whose keep-alive connections are reused by every request the
+    thread executes, rather than each client object holding its own.
+    """
+    from google_auth_httplib2 import AuthorizedHttp
+    from googleapiclient.http import build_http
+
+    clients = getattr(_thread_state, "clients", None)
+    if clients is None:
+        clients = _thread_state.clients = {}
+    http = clients.get(credentials)
+    if http is None:
+        http = clients[credentials] = AuthorizedHttp(credentials, http=build_http())
+    return http
+
+
+@lru_cache(maxsize=16)
+def shared_service(api: str, version: str, credentials: Credentials):
+    """Return one client per API and credentials, shared by every tool manager.
+    
+    Credentials come from get_credentials, so each Google account maps to a
+    single credentials object and hence a single cache entry.
+    """
+    return build_service(api, version, credentials)
+
 
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
-from google.oauth2.credentials import Credentials
+def request_http(request: Any) -> Optional[AuthorizedHttp]:
+    """Return the calling thread's HTTP client for a request's credentials, if it has any."""
+    credentials = getattr(getattr(request, "http", None), "credentials", None)
+    return _thread_http(credentials) if credentials is not None else None
+
+
+def execute_request(request: Any) -> Any:
+    """Execute a googleapiclient request over the calling thread's HTTP client.
+    
+    Requests built from a shared_service client would otherwise all go out
+    over that client's single httplib2.Http, which is unsafe across threads.
+    """
+    http = request_http(request)
+    if http is None:
+        return request.execute()
+    return request.execute(http=http)
 
 
 def _normalize_filter_operator(raw_operator: Any) -> str:
@@ -38,9 +162,12 @@ def _coerce_number(value: Any) -> float | None:
         return None
 
 
-def _normalize_for_compare(value: Any, case_sensitive: bool) -> str:
-    text = str(value if value is not None else "")
-    return text if case_sensitive else text.lower()
+def _text_for_compare(value: Any) -> str:
+    return str(value if value is not None else "")
+
+
+def _folded_text_for_compare(value: Any) -> str:
+    return str(value if value is not None else "").lower()
 
 
 SUPPORTED_FILTER_OPERATORS = {
@@ -58,78 +185,113 @@ SUPPORTED_FILTER_OPERATORS = {
 }
 
 
-def _matches_column_filter(cell_value: Any, operator: str, expected_value: Any, case_sensitive: bool) -> bool:
-    lhs = _normalize_for_compare(cell_value, case_sensitive)
-    rhs = _normalize_for_compare(expected_value, case_sensitive)
+# Numeric operators, compared after coercing both sides to float.
+_NUMERIC_COMPARATORS: dict[str, Callable[[float, float], bool]] = {
+    "greater_than": float.__gt__,
+    "greater_than_or_equal": float.__ge__,
+    "less_than": float.__lt__,
+    "less_than_or_equal": float.__le__,
+}
+
+
+# Rough relative cost of evaluating each operator on one cell; ANDed filters
+# run cheapest first so rejected rows short-circuit before the costly checks.
+_FILTER_OPERATOR_COSTS: dict[str, int] = {
+    "equals": 1,
+    "not_equals": 1,
+    "in": 2,
+    "starts_with": 2,
+    "ends_with": 2,
+    "greater_than": 3,
+    "greater_than_or_equal": 3,
+    "less_than": 3,
+    "less_than_or_equal": 3,
+    "contains": 4,
+    "not_contains": 4,
+}
+
+
+def _compile_predicate(operator: str, expected_value: Any, case_sensitive: bool) -> Callable[[Any], bool]:
+    """Build a cell predicate for one filter, normalizing the expected value once."""
+    if operator in _NUMERIC_COMPARATORS:
+        compare = _NUMERIC_COMPARATORS[operator]
+        rhs_num = _coerce_number(expected_value)
+        if rhs_num is None:
+            return lambda cell: False
+
+        def numeric(cell: Any) -> bool:
+            lhs_num = _coerce_number(cell)
+            return lhs_num is not None and compare(lhs_num, rhs_num)
+
+        return numeric
+
+    # Pick the cell normalizer once rather than branching on case per cell
+    normalize = _text_for_compare if case_sensitive else _folded_text_for_compare
+    if operator == "in":
+        if not isinstance(expected_value, list):
+            return lambda cell: False
+        values = frozenset(normalize(item) for item in expected_value)
+        return lambda cell: normalize(cell) in values
 
+    rhs = normalize(expected_value)
     if operator == "equals":
-        return lhs == rhs
+        return lambda cell: normalize(cell) == rhs
     if operator == "not_equals":
-        return lhs != rhs
+        return lambda cell: normalize(cell) != rhs
     if operator == "contains":
-        return rhs in lhs
+        return lambda cell: rhs in normalize(cell)
     if operator == "not_contains":
-        return rhs not in lhs
+        return lambda cell: rhs not in normalize(cell)
     if operator == "starts_with":
-        return lhs.startswith(rhs)
+        return lambda cell: normalize(cell).startswith(rhs)
     if operator == "ends_with":
-        return lhs.endswith(rhs)
-    if operator == "in":
-        if not isinstance(expected_value, list):
-            return False
-        normalized_values = {_normalize_for_compare(item, case_sensitive) for item in expected_value}
-        return lhs in normalized_values
-    if operator in {"greater_than", "greater_than_or_equal", "less_than", "less_than_or_equal"}:
-        lhs_num = _coerce_number(cell_value)
-        rhs_num = _coerce_number(expected_value)
-        if lhs_num is None or rhs_num is None:
-            return False
-        if operator == "greater_than":
-            return lhs_num > rhs_num
-        if operator == "greater_than_or_equal":
-            return lhs_num >= rhs_num
-        if operator == "less_than":
-            return lhs_num < rhs_num
-        return lhs_num <= rhs_num
-    return False
+        return lambda cell: normalize(cell).endswith(rhs)
+    return lambda cell: False
 
 
-def apply_column_filters(
-    *,
-    headers: list[Any],
-    rows: list[list[Any]],
-    column_filters: list[dict[str, Any]] | None,
-) -> dict[str, Any]:
-    """Apply ANDed column filters to tabular rows."""
-    if not column_filters:
-        return {"success": True, "rows": rows}
+@lru_cache(maxsize=64)
+def _build_header_index(headers: tuple[Any, ...]) -> tuple[dict[str, int], tuple[str, ...]]:
+    """Map lowercased header names to column indices; also return the sorted names.
+    
+    Cached because paged and repeated reads of one worksheet filter against
+    the same header row. Callers must not mutate the returned dict.
+    """
+    normalized_headers = [str(h).strip() for h in headers]
+    header_index = {header.lower(): idx for idx, header in enumerate(normalized_headers)}
+    return header_index, tuple(sorted(normalized_headers))
+
 
+def _compile_column_filters(
+    headers: list[Any],
+    column_filters: list[dict[str, Any]],
+) -> tuple[list[tuple[int, Callable[[Any], bool]]], dict[str, Any] | None]:
+    """Resolve column filters against headers; return ((column index, predicate) pairs, error_result)."""
     if not headers:
-        return {"success": False, "error": "No headers available for column filtering", "available_columns": []}
+        return [], {"success": False, "error": "No headers available for column filtering", "available_columns": []}
 
-    normalized_headers = [str(h).strip() for h in headers]
-    header_index = {header.lower(): idx for idx, header in enumerate(normalized_headers)}
-    available_columns = sorted(normalized_headers)
+    header_index, sorted_columns = _build_header_index(tuple(headers))
+    available_columns = list(sorted_columns)
 
-    compiled_filters: list[tuple[int, str, Any, bool]] = []
+    compiled_filters: list[tuple[int, Callable[[Any], bool]]] = []
+    costs: list[int] = []
 
     for filt in column_filters:
         if not isinstance(filt, dict):
-            return {
+            return [], {
                 "success": False,
                 "error": "Each column filter must be an object",
                 "available_columns": available_columns,
             }
         column = str(filt.get("column") or "").strip()
         if not column:
-            return {
+            return [], {
                 "success": False,
                 "error": "Each column filter requires a non-empty 'column' field",
                 "available_columns": available_columns,
             }
         idx = header_index.get(column.lower())
         if idx is None:
-            return {
+            return [], {
                 "success": False,
                 "error": f"Unknown column '{column}'",
                 "available_columns": available_columns,
@@ -137,7 +299,7 @@ def apply_column_filters(
 
         operator = _normalize_filter_operator(filt.get("operator", "equals"))
         if operator not in SUPPORTED_FILTER_OPERATORS:
-            return {
+            return [], {
                 "success": False,
                 "error": (
                     f"Unsupported operator '{filt.get('operator')}'. "
@@ -147,22 +309,40 @@ def apply_column_filters(
             }
 
         if "value" not in filt:
-            return {
+            return [], {
                 "success": False,
                 "error": "Each column filter requires a 'value' field",
                 "available_columns": available_columns,
             }
 
-        compiled_filters.append(
-            (idx, operator, filt.get("value"), bool(filt.get("case_sensitive", False)))
-        )
+        predicate = _compile_predicate(operator, filt.get("value"), bool(filt.get("case_sensitive", False)))
+        compiled_filters.append((idx, predicate))
+        costs.append(_FILTER_OPERATOR_COSTS[operator])
+
+    order = sorted(range(len(compiled_filters)), key=costs.__getitem__)
+    return [compiled_filters[i] for i in order], None
+
+
+def apply_column_filters(
+    *,
+    headers: list[Any],
+    rows: list[list[Any]],
+    column_filters: list[dict[str, Any]] | None,
+) -> dict[str, Any]:
+    """Apply ANDed column filters to tabular rows."""
+    if not column_filters:
+        return {"success": True, "rows": rows}
+
+    compiled_filters, error = _compile_column_filters(headers, column_filters)
+    if error:
+        return error
 
     filtered_rows: list[list[Any]] = []
     for row in rows:
         keep = True
-        for idx, operator, expected_value, case_sensitive in compiled_filters:
+        for idx, predicate in compiled_filters:
             cell_value = row[idx] if idx < len(row) else None
-            if not _matches_column_filter(cell_value, operator, expected_value, case_sensitive):
+            if not predicate(cell_value):
                 keep = False
                 break
         if keep:
@@ -171,52 +351,288 @@ def apply_column_filters(
     return {"success": True, "rows": filtered_rows}
 
 
+def _matching_indices(predicate: Callable[[Any], bool], column: list[Any], indices: list[int]) -> list[int]:
+    """Return the indices whose cell in column satisfies predicate.
+    
+    Ledger columns repeat a handful of values (statuses, years, organizations),
+    so when distinct values are at most half the cells the predicate runs once
+    per distinct value and rows look their verdict up, like a filter over a
+    dictionary-encoded column.
+    """
+    # Only the surviving rows matter; earlier filters may have narrowed them a lot.
+    distinct = {column[i] for i in indices}
+    if len(distinct) * 2 > len(indices):
+        return [i for i in indices if predicate(column[i])]
+    verdicts = {value: predicate(value) for value in distinct}
+    return [i for i in indices if verdicts[column[i]]]
+
+
+def apply_column_filters_to_columns(
+    *,
+    headers: list[Any],
+    columns: list[list[Any]],
+    column_filters: list[dict[str, Any]] | None,
+) -> dict[str, Any]:
+    """Apply ANDed column filters to column-major data (one equal-length list per header)."""
+    if not column_filters:
+        return {"success": True, "columns": columns}
+
+    compiled_filters, error = _compile_column_filters(headers, column_filters)
+    if error:
+        return error
+
+    row_count = len(columns[0]) if columns else 0
+    keep_indices = list(range(row_count))
+    for idx, predicate in compiled_filters:
+        column = columns[idx] if idx < len(columns) else [None] * row_count
+        keep_indices = _matching_indices(predicate, column, keep_indices)
+
+    return {
+        "success": True,
+        "columns": [[column[i] for i in keep_indices] for column in columns],
+    }
+
+
 class GoogleServiceMixin:
     """Mixin providing shared Google service initialization."""
     
+    # Attempts _aexecute makes before surfacing a transient error.
+    EXECUTE_ATTEMPTS = 5
+    
     def __init__(self, settings: Any):
         self.settings = settings
         self._drive_service = None
         self._sheets_service = None
+        # (spreadsheet_id, worksheet_name) -> (drive version, headers, rows, verified_at)
+        self._rows_cache: dict[tuple[str, str], tuple[str, list[Any], list[list[Any]], float]] = {}
+        # (spreadsheet_id, worksheet_name) -> in-flight get_all_rows fetch shared by concurrent callers
+        self._rows_inflight: dict[tuple[str, str], asyncio.Future] = {}
+        # (spreadsheet_id, worksheet_name) -> (writes started, writes finished); fetches
+        # that overlap a write don't cache their rows
+        self._rows_writes: dict[tuple[str, str], tuple[int, int]] = {}
+        # (spreadsheet_id, worksheet_name) -> when the worksheet was last seen to exist
+        self._known_worksheets: dict[tuple[str, str], float] = {}
+        # parent folder ID -> (when its subfolders were listed, subfolder name -> folder ID)
+        self._folder_ids: dict[str, tuple[float, dict[str, str]]] = {}
     
     def _get_credentials(self) -> Credentials:
         """Get Google OAuth credentials from settings."""
-        return Credentials(
-            token=None,
-            refresh_token=self.settings.google_refresh_token,
-            token_uri="https://oauth2.googleapis.com/token",
-            client_id=self.settings.google_client_id,
-            client_secret=self.settings.google_client_secret,
-            scopes=[
-                "https://www.googleapis.com/auth/drive",
-                "https://www.googleapis.com/auth/spreadsheets"
-            ]
-        )
+        return get_credentials(self.settings)
+    
+    @staticmethod
+    def _execute(request: Any) -> Any:
+        """Execute a googleapiclient request over the calling thread's HTTP client."""
+        return execute_request(request)
+    
+    async def _aexecute(self, request: Any, idempotent: bool = True) -> Any:
+        """Execute a request off the event loop, retrying transient errors with jittered backoff.
+        
+        Non-idempotent requests (creates, appends) are only retried on 429,
+        which Google returns before applying the request.
+        """
+        from googleapiclient.errors import HttpError
+
+        for attempt in range(self.EXECUTE_ATTEMPTS):
+            try:
+                return await asyncio.to_thread(self._execute, request)
+            except HttpError as e:
+                status = e.resp.status
+                retryable = status == 429 or (idempotent and status in RETRYABLE_STATUSES)
+                if not retryable or attempt == self.EXECUTE_ATTEMPTS - 1:
+                    raise
+                await asyncio.sleep(2**attempt * random.random())
     
     def _get_drive_service(self):
         """Get or create Google Drive service."""
         if not self._drive_service:
-            creds = self._get_credentials()
-            self._drive_service = build("drive", "v3", credentials=creds)
+            self._drive_service = shared_service("drive", "v3", self._get_credentials())
         return self._drive_service
     
     def _get_sheets_service(self):
         """Get or create Google Sheets service."""
         if not self._sheets_service:
-            creds = self._get_credentials()
-            self._sheets_service = build("sheets", "v4", credentials=creds)
+            self._sheets_service = shared_service("sheets", "v4", self._get_credentials())
         return self._sheets_service
 
 
+# Files below this size go up in one multipart request; resumable uploads
+# spend an extra round-trip opening the upload session.
+SIMPLE_UPLOAD_MAX_BYTES = 5 * 1024 * 1024
+
+# Chunk size for resumable uploads of larger files.
+UPLOAD_CHUNK_BYTES = 16 * 1024 * 1024
+
+# Times googleapiclient retries one resumable upload chunk in place.
+UPLOAD_CHUNK_RETRIES = 3
+
+# Read buffer for streaming chunked uploads from disk.
+UPLOAD_READ_BUFFER_BYTES = 1024 * 1024
+
+
+def open_upload_media(local_file_path: str, mimetype: str, size: int) -> tuple[Any, Optional[io.BufferedReader]]:
+    """Build the media body for a Drive upload, picking simple or chunked upload by size.
+
+    Chunked uploads stream through a 1 MiB buffered reader so each chunk is
+    filled with a few large reads. The reader is returned alongside the media
+    and the caller must close it once the upload finishes.
+    """
+    from googleapiclient.http import MediaFileUpload, MediaIoBaseUpload
+
+    if size < SIMPLE_UPLOAD_MAX_BYTES:
+        return MediaFileUpload(local_file_path, mimetype=mimetype, resumable=False), None
+    stream = open(local_file_path, "rb", buffering=UPLOAD_READ_BUFFER_BYTES)
+    media = MediaIoBaseUpload(stream, mimetype=mimetype, chunksize=UPLOAD_CHUNK_BYTES, resumable=True)
+    return media, stream
+
+
+def _escape_drive_query(value: str) -> str:
+    """Escape a value for use inside a quoted Drive search query string."""
+    return value.replace("\\", "\\\\").replace("'", "\\'")
+
+
+# Upload filename timestamp layout.
+_UPLOAD_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+
+
+def timestamped_filename(filename: str) -> str:
+    """Insert an upload timestamp before the extension, e.g. receipt_20250101_120000_1a2b.pdf.
+
+    The trailing hex digits come from the nanosecond clock, so uploads that
+    land in the same second still get distinct names.
+    """
+    stem, ext = os.path.splitext(os.path.basename(filename))
+    return f"{stem}_{time.strftime(_UPLOAD_TIMESTAMP_FORMAT)}_{time.time_ns() & 0xFFFF:04x}{ext}"
+
+
+def error_result(error: BaseException) -> dict:
+    """Build the failure payload returned by the Drive and Sheets helpers.
+    
+    Google API errors are summarized as status, message and reason codes
+    instead of str(), which repeats the request URI and response details.
+    """
+    from googleapiclient.errors import HttpError
+
+    if not isinstance(error, HttpError):
+        return {"success": False, "error": str(error)}
+    message = f"HttpError {error.resp.status}: {error.reason}"
+    reasons = _http_error_reasons(error)
+    if reasons:
+        message += f" ({', '.join(reasons)})"
+    return {"success": False, "error": message}
+
+
+def _http_error_reasons(error: Any) -> list[str]:
+    """Reason codes (e.g. ``userRateLimitExceeded``) from an HttpError's details."""
+    details = error.error_details if isinstance(error.error_details, list) else []
+    return [detail["reason"] for detail in details if isinstance(detail, dict) and detail.get("reason")]
+
+
+def _upload_chunks(request: Any) -> Any:
+    """Send a resumable upload chunk by chunk over the calling thread's HTTP client.
+    
+    Each chunk is retried in place on transient errors, so a failure part
+    way through resumes the upload session instead of restarting the file.
+    """
+    http = request_http(request)
+    response = None
+    while response is None:
+        _, response = request.next_chunk(http=http, num_retries=UPLOAD_CHUNK_RETRIES)
+    return response
+
+
+def upload_local_file(
+    service: Any,
+    local_file_path: str,
+    folder_id: Optional[str],
+    filename: Optional[str] = None,
+    add_timestamp: bool = True
+) -> dict:
+    """Upload a local file to Drive, blocking until the upload finishes.
+    
+    Small files go up in one request and larger ones resumably, both over the
+    calling thread's HTTP client, so this is safe to run in worker threads
+    against a shared service.
+    
+    Returns:
+        Dict with success, file_id, filename, web_view_link, error
+    """
+    try:
+        # One stat covers the existence check and the upload mode choice
+        try:
+            size = os.stat(local_file_path).st_size
+        except FileNotFoundError:
+            return {
+                "success": False,
+                "error": f"File not found: {local_file_path}"
+            }
+        
+        # Use custom filename or original; a timestamp avoids name collisions
+        basename = os.path.basename(local_file_path)
+        upload_filename = filename or basename
+        final_filename = timestamped_filename(upload_filename) if add_timestamp else upload_filename
+        
+        file_metadata = {
+            "name": final_filename,
+        }
+        if folder_id:
+            file_metadata["parents"] = [folder_id]
+        
+        # Receipts may be PDFs or images
+        mimetype = mimetypes.guess_type(basename)[0] or "application/octet-stream"
+        media, stream = open_upload_media(local_file_path, mimetype, size)
+        try:
+            request = service.files().create(
+                body=file_metadata,
+                media_body=media,
+                fields="id, name, webViewLink"
+            )
+            file = execute_request(request) if stream is None else _upload_chunks(request)
+        finally:
+            if stream is not None:
+                stream.close()
+        
+        return {
+            "success": True,
+            "file_id": file.get("id"),
+            "filename": file.get("name"),
+            "web_view_link": file.get("webViewLink"),
+        }
+        
+    except Exception as e:
+        from googleapiclient.errors import HttpError
+
+        result = error_result(e)
+        if isinstance(e, HttpError):
+            # Structured fields let callers decide on retries without parsing the message
+            result["status"] = e.resp.status
+            result["reasons"] = _http_error_reasons(e)
+        return result
+
+
+_RATE_LIMIT_REASONS = frozenset({"rateLimitExceeded", "userRateLimitExceeded"})
+
+
+def _is_rate_limited(result: dict) -> bool:
+    """Whether a failed upload result is a Drive rate-limit rejection worth retrying."""
+    return result.get("status") == 429 or not _RATE_LIMIT_REASONS.isdisjoint(result.get("reasons", ()))
+
+
 class DriveOperationsMixin:
     """Mixin providing shared Drive operations."""
     
+    # Tries per file in bulk_upload_files; rate-limited tries back off 1s, 2s, ...
+    BULK_UPLOAD_ATTEMPTS = 3
+    
+    # How long a parent's subfolder listing answers get_or_create_folder lookups
+    FOLDER_IDS_TTL_SECONDS = 300.0
+    
     async def upload_file(
         self,
         local_file_path: str,
         folder_id: str,
         filename: Optional[str] = None,
-        add_timestamp: bool = True
+        add_timestamp: bool = True,
+        service: Any = None
     ) -> dict:
         """Upload a file to Google Drive.
         
@@ -225,64 +641,59 @@ class DriveOperationsMixin:
             folder_id: Google Drive folder ID to upload to
             filename: Optional custom filename (uses original if not provided)
             add_timestamp: Whether to add timestamp to filename
+            service: Optional Drive service to use instead of the shared one
             
         Returns:
             Dict with success, file_id, filename, web_view_link, error
         """
         try:
-            service = self._get_drive_service()
-            file_path = Path(local_file_path)
-            
-            if not file_path.exists():
-                return {
-                    "success": False,
-                    "error": f"File not found: {local_file_path}"
-                }
-            
-            # Use custom filename or original
-            upload_filename = filename or file_path.name
-            
-            # Add timestamp to filename to avoid collisions
-            if add_timestamp:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                name_without_ext = Path(upload_filename).stem
-                ext = Path(upload_filename).suffix
-                final_filename = f"{name_without_ext}_{timestamp}{ext}"
-            else:
-                final_filename = upload_filename
-            
-            # File metadata
-            file_metadata = {
-                "name": final_filename,
-            }
-            if folder_id:
-                file_metadata["parents"] = [folder_id]
-            
-            # Upload file
-            media = MediaFileUpload(
-                str(file_path),
-                mimetype="application/pdf",
-                resumable=True
-            )
-            
-            file = service.files().create(
-                body=file_metadata,
-                media_body=media,
-                fields="id, name, webViewLink"
-            ).execute()
-            
-            return {
-                "success": True,
-                "file_id": file.get("id"),
-                "filename": file.get("name"),
-                "web_view_link": file.get("webViewLink"),
-            }
-            
+            service = service or self._get_drive_service()
         except Exception as e:
-            return {
-                "success": False,
-                "error": str(e)
-            }
+            return error_result(e)
+        return await asyncio.to_thread(
+            upload_local_file,
+            service,
+            local_file_path,
+            folder_id,
+            filename,
+            add_timestamp
+        )
+    
+    async def bulk_upload_files(
+        self,
+        items: list[dict[str, Any]],
+        max_concurrency: int = 8
+    ) -> list[dict]:
+        """Upload several files concurrently, at most max_concurrency at a time.
+        
+        Args:
+            items: upload_file keyword arguments, one dict per file
+            max_concurrency: Maximum uploads in flight at once
+            
+        Returns:
+            One upload_file result dict per item, in the same order
+        """
+        sem = asyncio.Semaphore(max(1, max_concurrency))
+        
+        # Workers share the Drive service; upload_file sends each request over
+        # the worker thread's own HTTP client.
+        async def upload(item: dict[str, Any]) -> dict:
+            async with sem:
+                for attempt in range(self.BULK_UPLOAD_ATTEMPTS):
+                    result = await self.upload_file(**item)
+                    if (
+                        result.get("success")
+                        or not _is_rate_limited(result)
+                        or attempt == self.BULK_UPLOAD_ATTEMPTS - 1
+                    ):
+                        return result
+                    await asyncio.sleep(2 ** attempt)
+        
+        outcomes = await asyncio.gather(*(upload(item) for item in items), return_exceptions=True)
+        return [
+            error_result(outcome) if isinstance(outcome, BaseException) else outcome
+            for outcome in outcomes
+        ]
     
     async def create_folder(
         self,
@@ -309,10 +720,13 @@ class DriveOperationsMixin:
             if parent_folder_id:
                 file_metadata["parents"] = [parent_folder_id]
             
-            folder = service.files().create(
-                body=file_metadata,
-                fields="id, name"
-            ).execute()
+            folder = await self._aexecute(
+                service.files().create(
+                    body=file_metadata,
+                    fields="id, name"
+                ),
+                idempotent=False
+            )
             
             return {
                 "success": True,
@@ -321,10 +735,7 @@ class DriveOperationsMixin:
             }
             
         except Exception as e:
-            return {
-                "success": False,
-                "error": str(e)
-            }
+            return error_result(e)
     
     async def get_or_create_folder(
         self,
@@ -333,6 +744,11 @@ class DriveOperationsMixin:
     ) -> dict:
         """Get existing folder or create if not exists.
         
+        Subfolders of a parent are listed in one pass and remembered for
+        FOLDER_IDS_TTL_SECONDS, so repeated lookups under the same parent
+        skip the Drive round-trip. A name missing from the remembered
+        listing triggers a fresh listing before a folder is created.
+        
         Args:
             folder_name: Name of the folder
             parent_folder_id: Parent folder ID to search in
@@ -341,46 +757,65 @@ class DriveOperationsMixin:
             Dict with success, folder_id, name, created, error
         """
         try:
-            service = self._get_drive_service()
-            
-            # Search for existing folder
-            query = f"mimeType='application/vnd.google-apps.folder' and name='{folder_name}' and '{parent_folder_id}' in parents and trashed=false"
-            results = service.files().list(
-                q=query,
-                spaces="drive",
-                fields="files(id, name)"
-            ).execute()
+            cached = self._folder_ids.get(parent_folder_id)
+            if cached is not None and time.monotonic() - cached[0] < self.FOLDER_IDS_TTL_SECONDS:
+                folder_id = cached[1].get(folder_name)
+                if folder_id is not None:
+                    return {"success": True, "folder_id": folder_id, "name": folder_name, "created": False}
             
-            items = results.get("files", [])
-            if items:
-                return {
-                    "success": True,
-                    "folder_id": items[0]["id"],
-                    "name": items[0]["name"],
-                    "created": False,
-                }
+            folder_ids = await self._list_subfolders(parent_folder_id)
+            self._folder_ids[parent_folder_id] = (time.monotonic(), folder_ids)
+            folder_id = folder_ids.get(folder_name)
+            if folder_id is not None:
+                return {"success": True, "folder_id": folder_id, "name": folder_name, "created": False}
             
             # Create new folder
             create_result = await self.create_folder(folder_name, parent_folder_id)
+            if create_result["success"]:
+                folder_ids[folder_name] = create_result["folder_id"]
             create_result["created"] = True
             return create_result
             
         except Exception as e:
-            return {
-                "success": False,
-                "error": str(e)
-            }
+            return error_result(e)
+    
+    async def _list_subfolders(self, parent_folder_id: str) -> dict[str, str]:
+        """Return name -> folder ID for every folder directly under parent_folder_id."""
+        service = self._get_drive_service()
+        query = (
+            "mimeType='application/vnd.google-apps.folder'"
+            f" and '{_escape_drive_query(parent_folder_id)}' in parents and trashed=false"
+        )
+        folder_ids: dict[str, str] = {}
+        page_token = None
+        while True:
+            results = await self._aexecute(
+                service.files().list(
+                    q=query,
+                    spaces="drive",
+                    fields="nextPageToken, files(id, name)",
+                    pageSize=1000,
+                    pageToken=page_token
+                )
+            )
+            for item in results.get("files", []):
+                folder_ids.setdefault(item["name"], item["id"])
+            page_token = results.get("nextPageToken")
+            if not page_token:
+                return folder_ids
     
     async def move_file(
         self,
         file_id: str,
-        new_folder_id: str
+        new_folder_id: str,
+        old_folder_id: Optional[str] = None
     ) -> dict:
         """Move file to a different folder.
         
         Args:
             file_id: File ID to move
             new_folder_id: Destination folder ID
+            old_folder_id: Current folder ID, if known; skips the parents lookup
             
         Returns:
             Dict with success, file_id, new_folder_id, error
@@ -388,21 +823,27 @@ class DriveOperationsMixin:
         try:
             service = self._get_drive_service()
             
-            # Get current parents
-            file = service.files().get(
-                fileId=file_id,
-                fields="parents"
-            ).execute()
-            
-            current_parents = file.get("parents", [])
+            if old_folder_id is not None:
+                current_parents = [old_folder_id]
+            else:
+                # Get current parents
+                file = await self._aexecute(
+                    service.files().get(
+                        fileId=file_id,
+                        fields="parents"
+                    )
+                )
+                current_parents = file.get("parents", [])
             
             # Move file: add new parent, remove old parents
-            service.files().update(
-                fileId=file_id,
-                addParents=new_folder_id,
-                removeParents=",".join(current_parents),
-                fields="id, parents"
-            ).execute()
+            await self._aexecute(
+                service.files().update(
+                    fileId=file_id,
+                    addParents=new_folder_id,
+                    removeParents=",".join(current_parents),
+                    fields="id"
+                )
+            )
             
             return {
                 "success": True,
@@ -411,15 +852,68 @@ class DriveOperationsMixin:
             }
             
         except Exception as e:
-            return {
-                "success": False,
-                "error": str(e)
-            }
+            return error_result(e)
 
 
 class SheetsOperationsMixin:
     """Mixin providing shared Sheets operations."""
     
+    # Cached rows younger than this are served without a Drive version probe.
+    ROWS_CACHE_TTL_SECONDS = 30.0
+    
+    # Worksheets seen to exist within this window skip the metadata fetch.
+    KNOWN_WORKSHEET_TTL_SECONDS = 300.0
+    
+    def _get_spreadsheet_version(self, spreadsheet_id: str) -> Optional[str]:
+        """Return the Drive version of a spreadsheet, or None when unavailable.
+        
+        The version increments on every change to the file, so it is a cheap
+        freshness check before re-downloading sheet values.
+        """
+        try:
+            result = self._execute(
+                self._get_drive_service().files().get(
+                    fileId=spreadsheet_id,
+                    fields="version"
+                )
+            )
+        except Exception:
+            return None
+        return result.get("version")
+    
+    def invalidate_rows_cache(self, spreadsheet_id: str, worksheet_name: str) -> None:
+        """Drop any cached get_all_rows result for a worksheet."""
+        self._rows_cache.pop((spreadsheet_id, worksheet_name), None)
+    
+    def _count_rows_write(self, cache_key: tuple[str, str], finished: bool) -> None:
+        """Record a write to a worksheet starting or finishing; see _fetch_all_rows."""
+        started, done = self._rows_writes.get(cache_key, (0, 0))
+        self._rows_writes[cache_key] = (started, done + 1) if finished else (started + 1, done)
+    
+    def _extend_rows_cache(
+        self,
+        spreadsheet_id: str,
+        worksheet_name: str,
+        appended_rows: Optional[list[list[Any]]],
+        row_count: int
+    ) -> None:
+        """Add rows we just appended to a cached worksheet so it stays warm.
+        
+        appended_rows are the formatted values the append response echoed
+        back, i.e. what a refetch would return. Without them, or if Sheets
+        echoed a different number of rows, the cache is dropped instead. The
+        cached version is marked local so the next probe after the TTL
+        refetches from Sheets.
+        """
+        cache_key = (spreadsheet_id, worksheet_name)
+        cached = self._rows_cache.get(cache_key)
+        if cached is None or not cached[1] or appended_rows is None or len(appended_rows) != row_count:
+            self.invalidate_rows_cache(spreadsheet_id, worksheet_name)
+            return
+        version, headers, rows, verified_at = cached
+        rows = rows + [list(row) for row in appended_rows]
+        self._rows_cache[cache_key] = (f"{version}+local{len(rows)}", headers, rows, verified_at)
+    
     async def ensure_worksheet_exists(
         self,
         spreadsheet_id: str,
@@ -436,55 +930,120 @@ class SheetsOperationsMixin:
         Returns:
             Dict with success, worksheet_exists, error
         """
+        result = await self.ensure_worksheets_exist(spreadsheet_id, {worksheet_name: headers})
+        if not result["success"]:
+            return result
+        return {
+            "success": True,
+            "worksheet_exists": result["worksheet_exists"][worksheet_name],
+        }
+    
+    async def ensure_worksheets_exist(
+        self,
+        spreadsheet_id: str,
+        worksheets: dict[str, Optional[list[str]]]
+    ) -> dict:
+        """Ensure several worksheets exist, creating the missing ones together.
+        
+        One metadata read covers every worksheet, and all addSheet and header
+        requests go out in a single batchUpdate.
+        
+        Args:
+            spreadsheet_id: Google Sheets spreadsheet ID
+            worksheets: Worksheet names mapped to headers to add if creating (or None)
+            
+        Returns:
+            Dict with success, worksheet_exists (name -> whether it already existed), error
+        """
+        now = time.monotonic()
+        worksheet_exists: dict[str, bool] = {}
+        for worksheet_name in worksheets:
+            seen_at = self._known_worksheets.get((spreadsheet_id, worksheet_name))
+            if seen_at is not None and now - seen_at < self.KNOWN_WORKSHEET_TTL_SECONDS:
+                worksheet_exists[worksheet_name] = True
+        if len(worksheet_exists) == len(worksheets):
+            return {
+                "success": True,
+                "worksheet_exists": worksheet_exists,
+            }
+        
         try:
             service = self._get_sheets_service()
             
-            # Get spreadsheet to check if worksheet exists
-            spreadsheet = service.spreadsheets().get(
-                spreadsheetId=spreadsheet_id
-            ).execute()
+            # Get spreadsheet to check which worksheets exist; only sheet ids and titles are needed
+            spreadsheet = await self._aexecute(
+                service.spreadsheets().get(
+                    spreadsheetId=spreadsheet_id,
+                    fields="sheets.properties(sheetId,title)"
+                )
+            )
             
             existing_sheets = [
                 sheet["properties"]["title"]
                 for sheet in spreadsheet["sheets"]
             ]
             
-            if worksheet_name in existing_sheets:
+            now = time.monotonic()
+            for title in existing_sheets:
+                self._known_worksheets[(spreadsheet_id, title)] = now
+            
+            missing = [name for name in worksheets if name not in existing_sheets]
+            for worksheet_name in worksheets:
+                worksheet_exists[worksheet_name] = worksheet_name not in missing
+            if not missing:
                 return {
                     "success": True,
-                    "worksheet_exists": True,
+                    "worksheet_exists": worksheet_exists,
                 }
             
-            # Create new worksheet
-            body = {
-                "requests": [{
+            # Create new worksheets. Choosing the sheetIds up front lets the
+            # header rows be written in the same batchUpdate.
+            existing_ids = {sheet["properties"].get("sheetId") for sheet in spreadsheet["sheets"]}
+            next_id = max((i for i in existing_ids if isinstance(i, int)), default=0) + 1
+            requests: list[dict[str, Any]] = []
+            for sheet_id, worksheet_name in enumerate(missing, start=next_id):
+                requests.append({
                     "addSheet": {
                         "properties": {
+                            "sheetId": sheet_id,
                             "title": worksheet_name,
                         }
                     }
-                }]
-            }
-            
-            service.spreadsheets().batchUpdate(
-                spreadsheetId=spreadsheet_id,
-                body=body
-            ).execute()
+                })
+                headers = worksheets[worksheet_name]
+                if headers:
+                    requests.append({
+                        "updateCells": {
+                            "rows": [{
+                                "values": [
+                                    {"userEnteredValue": {"stringValue": str(header)}}
+                                    for header in headers
+                                ]
+                            }],
+                            "fields": "userEnteredValue",
+                            "start": {"sheetId": sheet_id, "rowIndex": 0, "columnIndex": 0},
+                        }
+                    })
             
-            # Add headers if provided
-            if headers:
-                await self.append_row(spreadsheet_id, worksheet_name, headers)
+            await self._aexecute(
+                service.spreadsheets().batchUpdate(
+                    spreadsheetId=spreadsheet_id,
+                    body={"requests": requests}
+                ),
+                idempotent=False
+            )
+            now = time.monotonic()
+            for worksheet_name in missing:
+                self.invalidate_rows_cache(spreadsheet_id, worksheet_name)
+                self._known_worksheets[(spreadsheet_id, worksheet_name)] = now
             
             return {
                 "success": True,
-                "worksheet_exists": False,  # Was created
+                "worksheet_exists": worksheet_exists,
             }
             
         except Exception as e:
-            return {
-                "success": False,
-                "error": str(e)
-            }
+            return error_result(e)
     
     async def append_row(
         self,
@@ -502,6 +1061,52 @@ class SheetsOperationsMixin:
         Returns:
             Dict with success, row_index, error
         """
+        result = await self.append_rows_batch(spreadsheet_id, {worksheet_name: [row_data]})
+        return result["results"][worksheet_name]
+    
+    async def append_rows_batch(
+        self,
+        spreadsheet_id: str,
+        per_sheet: dict[str, list[list[Any]]]
+    ) -> dict:
+        """Append rows to several worksheets of one spreadsheet concurrently.
+        
+        Each worksheet gets one values.append call; the calls run side by side
+        so the batch costs roughly one roundtrip.
+        
+        Args:
+            spreadsheet_id: Google Sheets spreadsheet ID
+            per_sheet: Worksheet names mapped to the rows to append to each
+            
+        Returns:
+            Dict with success (all appends succeeded) and results (name -> append_rows result)
+        """
+        names = list(per_sheet)
+        outcomes = await asyncio.gather(
+            *(self.append_rows(spreadsheet_id, name, per_sheet[name]) for name in names)
+        )
+        results = dict(zip(names, outcomes))
+        return {
+            "success": all(result["success"] for result in outcomes),
+            "results": results,
+        }
+    
+    async def append_rows(
+        self,
+        spreadsheet_id: str,
+        worksheet_name: str,
+        rows_data: list[list[Any]]
+    ) -> dict:
+        """Append several rows to a worksheet in one values.append call.
+        
+        Args:
+            spreadsheet_id: Google Sheets spreadsheet ID
+            worksheet_name: Name of worksheet
+            rows_data: Rows to append, each a list of values
+            
+        Returns:
+            Dict with success, row_index (the updated range), error
+        """
         try:
             service = self._get_sheets_service()
             
@@ -510,18 +1115,35 @@ class SheetsOperationsMixin:
             range_name = f"'{escaped_title}'!A1"
             
             body = {
-                "values": [row_data]
+                "values": rows_data
             }
             
-            result = service.spreadsheets().values().append(
-                spreadsheetId=spreadsheet_id,
-                range=range_name,
-                valueInputOption="USER_ENTERED",
-                insertDataOption="INSERT_ROWS",
-                body=body
-            ).execute()
+            cache_key = (spreadsheet_id, worksheet_name)
+            self._count_rows_write(cache_key, finished=False)
+            try:
+                result = await self._aexecute(
+                    service.spreadsheets().values().append(
+                        spreadsheetId=spreadsheet_id,
+                        range=range_name,
+                        valueInputOption="USER_ENTERED",
+                        insertDataOption="INSERT_ROWS",
+                        body=body,
+                        includeValuesInResponse=True,
+                        responseValueRenderOption="FORMATTED_VALUE",
+                        fields="updates(updatedRange,updatedData(values))"
+                    ),
+                    idempotent=False
+                )
+            finally:
+                self._count_rows_write(cache_key, finished=True)
             
             updates = result.get("updates", {})
+            self._extend_rows_cache(
+                spreadsheet_id,
+                worksheet_name,
+                updates.get("updatedData", {}).get("values"),
+                len(rows_data)
+            )
             
             return {
                 "success": True,
@@ -529,10 +1151,88 @@ class SheetsOperationsMixin:
             }
             
         except Exception as e:
+            # The append may have been applied before the error (e.g. a timeout).
+            self.invalidate_rows_cache(spreadsheet_id, worksheet_name)
+            return error_result(e)
+    
+    async def get_many_ranges(
+        self,
+        spreadsheet_id: str,
+        ranges: list[str]
+    ) -> dict:
+        """Read several A1 ranges in one values.batchGet call.
+        
+        Args:
+            spreadsheet_id: Google Sheets spreadsheet ID
+            ranges: A1 ranges to read, e.g. ["'Ledger'!A1:K1", "'Summary'!A:B"]
+            
+        Returns:
+            Dict with success, values (one row list per requested range, in order), error
+        """
+        try:
+            service = self._get_sheets_service()
+            
+            result = await self._aexecute(
+                service.spreadsheets().values().batchGet(
+                    spreadsheetId=spreadsheet_id,
+                    ranges=ranges
+                )
+            )
+            
+            # valueRanges come back in request order; empty ranges omit "values"
+            value_ranges = result.get("valueRanges", [])
             return {
-                "success": False,
-                "error": str(e)
+                "success": True,
+                "values": [value_range.get("values", []) for value_range in value_ranges],
+            }
+            
+        except Exception as e:
+            return error_result(e)
+    
+    async def get_all_columns(
+        self,
+        spreadsheet_id: str,
+        worksheet_name: str
+    ) -> dict:
+        """Get all data from a worksheet in column-major form.
+        
+        Reads go through get_all_rows, so column readers share its version-keyed
+        cache, TTL and in-flight fetches with row readers.
+        
+        Args:
+            spreadsheet_id: Google Sheets spreadsheet ID
+            worksheet_name: Name of worksheet
+            
+        Returns:
+            Dict with success, headers, columns (one list per header, padded
+            with "" to equal length), error
+        """
+        rows_result = await self.get_all_rows(spreadsheet_id, worksheet_name)
+        if not rows_result["success"]:
+            return rows_result
+        
+        headers = rows_result["headers"]
+        rows = rows_result["rows"]
+        if not headers and not rows:
+            return {
+                "success": True,
+                "headers": [],
+                "columns": [],
             }
+        
+        # Sheets omits trailing empty cells per row, so pad to the widest one.
+        width = max([len(headers)] + [len(row) for row in rows])
+        headers = headers + [""] * (width - len(headers))
+        for row in rows:
+            if len(row) < width:
+                row.extend([""] * (width - len(row)))
+        columns = [list(column) for column in zip(*rows)] if rows else [[] for _ in headers]
+        
+        return {
+            "success": True,
+            "headers": headers,
+            "columns": columns,
+        }
     
     async def get_all_rows(
         self,
@@ -541,6 +1241,8 @@ class SheetsOperationsMixin:
     ) -> dict:
         """Get all rows from a worksheet.
         
+        Concurrent calls for the same worksheet share one in-flight fetch.
+        
         Args:
             spreadsheet_id: Google Sheets spreadsheet ID
             worksheet_name: Name of worksheet
@@ -548,17 +1250,113 @@ class SheetsOperationsMixin:
         Returns:
             Dict with success, headers, rows, error
         """
+        cache_key = (spreadsheet_id, worksheet_name)
+        cached = self._rows_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[3] < self.ROWS_CACHE_TTL_SECONDS:
+            return {
+                "success": True,
+                "headers": list(cached[1]),
+                "rows": [list(row) for row in cached[2]],
+            }
+        
+        inflight = self._rows_inflight.get(cache_key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._fetch_all_rows(spreadsheet_id, worksheet_name))
+            self._rows_inflight[cache_key] = inflight
+            
+            def _clear(done: asyncio.Future) -> None:
+                if self._rows_inflight.get(cache_key) is done:
+                    del self._rows_inflight[cache_key]
+            
+            inflight.add_done_callback(_clear)
+        
+        # Shield so one cancelled caller doesn't cancel the fetch for the others.
+        result = await asyncio.shield(inflight)
+        if not result["success"]:
+            return dict(result)
+        # Each caller gets its own copies of the rows; callers are free to mutate them.
+        return {
+            "success": True,
+            "headers": list(result["headers"]),
+            "rows": [list(row) for row in result["rows"]],
+        }
+    
+    async def iter_rows(
+        self,
+        spreadsheet_id: str,
+        worksheet_name: str,
+        batch_size: int = 1000
+    ) -> AsyncIterator[list[Any]]:
+        """Stream a worksheet's rows, header row first, fetching batch_size rows per request.
+        
+        Unlike get_all_rows, only one page is held in memory at a time and
+        the cache is bypassed. Errors are raised rather than returned.
+        
+        Args:
+            spreadsheet_id: Google Sheets spreadsheet ID
+            worksheet_name: Name of worksheet
+            batch_size: Rows fetched per values().get call
+        """
+        service = self._get_sheets_service()
+        escaped_title = worksheet_name.replace("'", "''")
+        batch_size = max(1, batch_size)
+        start = 1
+        
+        while True:
+            result = await self._aexecute(
+                service.spreadsheets().values().get(
+                    spreadsheetId=spreadsheet_id,
+                    range=f"'{escaped_title}'!{start}:{start + batch_size - 1}",
+                    majorDimension="ROWS"
+                )
+            )
+            values = result.get("values", [])
+            for row in values:
+                yield row
+            # A short page means the sheet has no more rows
+            if len(values) < batch_size:
+                return
+            start += batch_size
+    
+    async def _fetch_all_rows(
+        self,
+        spreadsheet_id: str,
+        worksheet_name: str
+    ) -> dict:
+        """Fetch all rows from a worksheet, revalidating the cache by Drive version."""
         try:
+            # Serve unchanged spreadsheets from cache; the version probe is far
+            # smaller than the values payload.
+            cache_key = (spreadsheet_id, worksheet_name)
+            cached = self._rows_cache.get(cache_key)
+            now = time.monotonic()
+            # Rows are only cached when no write to the worksheet was pending when
+            # the fetch began or started during it; either could make them stale.
+            writes_before = self._rows_writes.get(cache_key, (0, 0))
+            quiet = writes_before[0] == writes_before[1]
+            
+            version = await asyncio.to_thread(self._get_spreadsheet_version, spreadsheet_id)
+            if version is not None and cached is not None and cached[0] == version:
+                if quiet and self._rows_writes.get(cache_key, (0, 0)) == writes_before:
+                    self._rows_cache[cache_key] = (version, cached[1], cached[2], now)
+                return {
+                    "success": True,
+                    "headers": cached[1],
+                    "rows": cached[2],
+                }
+            
             service = self._get_sheets_service()
             
             # Escape single quotes in sheet title
             escaped_title = worksheet_name.replace("'", "''")
             range_name = f"'{escaped_title}'"
             
-            result = service.spreadsheets().values().get(
-                spreadsheetId=spreadsheet_id,
-                range=range_name
-            ).execute()
+            result = await self._aexecute(
+                service.spreadsheets().values().get(
+                    spreadsheetId=spreadsheet_id,
+                    range=range_name
+                )
+            )
             
             values = result.get("values", [])
             
@@ -571,6 +1369,8 @@ class SheetsOperationsMixin:
             
             headers = values[0] if values else []
             rows = values[1:] if len(values) > 1 else []
+            if version is not None and quiet and self._rows_writes.get(cache_key, (0, 0)) == writes_before:
+                self._rows_cache[cache_key] = (version, list(headers), list(rows), now)
             
             return {
                 "success": True,
@@ -579,7 +1379,4 @@ class SheetsOperationsMixin:
             }
             
         except Exception as e:
-            return {
-                "success": False,
-                "error": str(e)
-            }
+            return error_result(e)
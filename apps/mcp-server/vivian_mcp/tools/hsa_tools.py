@@ -1,19 +1,23 @@
 """HSA expense tools for MCP server."""
 
-import json
+import asyncio
 import re
-import uuid
+from collections import defaultdict
 from difflib import SequenceMatcher
 from datetime import datetime
 from pathlib import Path
+from secrets import token_hex
 from typing import Optional, Any
 
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
-from google.oauth2.credentials import Credentials
-
-from vivian_mcp.config import Settings
-from vivian_mcp.tools.google_common import apply_column_filters
+from vivian_mcp.config import get_settings
+from vivian_mcp.tools.google_common import (
+    apply_column_filters,
+    error_result,
+    execute_request,
+    get_credentials,
+    shared_service,
+    upload_local_file,
+)
 
 try:
     from vivian_shared.helpers import (
@@ -61,6 +65,12 @@ except Exception:
     def parse_date(date_str: str):
         if not date_str:
             return None
+        value = str(date_str).strip()
+        if len(value) == 10 and value[4] == "-" and value[7] == "-" and value[:4].isdigit():
+            try:
+                return datetime.fromisoformat(value)
+            except ValueError:
+                pass
         formats = [
             "%Y-%m-%d",
             "%Y/%m/%d",
@@ -121,11 +131,16 @@ class HSAToolManager:
     }
     
     def __init__(self):
-        self.settings = Settings()
+        self.settings = get_settings()
         self._sheets_service = None
         self._drive_service = None
         self._worksheet_title = None
     
+    @staticmethod
+    async def _run(request: Any) -> Any:
+        """Execute a googleapiclient request off the event loop on a per-thread HTTP client."""
+        return await asyncio.to_thread(execute_request, request)
+
     def _range_for_sheet(self, sheet_title: str, cell_range: str) -> str:
         """Build an A1 range string for a worksheet title and cell range."""
         escaped = escape_sheet_title(sheet_title)
@@ -133,10 +148,12 @@ class HSAToolManager:
 
     def _get_header_row(self, service, spreadsheet_id: str, sheet_title: str) -> list[str]:
         """Fetch header row values for A1:K1 in the target worksheet."""
-        result = service.spreadsheets().values().get(
-            spreadsheetId=spreadsheet_id,
-            range=self._range_for_sheet(sheet_title, "A1:K1"),
-        ).execute()
+        result = execute_request(
+            service.spreadsheets().values().get(
+                spreadsheetId=spreadsheet_id,
+                range=self._range_for_sheet(sheet_title, "A1:K1"),
+            )
+        )
         rows = result.get("values", [])
         if not rows:
             return []
@@ -246,10 +263,12 @@ class HSAToolManager:
             return self._worksheet_title
 
         spreadsheet_id = self.settings.hsa_spreadsheet_id
-        metadata = service.spreadsheets().get(
-            spreadsheetId=spreadsheet_id,
-            fields="sheets(properties(title))",
-        ).execute()
+        metadata = execute_request(
+            service.spreadsheets().get(
+                spreadsheetId=spreadsheet_id,
+                fields="sheets(properties(title))",
+            )
+        )
         titles = [
             sheet.get("properties", {}).get("title")
             for sheet in metadata.get("sheets", [])
@@ -387,19 +406,9 @@ class HSAToolManager:
     def _get_sheets_service(self):
         """Get Google Sheets service."""
         if not self._sheets_service:
-            creds = Credentials(
-                token=None,
-                refresh_token=self.settings.google_refresh_token,
-                token_uri="https://oauth2.googleapis.com/token",
-                client_id=self.settings.google_client_id,
-                client_secret=self.settings.google_client_secret,
-                scopes=[
-                    "https://www.googleapis.com/auth/spreadsheets",
-                    "https://www.googleapis.com/auth/drive"
-                ]
-            )
-            self._sheets_service = build("sheets", "v4", credentials=creds)
-            self._drive_service = build("drive", "v3", credentials=creds)
+            creds = get_credentials(self.settings)
+            self._sheets_service = shared_service("sheets", "v4", creds)
+            self._drive_service = shared_service("drive", "v3", creds)
         return self._sheets_service
 
     def _get_folder_id_for_status(self, status: str) -> str:
@@ -426,38 +435,12 @@ class HSAToolManager:
             if service is None:
                 return {"success": False, "error": "Drive service unavailable"}
 
-            file_path = Path(local_file_path)
-            if not file_path.exists():
-                return {"success": False, "error": f"File not found: {local_file_path}"}
-
-            upload_filename = filename or file_path.name
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            name_without_ext = Path(upload_filename).stem
-            ext = Path(upload_filename).suffix
-            final_filename = f"{name_without_ext}_{timestamp}{ext}"
-
-            folder_id = self._get_folder_id_for_status(status)
-            file_metadata = {
-                "name": final_filename,
-                "parents": [folder_id] if folder_id else [],
-            }
-
-            media = MediaFileUpload(str(file_path), resumable=True)
-            created = service.files().create(
-                body=file_metadata,
-                media_body=media,
-                fields="id, name, webViewLink",
-            ).execute()
-
-            return {
-                "success": True,
-                "file_id": created.get("id"),
-                "filename": created.get("name"),
-                "web_view_link": created.get("webViewLink"),
-                "folder": status,
-            }
+            result = upload_local_file(service, local_file_path, self._get_folder_id_for_status(status), filename)
+            if result["success"]:
+                result["folder"] = status
+            return result
         except Exception as e:
-            return {"success": False, "error": str(e)}
+            return error_result(e)
 
     def _duplicate_info_from_row(self, row: list, match_result: dict) -> dict:
         """Build duplicate info payload from an existing ledger row."""
@@ -503,7 +486,7 @@ class HSAToolManager:
         drive_file_id: str,
     ) -> tuple[str, list]:
         """Build one ledger row in A:K order and return (entry_id, row)."""
-        entry_id = str(uuid.uuid4())[:8]
+        entry_id = token_hex(4)
         created_at = datetime.utcnow().isoformat()
         row = [
             entry_id,
@@ -520,7 +503,7 @@ class HSAToolManager:
         ]
         return entry_id, row
     
-    async def parse_receipt(self, pdf_path: str) -> str:
+    async def parse_receipt(self, pdf_path: str) -> dict[str, Any]:
         """Parse receipt PDF and return structured data.
         
         Note: Actual parsing happens in the API layer using OpenRouter.
@@ -528,17 +511,17 @@ class HSAToolManager:
         """
         # The actual parsing is done by the API layer
         # This returns a placeholder indicating the file is ready
-        return json.dumps({
+        return {
             "status": "ready_for_parsing",
             "pdf_path": pdf_path,
             "message": "Use API layer with OpenRouter for actual parsing"
-        })
+        }
     
     async def check_for_duplicates(
         self,
         expense_json: dict,
         fuzzy_days: int = 3
-    ) -> str:
+    ) -> dict[str, Any]:
         """Check if expense is a duplicate of existing entries.
         
         Args:
@@ -546,26 +529,28 @@ class HSAToolManager:
             fuzzy_days: Number of days to allow for fuzzy date matching (default: 3)
             
         Returns:
-            JSON string with potential duplicates and recommendations
+            Dict with potential duplicates and recommendations
         """
         try:
             service = self._get_sheets_service()
             spreadsheet_id = self.settings.hsa_spreadsheet_id
-            worksheet_title = self._resolve_worksheet_title(service)
+            worksheet_title = await asyncio.to_thread(self._resolve_worksheet_title, service)
             
             # Fetch all existing entries
-            result = service.spreadsheets().values().get(
-                spreadsheetId=spreadsheet_id,
-                range=self._range_for_sheet(worksheet_title, "A:K")
-            ).execute()
+            result = await self._run(
+                service.spreadsheets().values().get(
+                    spreadsheetId=spreadsheet_id,
+                    range=self._range_for_sheet(worksheet_title, "A:K")
+                )
+            )
             
             rows = result.get("values", [])
             if len(rows) <= 1:
-                return json.dumps({
+                return {
                     "is_duplicate": False,
                     "potential_duplicates": [],
                     "recommendation": "import"
-                })
+                }
             
             potential_duplicates = []
             
@@ -599,20 +584,19 @@ class HSAToolManager:
             else:
                 recommendation = "review"
             
-            return json.dumps({
+            return {
                 "is_duplicate": len(potential_duplicates) > 0,
                 "potential_duplicates": potential_duplicates,
                 "recommendation": recommendation,
                 "total_duplicates_found": len(potential_duplicates)
-            })
+            }
             
         except Exception as e:
-            return json.dumps({
-                "success": False,
-                "error": str(e),
+            return {
+                **error_result(e),
                 "is_duplicate": False,
                 "potential_duplicates": []
-            })
+            }
     
     async def append_to_ledger(
         self, 
@@ -621,7 +605,7 @@ class HSAToolManager:
         drive_file_id: str,
         check_duplicates: bool = True,
         force_append: bool = False
-    ) -> str:
+    ) -> dict[str, Any]:
         """Append expense to Google Sheets ledger.
         
         Args:
@@ -634,24 +618,23 @@ class HSAToolManager:
         try:
             service = self._get_sheets_service()
             spreadsheet_id = self.settings.hsa_spreadsheet_id
-            worksheet_title = self._resolve_worksheet_title(service)
+            worksheet_title = await asyncio.to_thread(self._resolve_worksheet_title, service)
             
             # Check for duplicates if enabled
             duplicate_check_result = None
             if check_duplicates:
-                check_result_json = await self.check_for_duplicates(expense_json)
-                duplicate_check_result = json.loads(check_result_json)
+                duplicate_check_result = await self.check_for_duplicates(expense_json)
                 
                 if duplicate_check_result.get("is_duplicate") and not force_append:
-                    return json.dumps({
+                    return {
                         "success": False,
                         "error": "Duplicate entry detected",
                         "duplicate_check": duplicate_check_result,
                         "entry_appended": False
-                    })
+                    }
             
             # Generate unique ID
-            entry_id = str(uuid.uuid4())[:8]
+            entry_id = token_hex(4)
             
             # Get current timestamp
             created_at = datetime.utcnow().isoformat()
@@ -678,12 +661,15 @@ class HSAToolManager:
                 "values": [row]
             }
             
-            result = service.spreadsheets().values().append(
-                spreadsheetId=spreadsheet_id,
-                range=range_name,
-                valueInputOption="USER_ENTERED",
-                body=body
-            ).execute()
+            result = await self._run(
+                service.spreadsheets().values().append(
+                    spreadsheetId=spreadsheet_id,
+                    range=range_name,
+                    valueInputOption="USER_ENTERED",
+                    body=body,
+                    fields="updates.updatedRange"
+                )
+            )
             
             response = {
                 "success": True,
@@ -696,14 +682,13 @@ class HSAToolManager:
             if duplicate_check_result:
                 response["duplicate_check"] = duplicate_check_result
             
-            return json.dumps(response)
+            return response
             
         except Exception as e:
-            return json.dumps({
-                "success": False,
-                "error": str(e),
+            return {
+                **error_result(e),
                 "entry_appended": False
-            })
+            }
 
     async def bulk_import_receipts(
         self,
@@ -711,17 +696,19 @@ class HSAToolManager:
         check_duplicates: bool = True,
         force_append: bool = False,
         fuzzy_days: int = 3,
-    ) -> str:
+    ) -> dict[str, Any]:
         """Bulk import parsed receipts with per-file Drive upload and batched ledger append."""
         try:
             service = self._get_sheets_service()
             spreadsheet_id = self.settings.hsa_spreadsheet_id
-            worksheet_title = self._resolve_worksheet_title(service)
+            worksheet_title = await asyncio.to_thread(self._resolve_worksheet_title, service)
 
-            fetch_result = service.spreadsheets().values().get(
-                spreadsheetId=spreadsheet_id,
-                range=self._range_for_sheet(worksheet_title, "A:K"),
-            ).execute()
+            fetch_result = await self._run(
+                service.spreadsheets().values().get(
+                    spreadsheetId=spreadsheet_id,
+                    range=self._range_for_sheet(worksheet_title, "A:K"),
+                )
+            )
             rows = fetch_result.get("values", [])
             existing_rows = rows[1:] if len(rows) > 1 else []
 
@@ -761,7 +748,9 @@ class HSAToolManager:
                         })
                         continue
 
-                upload_result = self._upload_receipt_file(local_file_path, reimbursement_status, filename)
+                upload_result = await asyncio.to_thread(
+                    self._upload_receipt_file, local_file_path, reimbursement_status, filename
+                )
                 if not upload_result.get("success"):
                     results.append({
                         "filename": filename,
@@ -791,12 +780,15 @@ class HSAToolManager:
 
             if pending_rows:
                 try:
-                    service.spreadsheets().values().append(
-                        spreadsheetId=spreadsheet_id,
-                        range=self._range_for_sheet(worksheet_title, "A:K"),
-                        valueInputOption="USER_ENTERED",
-                        body={"values": pending_rows},
-                    ).execute()
+                    await self._run(
+                        service.spreadsheets().values().append(
+                            spreadsheetId=spreadsheet_id,
+                            range=self._range_for_sheet(worksheet_title, "A:K"),
+                            valueInputOption="USER_ENTERED",
+                            body={"values": pending_rows},
+                            fields="spreadsheetId",
+                        )
+                    )
 
                     for meta in pending_meta:
                         total_amount += meta["amount"]
@@ -818,7 +810,7 @@ class HSAToolManager:
                                 "local_file_path": meta["local_file_path"],
                                 "temp_file_path": meta["temp_file_path"],
                                 "status": "failed",
-                                "error": f"Ledger batch append failed: {str(e)}",
+                                "error": f"Ledger batch append failed: {error_result(e)['error']}",
                                 "drive_file_id": meta["drive_file_id"],
                             }
                         )
@@ -826,42 +818,39 @@ class HSAToolManager:
             imported_count = sum(1 for r in results if r.get("status") == "imported")
             failed_count = sum(1 for r in results if r.get("status") in {"failed", "duplicate_exact", "duplicate_fuzzy"})
 
-            return json.dumps(
-                {
-                    "success": imported_count > 0,
-                    "imported_count": imported_count,
-                    "failed_count": failed_count,
-                    "total_amount": round(total_amount, 2),
-                    "results": results,
-                }
-            )
+            return {
+                "success": imported_count > 0,
+                "imported_count": imported_count,
+                "failed_count": failed_count,
+                "total_amount": round(total_amount, 2),
+                "results": results,
+            }
         except Exception as e:
-            return json.dumps(
-                {
-                    "success": False,
-                    "error": str(e),
-                    "imported_count": 0,
-                    "failed_count": len(receipts),
-                    "results": [],
-                }
-            )
+            return {
+                **error_result(e),
+                "imported_count": 0,
+                "failed_count": len(receipts),
+                "results": [],
+            }
     
     async def update_status(
         self, 
         expense_id: str, 
         new_status: str,
         reimbursement_date: Optional[str] = None
-    ) -> str:
+    ) -> dict[str, Any]:
         """Update reimbursement status of an expense."""
         try:
             service = self._get_sheets_service()
             spreadsheet_id = self.settings.hsa_spreadsheet_id
             
             # Find the row with matching ID
-            result = service.spreadsheets().values().get(
-                spreadsheetId=spreadsheet_id,
-                range="HSA_Ledger!A:K"
-            ).execute()
+            result = await self._run(
+                service.spreadsheets().values().get(
+                    spreadsheetId=spreadsheet_id,
+                    range="HSA_Ledger!A:K"
+                )
+            )
             
             rows = result.get("values", [])
             
@@ -873,10 +862,10 @@ class HSAToolManager:
                     break
             
             if not target_row:
-                return json.dumps({
+                return {
                     "success": False,
                     "error": f"Expense ID {expense_id} not found"
-                })
+                }
             
             # Update status column (G = column 7)
             updates = [
@@ -898,40 +887,42 @@ class HSAToolManager:
                 "data": updates
             }
             
-            service.spreadsheets().values().batchUpdate(
-                spreadsheetId=spreadsheet_id,
-                body=body
-            ).execute()
+            await self._run(
+                service.spreadsheets().values().batchUpdate(
+                    spreadsheetId=spreadsheet_id,
+                    body=body,
+                    fields="spreadsheetId"
+                )
+            )
             
-            return json.dumps({
+            return {
                 "success": True,
                 "expense_id": expense_id,
                 "new_status": new_status
-            })
+            }
             
         except Exception as e:
-            return json.dumps({
-                "success": False,
-                "error": str(e)
-            })
+            return error_result(e)
     
-    async def get_unreimbursed_balance(self) -> str:
+    async def get_unreimbursed_balance(self) -> dict[str, Any]:
         """Calculate total unreimbursed expenses."""
         try:
             service = self._get_sheets_service()
             spreadsheet_id = self.settings.hsa_spreadsheet_id
             
-            result = service.spreadsheets().values().get(
-                spreadsheetId=spreadsheet_id,
-                range="HSA_Ledger!A:K"
-            ).execute()
+            result = await self._run(
+                service.spreadsheets().values().get(
+                    spreadsheetId=spreadsheet_id,
+                    range="HSA_Ledger!A:K"
+                )
+            )
             
             rows = result.get("values", [])
             if len(rows) <= 1:
-                return json.dumps({
+                return {
                     "total_unreimbursed": 0,
                     "count": 0
-                })
+                }
             
             total = 0
             count = 0
@@ -946,16 +937,13 @@ class HSAToolManager:
                     except (ValueError, IndexError):
                         continue
             
-            return json.dumps({
+            return {
                 "total_unreimbursed": round(total, 2),
                 "count": count
-            })
+            }
             
         except Exception as e:
-            return json.dumps({
-                "success": False,
-                "error": str(e)
-            })
+            return error_result(e)
 
     async def read_ledger_entries(
         self,
@@ -963,7 +951,7 @@ class HSAToolManager:
         status_filter: Optional[str] = None,
         limit: int = 1000,
         column_filters: list[dict[str, Any]] | None = None,
-    ) -> str:
+    ) -> dict[str, Any]:
         """Read entries from the HSA ledger with optional filtering.
         
         Args:
@@ -972,7 +960,7 @@ class HSAToolManager:
             limit: Maximum number of entries to return (default 1000)
             
         Returns:
-            JSON string with entries, totals, and summary statistics
+            Dict with entries, totals, and summary statistics
         """
         try:
             service = self._get_sheets_service()
@@ -980,14 +968,16 @@ class HSAToolManager:
             sheet_title = self.settings.hsa_worksheet_name or "HSA_Ledger"
             
             # Fetch all data
-            result = service.spreadsheets().values().get(
-                spreadsheetId=spreadsheet_id,
-                range=f"{sheet_title}!A:K"
-            ).execute()
+            result = await self._run(
+                service.spreadsheets().values().get(
+                    spreadsheetId=spreadsheet_id,
+                    range=f"{sheet_title}!A:K"
+                )
+            )
             
             rows = result.get("values", [])
             if len(rows) <= 1:
-                return json.dumps({
+                return {
                     "success": True,
                     "entries": [],
                     "summary": {
@@ -997,7 +987,7 @@ class HSAToolManager:
                         "total_unreimbursed": 0,
                         "total_not_eligible": 0,
                     }
-                })
+                }
             
             headers = rows[0] if rows else []
             data_rows = rows[1:]
@@ -1008,91 +998,80 @@ class HSAToolManager:
                 column_filters=column_filters,
             )
             if not filter_result.get("success"):
-                return json.dumps(
-                    {
-                        "success": False,
-                        "error": filter_result.get("error", "Invalid column filters"),
-                        "available_columns": filter_result.get("available_columns", []),
-                    }
-                )
+                return {
+                    "success": False,
+                    "error": filter_result.get("error", "Invalid column filters"),
+                    "available_columns": filter_result.get("available_columns", []),
+                }
             data_rows = filter_result.get("rows", data_rows)
             
-            # Map column indices (based on EXPECTED_HEADERS)
-            col_map = {
-                "id": 0,
-                "provider": 1,
-                "service_date": 2,
-                "paid_date": 3,
-                "amount": 4,
-                "hsa_eligible": 5,
-                "status": 6,
-                "reimbursement_date": 7,
-                "drive_file_id": 8,
-                "confidence": 9,
-                "created_at": 10,
-            }
+            # Cell defaults for columns A:K (based on EXPECTED_HEADERS); short
+            # rows are padded from here once instead of bounds-checking each cell.
+            row_defaults = ["", "", "", "", "", "Yes", "unreimbursed", "", "", "0.9", ""]
+            row_width = len(row_defaults)
             
             entries = []
-            total_reimbursed = 0.0
-            total_unreimbursed = 0.0
-            total_not_eligible = 0.0
-            count_reimbursed = 0
-            count_unreimbursed = 0
-            count_not_eligible = 0
+            totals_by_status: defaultdict[str, float] = defaultdict(float)
+            counts_by_status: defaultdict[str, int] = defaultdict(int)
             
             for row in data_rows:
-                if len(row) < 7:
+                width = len(row)
+                if width < 7:
                     continue
-                
-                # Extract data
-                entry = {
-                    "id": row[col_map["id"]] if len(row) > col_map["id"] else "",
-                    "provider": row[col_map["provider"]] if len(row) > col_map["provider"] else "",
-                    "service_date": row[col_map["service_date"]] if len(row) > col_map["service_date"] else "",
-                    "paid_date": row[col_map["paid_date"]] if len(row) > col_map["paid_date"] else "",
-                    "amount": 0.0,
-                    "hsa_eligible": row[col_map["hsa_eligible"]] if len(row) > col_map["hsa_eligible"] else "Yes",
-                    "status": row[col_map["status"]] if len(row) > col_map["status"] else "unreimbursed",
-                    "reimbursement_date": row[col_map["reimbursement_date"]] if len(row) > col_map["reimbursement_date"] else "",
-                    "drive_file_id": row[col_map["drive_file_id"]] if len(row) > col_map["drive_file_id"] else "",
-                    "confidence": row[col_map["confidence"]] if len(row) > col_map["confidence"] else "0.9",
-                    "created_at": row[col_map["created_at"]] if len(row) > col_map["created_at"] else "",
-                }
-                
-                # Parse amount
-                try:
-                    entry["amount"] = float(row[col_map["amount"]]) if len(row) > col_map["amount"] else 0.0
-                except (ValueError, TypeError):
-                    entry["amount"] = 0.0
+                if width < row_width:
+                    row = row + row_defaults[width:]
                 
                 # Apply filters
-                if status_filter and entry["status"] != status_filter:
+                if status_filter and row[6] != status_filter:
                     continue
                 
                 # Year filter (check service_date or paid_date)
                 if year:
-                    date_str = entry["service_date"] or entry["paid_date"] or entry["created_at"]
+                    date_str = row[2] or row[3] or row[10]
                     if not date_str or str(year) not in date_str:
                         continue
                 
+                # Parse amount
+                try:
+                    amount = float(row[4])
+                except (ValueError, TypeError):
+                    amount = 0.0
+                
+                # Extract data
+                entry = {
+                    "id": row[0],
+                    "provider": row[1],
+                    "service_date": row[2],
+                    "paid_date": row[3],
+                    "amount": amount,
+                    "hsa_eligible": row[5],
+                    "status": row[6],
+                    "reimbursement_date": row[7],
+                    "drive_file_id": row[8],
+                    "confidence": row[9],
+                    "created_at": row[10],
+                }
+                
                 entries.append(entry)
                 
                 # Track totals
-                if entry["status"] == "reimbursed":
-                    total_reimbursed += entry["amount"]
-                    count_reimbursed += 1
-                elif entry["status"] == "unreimbursed":
-                    total_unreimbursed += entry["amount"]
-                    count_unreimbursed += 1
-                elif entry["status"] == "not_hsa_eligible":
-                    total_not_eligible += entry["amount"]
-                    count_not_eligible += 1
+                status = entry["status"]
+                totals_by_status[status] += entry["amount"]
+                counts_by_status[status] += 1
                 
                 # Respect limit
                 if len(entries) >= limit:
                     break
             
-            return json.dumps({
+            # Unrecognized statuses are listed but excluded from the totals
+            total_reimbursed = totals_by_status["reimbursed"]
+            total_unreimbursed = totals_by_status["unreimbursed"]
+            total_not_eligible = totals_by_status["not_hsa_eligible"]
+            count_reimbursed = counts_by_status["reimbursed"]
+            count_unreimbursed = counts_by_status["unreimbursed"]
+            count_not_eligible = counts_by_status["not_hsa_eligible"]
+            
+            return {
                 "success": True,
                 "entries": entries,
                 "summary": {
@@ -1106,33 +1085,27 @@ class HSAToolManager:
                     "count_not_eligible": count_not_eligible,
                     "available_to_reimburse": round(total_unreimbursed, 2),
                 }
-            })
+            }
             
         except Exception as e:
-            return json.dumps({
-                "success": False,
-                "error": str(e)
-            })
+            return error_result(e)
     
     async def bulk_import(
         self, 
         directory_path: str,
         reimbursement_status_override: Optional[str] = None
-    ) -> str:
+    ) -> dict[str, Any]:
         """Bulk import receipts from directory."""
         try:
             directory = Path(directory_path)
             pdf_files = list(directory.glob("*.pdf"))
             
-            return json.dumps({
+            return {
                 "total_files": len(pdf_files),
                 "directory": str(directory),
                 "message": "Use API layer with OpenRouter for parsing and Drive upload",
                 "files": [f.name for f in pdf_files]
-            })
+            }
             
         except Exception as e:
-            return json.dumps({
-                "success": False,
-                "error": str(e)
-            })
+            return error_result(e)
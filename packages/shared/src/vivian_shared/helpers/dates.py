@@ -40,6 +40,16 @@ def parse_date(date_str: str, formats: Optional[list[str]] = None) -> Optional[d
     if not date_str:
         return None
     
+    if formats is None:
+        # Fast path for ISO dates, the layout ledgers store: parsed in C
+        # without walking the strptime format list.
+        value = date_str.strip()
+        if len(value) == 10 and value[4] == "-" and value[7] == "-" and value[:4].isdigit():
+            try:
+                return datetime.fromisoformat(value)
+            except ValueError:
+                pass
+    
     formats_to_try = formats or COMMON_DATE_FORMATS
     
     for fmt in formats_to_try: